@@ -5,10 +5,9 @@ Filtrar y validar categorías extraídas
 """
 
 import sys
+import argparse
 from pathlib import Path
 import json
-import requests
-import time
 import time
 from urllib.parse import urljoin
 
@@ -17,12 +16,68 @@ project_root = Path(__file__).parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from scraper import JumboScraper
-from bs4 import BeautifulSoup
+from config import get_config
+from browser import (wait_for_element, wait_for_stable_count, create_chrome_driver, get_browser_settings,
+                     collect_menu_links, MENU_TRIGGER_SELECTOR, MENU_LINK_SELECTOR,
+                     MENU_LINK_SELECTORS, MENU_CONTAINER_SELECTORS, MENU_ITEM_SCOPE_PREFIX)
+from scraper import get_shared_scraper
+from rules import get_rules
+from vtex_api import discover_categories
+from html_parser import parse_html
+from checkpoint import CheckpointJournal
+from fingerprints import get_fingerprint_store
+from redirects import canonicalize_categories
+from streaming import imap_bounded, tee_to_json
 import re
 
-def filter_and_validate_categories(input_file='categories_extracted.json', output_file='categories_filtered.json'):
-    """Filtrar y validar categorías - Etapa 3.3"""
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.action_chains import ActionChains
+except ImportError:  # Selenium solo es necesario para la Etapa 3.2 con --discovery selenium
+    webdriver = None
+
+def validate_category_link(scraper, url):
+    """Validar la URL de una categoría con HEAD - devuelve (válida, status o mensaje de error)
+
+    La request usa la sesión del scraper (conexiones reutilizadas, headers y
+    timeout configurados) y respeta el rate limit compartido del host.
+    """
+    response = scraper.head(url)
+    if response is None:
+        return False, 'sin respuesta'
+    return response.status_code == 200, response.status_code
+
+def validate_category_links(scraper, categories, workers=None):
+    """Validar varias categorías en paralelo - produce (categoría, válida, status) en orden
+
+    Por defecto usa tantos workers como conexiones simultáneas por host.
+    """
+    workers = workers or get_config().get('max_connections_per_host', 4)
+
+    def validate(category):
+        valid, status = validate_category_link(scraper, category['url'])
+        return category, valid, status
+
+    return imap_bounded(validate, categories, workers=workers)
+
+def clean_category_name(category):
+    """Normalizar espacios y capitalización del nombre - devuelve el nombre original"""
+    original_name = category['name']
+    clean_name = ' '.join(original_name.split())  # Normalizar espacios
+    clean_name = clean_name.title()  # Capitalizar correctamente
+
+    category['name'] = clean_name
+    category['name_cleaned'] = clean_name != original_name
+    return original_name
+
+def filter_and_validate_categories(input_file='categories_extracted.json', output_file='categories_filtered.json',
+                                   validate_urls=True):
+    """Filtrar y validar categorías - Etapa 3.3
+
+    Con validate_urls=False no se envían HEAD: la validación queda a cargo de
+    la descarga de la etapa 4 (--validation fetch).
+    """
     print('🚀 INICIANDO FILTRADO Y VALIDACIÓN DE CATEGORÍAS - ETAPA 3.3')
     print('=' * 60)
 
@@ -38,12 +93,8 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
         print(f'❌ Error al leer JSON: {e}')
         return []
 
-    # Categorías a excluir (según especificación)
-    categories_to_exclude = [
-        'viví saludable', 'vivi saludable',  # Se considera no relevante
-        'ofertas', 'novedades', 'promociones',  # Categorías promocionales
-        'servicios', 'atención al cliente', 'contacto'  # No son categorías de productos
-    ]
+    # Categorías a excluir (según especificación, ver category_rules.category_exclude)
+    categories_to_exclude = get_rules().category_exclude
 
     filtered_categories = []
     validated_categories = []
@@ -52,17 +103,11 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
     print('-' * 40)
 
     for category in categories:
-        name_lower = category['name'].lower().strip()
-
         # Verificar si debe excluirse
-        should_exclude = False
-        for exclude_term in categories_to_exclude:
-            if exclude_term in name_lower:
-                should_exclude = True
-                print(f'🚫 Excluyendo: "{category["name"]}" (contiene "{exclude_term}")')
-                break
-
-        if not should_exclude:
+        exclude_term = categories_to_exclude.search(category['name'].strip())
+        if exclude_term:
+            print(f'🚫 Excluyendo: "{category["name"]}" (contiene "{exclude_term}")')
+        else:
             filtered_categories.append(category)
             print(f'✅ Manteniendo: "{category["name"]}"')
 
@@ -72,32 +117,27 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
     print('\n🔗 VALIDANDO URLs DE CATEGORÍAS...')
     print('-' * 40)
 
-    scraper = JumboScraper()
+    scraper = get_shared_scraper()
     base_url = 'https://www.jumbo.com.ar/'
 
-    for i, category in enumerate(filtered_categories, 1):
-        url = category['url']
-        name = category['name']
-
-        print(f'{i:2d}. Validando: {name}')
-        print(f'    URL: {url}')
-
-        try:
-            # Hacer petición HEAD para validar URL (más rápido que GET completo)
-            response = requests.head(url, timeout=10, allow_redirects=True,
-                                   headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-
-            if response.status_code == 200:
-                print(f'    ✅ URL válida (Status: {response.status_code})')
-                validated_categories.append(category)
-            else:
-                print(f'    ⚠️  URL no válida (Status: {response.status_code})')
-
-        except requests.RequestException as e:
-            print(f'    ❌ Error de conexión: {str(e)[:50]}...')
-
-        # Pequeña pausa para no sobrecargar el servidor
-        time.sleep(0.5)
+    if validate_urls:
+        validations = validate_category_links(scraper, filtered_categories)
+    else:
+        print('⏭️  Validación diferida: la descarga de la etapa 4 registra URL final, status y redirecciones')
+        validations = []
+        validated_categories = list(filtered_categories)
+
+    for i, (category, valid, status) in enumerate(validations, 1):
+        print(f'{i:2d}. Validando: {category["name"]}')
+        print(f'    URL: {category["url"]}')
+
+        if valid:
+            print(f'    ✅ URL válida (Status: {status})')
+            validated_categories.append(category)
+        elif isinstance(status, int):
+            print(f'    ⚠️  URL no válida (Status: {status})')
+        else:
+            print(f'    ❌ Error de conexión: {status[:50]}...')
 
     print(f'\n📊 Después de validación: {len(validated_categories)} categorías válidas')
 
@@ -106,19 +146,16 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
     print('-' * 40)
 
     for category in validated_categories:
-        original_name = category['name']
-        # Limpiar nombre (remover espacios extra, caracteres especiales)
-        clean_name = ' '.join(original_name.split())  # Normalizar espacios
-        clean_name = clean_name.title()  # Capitalizar correctamente
-
-        category['name'] = clean_name
-        category['name_cleaned'] = clean_name != original_name
+        original_name = clean_category_name(category)
+        clean_name = category['name']
 
         if clean_name != original_name:
             print(f'🧽 "{original_name}" → "{clean_name}"')
         else:
             print(f'✅ "{clean_name}" (sin cambios)')
 
+    apply_canonical_urls(validated_categories)
+
     # Guardar categorías filtradas y validadas
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(validated_categories, f, indent=2, ensure_ascii=False)
@@ -132,6 +169,7 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
     print(f'🔍 Después del filtrado: {len(filtered_categories)}')
     print(f'🔗 Después de validación: {len(validated_categories)}')
     print(f'💾 Archivo generado: {output_file}')
+    print(f'🔌 Conexiones: {scraper.connection_summary()}')
 
     if validated_categories:
         print('\n📋 LISTADO DE CATEGORÍAS VALIDADAS:')
@@ -139,21 +177,67 @@ def filter_and_validate_categories(input_file='categories_extracted.json', outpu
         for i, category in enumerate(validated_categories, 1):
             print(f'{i:2d}. {category["name"]}')
 
+def apply_canonical_urls(categories):
+    """Reescribir las URLs con redirección conocida y guardar el mapa de redirecciones
+
+    Usa el mapa del scraper compartido: con --record / --replay es None y el
+    mapa del disco no interviene.
+    """
+    redirect_map = get_shared_scraper().redirect_map
+    if redirect_map is None:
+        return
+
+    rewritten = canonicalize_categories(categories, redirect_map)
+    redirect_map.save()
+    if rewritten:
+        print(f'↪️  {rewritten} URLs reescritas a su URL canónica ({len(redirect_map)} redirecciones conocidas)')
+
 def extract_filters_from_category(scraper, category_url, category_name):
     """Extraer filtros de una categoría específica"""
+    return fetch_category_filters(scraper, category_url, category_name)[0]
+
+def fetch_category_filters(scraper, category_url, category_name):
+    """Extraer filtros de una categoría - devuelve (filtros, FetchResult)
+
+    El FetchResult (URL final, status y redirecciones) valida la URL como
+    efecto de la misma descarga, sin una request HEAD aparte.
+    """
     print(f'🔍 Extrayendo filtros de: {category_name}')
 
+    # Obtener HTML de la categoría
+    result = scraper.fetch(category_url)
+    return parse_filters_incremental(result.content, category_url, category_name), result
+
+# Entradas propias en cache/fingerprints.json: este parser no es el de src/extractor.py
+FINGERPRINT_PRODUCER = 'analyze_menu/html'
+
+def parse_filters_incremental(html_content, category_url, category_name):
+    """Reutilizar los filtros anteriores si la página no cambió (modo incremental)"""
+    store = get_fingerprint_store()
+    if store is None or not html_content:
+        return parse_filters_from_html(html_content, category_name)
+
+    fingerprint = store.fingerprint(html_content)
+    filters = store.lookup(category_url, fingerprint, FINGERPRINT_PRODUCER)
+    if filters is not None:
+        print('   ♻️  Página sin cambios, filtros reutilizados')
+        return filters
+
+    filters = parse_filters_from_html(html_content, category_name)
+    store.update(category_url, fingerprint, filters, FINGERPRINT_PRODUCER)
+    return filters
+
+def parse_filters_from_html(html_content, category_name):
+    """Extraer filtros del HTML ya descargado de una categoría"""
     # Filtros base (siempre presentes según especificación)
     base_filters = ['Categoría', 'Sub-Categoría', 'Tipo de Producto']
 
     try:
-        # Obtener HTML de la categoría
-        html_content = scraper.get_page(category_url)
         if not html_content:
             print(f'❌ Error obteniendo HTML para {category_name}')
             return base_filters
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = parse_html(html_content)
 
         # Buscar elementos de filtro con diferentes estrategias
         filters = []
@@ -230,8 +314,25 @@ def extract_filters_from_category(scraper, category_url, category_name):
         print(f'❌ Error extrayendo filtros de {category_name}: {e}')
         return base_filters  # Retornar al menos los filtros base
 
-def extract_filters_from_all_categories(input_file='categories_filtered.json', output_file='categories_with_filters.json'):
-    """Extraer filtros de todas las categorías - Etapa 4"""
+def extract_filters_from_all_categories(input_file='categories_filtered.json', output_file='categories_with_filters.json',
+                                        use_async=False, rendered=False, resume=False,
+                                        fused_validation=False):
+    """Extraer filtros de todas las categorías - Etapa 4
+
+    Con use_async=True las páginas se descargan todas juntas con
+    AsyncJumboScraper y luego se procesan en orden. Con rendered=True los
+    filtros se leen de la página renderizada en el pool de navegadores
+    headless, una categoría por navegador en paralelo.
+
+    Cada categoría terminada se agrega al checkpoint <output_file>.checkpoint.jsonl;
+    con resume=True las categorías ya registradas no se vuelven a procesar.
+
+    En la descarga de cada categoría se registra 'validation' (URL final,
+    status y redirecciones); con fused_validation=True las categorías cuya
+    descarga falla se descartan, reemplazando al HEAD de la etapa 3.3. El
+    navegador y el cliente async no informan el status: en esos modos las
+    URLs pendientes se validan antes con HEAD.
+    """
     print('🚀 INICIANDO EXTRACCIÓN DE FILTROS - ETAPA 4')
     print('=' * 50)
 
@@ -248,7 +349,58 @@ def extract_filters_from_all_categories(input_file='categories_filtered.json', o
         return []
 
     # Inicializar scraper
-    scraper = JumboScraper()
+    scraper = get_shared_scraper()
+
+    # Checkpoint: una línea por categoría terminada
+    journal = CheckpointJournal(Path(output_file).with_suffix('.checkpoint.jsonl'), resume=resume)
+    pending_urls = [category['url'] for category in categories if journal.get(category['url']) is None]
+    if resume:
+        print(f'♻️  Reanudando: {len(categories) - len(pending_urls)} categorías ya procesadas, '
+              f'{len(pending_urls)} pendientes')
+
+    # Validación diferida de la etapa 3.3 en los modos sin datos de la request
+    invalid_urls = {}
+    if fused_validation and (use_async or rendered):
+        print('\n🔗 VALIDANDO URLs PENDIENTES (HEAD)...')
+        pending = set(pending_urls)
+        to_validate = [category for category in categories if category['url'] in pending]
+        for category, valid, status in validate_category_links(scraper, to_validate):
+            if not valid:
+                invalid_urls[category['url']] = status
+        pending_urls = [url for url in pending_urls if url not in invalid_urls]
+
+    # Resultado de cada categoría procesada en esta ejecución: (filtros, descargada, validación)
+    outcomes = {}
+    names = {category['url']: category['name'] for category in categories}
+
+    def complete(url, filters, fetched, validation=None):
+        # Cada categoría queda en el checkpoint apenas termina (no al final del lote),
+        # así una caída del navegador o una interrupción no pierde lo ya procesado.
+        # Solo las descargas exitosas quedan terminadas; las fallidas se reintentan con --resume
+        if fetched:
+            journal.record(url, name=names[url], filters=filters, validation=validation)
+        outcomes[url] = (filters, fetched, validation)
+
+    if use_async:
+        from async_scraper import fetch_pages
+        print('\n⚡ DESCARGANDO CATEGORÍAS EN PARALELO (asyncio)...')
+        fetch_pages(pending_urls, on_page=lambda url, html_content: complete(
+            url, parse_filters_incremental(html_content, url, names[url]), html_content is not None))
+
+    if rendered:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from browser_pool import get_browser_pool, extract_filters_rendered, close_browser_pool
+        pool = get_browser_pool()
+        print(f'\n🧭 RENDERIZANDO CATEGORÍAS EN {pool.size} NAVEGADORES HEADLESS...')
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = {executor.submit(extract_filters_rendered, url): url for url in pending_urls}
+                for future in as_completed(futures):
+                    filters = future.result()
+                    # extract_filters_rendered devuelve [] si la página no cargó
+                    complete(futures[future], filters, bool(filters))
+        finally:
+            close_browser_pool()
 
     # Procesar cada categoría
     processed_categories = []
@@ -260,21 +412,49 @@ def extract_filters_from_all_categories(input_file='categories_filtered.json', o
     for i, category in enumerate(categories, 1):
         print(f'\n{i:2d}/{len(categories)} Procesando: {category["name"]}')
 
+        if category['url'] in invalid_urls:
+            print(f'   ⚠️  Descartada: URL no válida (Status: {invalid_urls[category["url"]]})')
+            continue
+
         # Extraer filtros de la categoría
-        filters = extract_filters_from_category(scraper, category['url'], category['name'])
+        done = journal.get(category['url']) if category['url'] not in outcomes else None
+        if done is not None:
+            filters = done['filters']
+            validation = done.get('validation')
+            fetched = True
+            print('   ♻️  Restaurada del checkpoint')
+        else:
+            # --async / --rendered ya la procesaron (y registraron) durante el lote
+            if category['url'] not in outcomes:
+                filters, result = fetch_category_filters(scraper, category['url'], category['name'])
+                complete(category['url'], filters, result.ok, result.validation())
+            filters, fetched, validation = outcomes[category['url']]
+            if not fetched:
+                print('   ⚠️  Descarga fallida: no se registra en el checkpoint')
+
+        if fused_validation and not fetched:
+            status = validation['status'] if validation else None
+            print(f'   ⚠️  Descartada: URL no válida (Status: {status or "sin respuesta"})')
+            continue
 
         # Agregar filtros a la categoría
         category_with_filters = category.copy()
         category_with_filters['filters'] = filters
         category_with_filters['filters_count'] = len(filters)
+        if validation is not None:
+            category_with_filters['validation'] = validation
 
         processed_categories.append(category_with_filters)
         total_filters += len(filters)
 
         print(f'   📊 Filtros extraídos: {len(filters)}')
 
-        # Pequeña pausa para no sobrecargar el servidor
-        time.sleep(1)
+    journal.close()
+
+    fingerprint_store = get_fingerprint_store()
+    if fingerprint_store is not None:
+        fingerprint_store.save()
+    apply_canonical_urls(processed_categories)
 
     # Guardar resultados
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -287,8 +467,12 @@ def extract_filters_from_all_categories(input_file='categories_filtered.json', o
     print('=' * 40)
     print(f'📂 Categorías procesadas: {len(processed_categories)}')
     print(f'🔍 Total de filtros extraídos: {total_filters}')
-    print(f'📊 Promedio de filtros por categoría: {total_filters/len(processed_categories):.1f}')
+    if processed_categories:
+        print(f'📊 Promedio de filtros por categoría: {total_filters/len(processed_categories):.1f}')
     print(f'💾 Archivo generado: {output_file}')
+    print(f'🔌 Conexiones: {scraper.connection_summary()}')
+    if fingerprint_store is not None:
+        print(f'♻️  Modo incremental: {fingerprint_store.summary()}')
 
     # Mostrar top categorías por cantidad de filtros
     print('\n🏆 TOP 5 CATEGORÍAS CON MÁS FILTROS:')
@@ -300,141 +484,150 @@ def extract_filters_from_all_categories(input_file='categories_filtered.json', o
 
     return processed_categories
 
-def extract_categories_from_menu(driver):
-    """Extraer todas las categorías del menú desplegado"""
-    categories = []
+def collect_menu_links_per_element(driver):
+    """Obtener los enlaces del menú elemento por elemento (respaldo si falla el script en bloque)"""
+    menu_container = None
+    container_selector = None
+    for selector in MENU_CONTAINER_SELECTORS:
+        try:
+            containers = driver.find_elements(By.CSS_SELECTOR, selector)
+            for container in containers:
+                # Verificar si el contenedor es visible y tiene contenido
+                if container.is_displayed() and container.size['height'] > 50:
+                    menu_container = container
+                    container_selector = selector
+                    break
+            if menu_container:
+                break
+        except Exception:
+            continue
 
-    try:
-        # Esperar a que el menú se despliegue completamente
-        time.sleep(3)
-
-        # Buscar específicamente dentro del menú desplegado VTEX
-        # Primero intentar encontrar el contenedor del menú desplegado
-        menu_container_selectors = [
-            '.vtex-menu-2-x-menuContainer',  # Contenedor principal del menú
-            '.vtex-menu-2-x-submenu',       # Submenú desplegado
-            '[class*="menuContainer"]',     # Contenedor genérico
-            '.vtex-menu-2-x-menuItem',      # Items del menú
-        ]
+    links = []
+    for selector in MENU_LINK_SELECTORS:
+        try:
+            if menu_container:
+                elements = menu_container.find_elements(By.CSS_SELECTOR, selector.replace(MENU_ITEM_SCOPE_PREFIX, ''))
+            else:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        except Exception as e:
+            print(f'⚠️  Selector {selector} falló: {e}')
+            continue
 
-        menu_container = None
-        for selector in menu_container_selectors:
+        for element in elements:
             try:
-                containers = driver.find_elements(By.CSS_SELECTOR, selector)
-                for container in containers:
-                    # Verificar si el contenedor es visible y tiene contenido
-                    if container.is_displayed() and container.size['height'] > 50:
-                        menu_container = container
-                        print(f'✅ Contenedor del menú encontrado: {selector}')
-                        break
-                if menu_container:
-                    break
-            except:
-                continue
+                links.append({
+                    'selector': selector,
+                    'href': element.get_attribute('href'),
+                    'text': element.text,
+                    'visible': None,
+                    'container': container_selector
+                })
+            except Exception as e:
+                print(f'⚠️  Error procesando elemento: {e}')
 
-        if not menu_container:
-            print('⚠️  No se encontró contenedor específico del menú, usando página completa')
+    return {'container': container_selector, 'links': links}
 
-        # Selectores más específicos para categorías del menú desplegado
-        category_selectors = [
-            '.vtex-menu-2-x-menuItem a[href*="/"]',           # Enlaces en items del menú VTEX
-            '.vtex-menu-2-x-submenuItem a[href*="/"]',       # Items del submenú
-            '.vtex-menu-2-x-styledLink[href*="/"]',          # Enlaces estilizados del menú
-        ]
+def filter_menu_links(links):
+    """
+    Filtrar los enlaces del menú y convertirlos en categorías
 
-        found_links = set()  # Evitar duplicados
+    Recibe las filas devueltas por collect_menu_links (href y texto ya
+    obtenidos), por lo que no hace llamadas al navegador.
+    """
+    rules = get_rules()
+    categories = []
+    found_links = set()  # Evitar duplicados
+
+    selector_counts = {}
+    for link in links:
+        selector_counts[link.get('selector')] = selector_counts.get(link.get('selector'), 0) + 1
+    for selector, count in selector_counts.items():
+        print(f'🔍 Selector {selector}: {count} elementos encontrados')
+
+    for link in links:
+        href = link.get('href')
+        text = (link.get('text') or '').strip()
+
+        if href and text and len(text) > 1 and len(text) < 50:
+            # Filtrar URLs válidas de categorías principales
+            if (href.startswith('https://www.jumbo.com.ar/') and
+                not href.endswith('/p') and  # No productos individuales
+                not 'javascript:' in href and
+                not '#' in href and
+                not '/p/' in href and       # No páginas de producto
+                not rules.menu_link_href_exclude.matches(href) and  # Descuentos, sucursales, arrepentimiento
+                not rules.menu_link_text_exclude.matches(text)):    # Legales, bancarios
+
+                # Limpiar el texto (remover caracteres extraños)
+                clean_text = re.sub(r'[^\w\sáéíóúñÁÉÍÓÚÑ]', '', text).strip()
 
-        for selector in category_selectors:
-            try:
-                if menu_container:
-                    # Buscar dentro del contenedor del menú
-                    elements = menu_container.find_elements(By.CSS_SELECTOR, selector.replace('.vtex-menu-2-x-menuItem ', ''))
-                else:
-                    # Buscar en toda la página
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if clean_text and len(clean_text) > 2:
+                    # Verificar que no sea un enlace genérico
+                    if not rules.menu_generic_terms.matches(clean_text):
+                        # Usar URL como clave para evitar duplicados
+                        if href not in found_links:
+                            found_links.add(href)
+                            categories.append({
+                                'name': clean_text,
+                                'url': href,
+                                'text_original': text
+                            })
+                            print(f'✅ Categoría encontrada: {clean_text}')
+
+    # Filtrar categorías principales (última validación)
+    main_categories = []
 
-                print(f'🔍 Selector {selector}: {len(elements)} elementos encontrados')
+    for category in categories:
+        should_exclude = rules.menu_exclude_keywords.matches(category['name'])
 
-                for element in elements:
-                    try:
-                        href = element.get_attribute('href')
-                        text = element.text.strip()
-
-                        if href and text and len(text) > 1 and len(text) < 50:
-                            # Filtrar URLs válidas de categorías principales
-                            if (href.startswith('https://www.jumbo.com.ar/') and
-                                not href.endswith('/p') and  # No productos individuales
-                                not 'javascript:' in href and
-                                not '#' in href and
-                                not '/p/' in href and       # No páginas de producto
-                                not 'descuentos' in href.lower() and  # No descuentos
-                                not 'sucursales' in href.lower() and  # No sucursales
-                                not 'arrepentimiento' in href.lower() and  # No botón arrepentimiento
-                                not 'legales' in text.lower() and     # No legales
-                                not 'bancarios' in text.lower()):     # No bancarios
-
-                                # Limpiar el texto (remover caracteres extraños)
-                                clean_text = re.sub(r'[^\w\sáéíóúñÁÉÍÓÚÑ]', '', text).strip()
-
-                                if clean_text and len(clean_text) > 2:
-                                    # Verificar que no sea un enlace genérico
-                                    generic_terms = [
-                                        'ver más', 'ver todo', 'todos', 'ofertas', 'novedades',
-                                        'comprar', 'compra', 'inicio', 'home', 'contacto',
-                                        'ayuda', 'servicio', 'atención', 'sucursales',
-                                        'legales', 'bancarios', 'arrepentimiento'
-                                    ]
-
-                                    is_generic = False
-                                    for term in generic_terms:
-                                        if term in clean_text.lower():
-                                            is_generic = True
-                                            break
-
-                                    if not is_generic:
-                                        category_entry = {
-                                            'name': clean_text,
-                                            'url': href,
-                                            'text_original': text
-                                        }
-
-                                        # Usar URL como clave para evitar duplicados
-                                        if href not in found_links:
-                                            found_links.add(href)
-                                            categories.append(category_entry)
-                                            print(f'✅ Categoría encontrada: {clean_text}')
-
-                    except Exception as e:
-                        print(f'⚠️  Error procesando elemento: {e}')
-                        continue
+        if not should_exclude and len(category['name']) > 2:
+            main_categories.append(category)
 
-            except Exception as e:
-                print(f'⚠️  Selector {selector} falló: {e}')
-                continue
+    print(f'📊 Categorías válidas después del filtrado: {len(main_categories)}')
+    return main_categories
 
-        # Filtrar categorías principales (última validación)
-        main_categories = []
-        exclude_keywords = [
-            'ver más', 'ver todo', 'todos', 'ofertas', 'novedades',
-            'comprar', 'compra', 'inicio', 'home', 'contacto',
-            'ayuda', 'servicio', 'atención', 'sucursales', 'legales',
-            'bancarios', 'arrepentimiento', 'descuentos'
-        ]
+def extract_categories_from_network(driver):
+    """Extraer las categorías del árbol que el storefront recibe por red (browser.harvest_network)
 
-        for category in categories:
-            name_lower = category['name'].lower()
-            should_exclude = False
+    Los registros pasan por filter_menu_links, igual que los enlaces del DOM.
+    Devuelve [] si no se capturó el árbol, para recorrer el menú como siempre.
+    """
+    from network_harvest import harvest_json_responses, parse_harvested
 
-            for keyword in exclude_keywords:
-                if keyword in name_lower:
-                    should_exclude = True
-                    break
+    try:
+        records = parse_harvested(harvest_json_responses(driver), get_config().get('site_url'))['categories']
+    except Exception as e:
+        print(f'⚠️  No se pudo leer el tráfico de red ({e}), recorriendo el menú')
+        return []
+
+    if not records:
+        print('⚠️  El árbol de categorías no apareció en el tráfico de red, recorriendo el menú')
+        return []
+
+    print(f'📡 {len(records)} categorías capturadas del tráfico de red')
+    return filter_menu_links([{'selector': 'network', 'href': record['url'], 'text': record['text_original']}
+                              for record in records])
+
+def extract_categories_from_menu(driver):
+    """Extraer todas las categorías del menú desplegado"""
+    try:
+        # Esperar a que el submenú VTEX termine de renderizarse (cantidad de enlaces estable)
+        readiness = wait_for_stable_count(driver, MENU_LINK_SELECTOR)
+        print(f'✅ Menú renderizado: {readiness.get("count")} enlaces')
 
-            if not should_exclude and len(category['name']) > 2:
-                main_categories.append(category)
+        # Contenedor, hrefs y textos en un único round trip al navegador
+        try:
+            snapshot = collect_menu_links(driver)
+        except Exception as e:
+            print(f'⚠️  Extracción en bloque falló ({e}), consultando elemento por elemento')
+            snapshot = collect_menu_links_per_element(driver)
 
-        print(f'📊 Categorías válidas después del filtrado: {len(main_categories)}')
-        return main_categories
+        if snapshot.get('container'):
+            print(f'✅ Contenedor del menú encontrado: {snapshot["container"]}')
+        else:
+            print('⚠️  No se encontró contenedor específico del menú, usando página completa')
+
+        return filter_menu_links(snapshot.get('links') or [])
 
     except Exception as e:
         print(f'❌ Error extrayendo categorías: {e}')
@@ -442,20 +635,19 @@ def extract_categories_from_menu(driver):
 
 def analyze_main_menu():
     """Extraer categorías principales del menú desplegado - Etapa 3.2"""
-    scraper = JumboScraper()
+    scraper = get_shared_scraper()
     url = 'https://www.jumbo.com.ar/'
 
     print('🚀 INICIANDO EXTRACCIÓN DE CATEGORÍAS - ETAPA 3.2')
     print('=' * 50)
 
-    # Configurar Selenium con Chrome
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")  # Abrir en pantalla completa
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    if webdriver is None:
+        print('❌ Selenium no está instalado (pip install selenium)')
+        return
 
+    # Configurar Selenium con Chrome (con ventana: la etapa incluye verificación visual)
     try:
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = create_chrome_driver(headless=False)
         print('✅ NAVEGADOR SELENIUM INICIADO')
     except Exception as e:
         print(f'❌ Error iniciando Selenium: {e}')
@@ -465,13 +657,14 @@ def analyze_main_menu():
     try:
         print('📡 CARGANDO PÁGINA EN SELENIUM...')
         driver.get(url)
-        time.sleep(3)  # Esperar a que cargue la página
 
         print('🔍 BUSCANDO ELEMENTO DEL MENÚ DESPLEGABLE...')
 
-        # Buscar el elemento span con las clases específicas
+        # Esperar a que el elemento span con las clases específicas sea visible
         try:
-            menu_trigger = driver.find_element(By.CSS_SELECTOR, 'span.vtex-menu-2-x-styledLink--header-category')
+            menu_trigger = wait_for_element(driver, MENU_TRIGGER_SELECTOR)
+            if menu_trigger is None:
+                raise RuntimeError(f'{MENU_TRIGGER_SELECTOR} no visible')
             print('✅ ELEMENTO TRIGGER DEL MENÚ ENCONTRADO')
             print(f'Texto del elemento: "{menu_trigger.text}"')
 
@@ -509,7 +702,11 @@ def analyze_main_menu():
         print('\n🔍 EXTRAYENDO CATEGORÍAS DEL MENÚ DESPLEGADO...')
         print('=' * 50)
 
-        categories = extract_categories_from_menu(driver)
+        categories = []
+        if get_browser_settings()['harvest_network']:
+            categories = extract_categories_from_network(driver)
+        if not categories:
+            categories = extract_categories_from_menu(driver)
 
         print(f'📊 CATEGORÍAS EXTRAÍDAS: {len(categories)}')
 
@@ -560,15 +757,38 @@ def analyze_main_menu():
     print('🖱️  HOVER REALIZADO Y CATEGORÍAS EXTRAÍDAS')
     print(f'� TOTAL DE CATEGORÍAS: {len(categories) if "categories" in locals() else 0}')
 
+def discover_categories_from_api(output_file='categories_extracted.json'):
+    """Extraer categorías desde el árbol de categorías de VTEX - Etapa 3.2 (sin navegador)"""
+    print('🚀 INICIANDO EXTRACCIÓN DE CATEGORÍAS VÍA API - ETAPA 3.2')
+    print('=' * 50)
+
+    scraper = get_shared_scraper()
+    categories = discover_categories(scraper)
+
+    if not categories:
+        print('❌ No se pudo obtener el árbol de categorías')
+        return []
+
+    print(f'📊 CATEGORÍAS EXTRAÍDAS: {len(categories)}')
+
+    # Guardar categorías en archivo JSON (mismo formato que el menú de Selenium)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(categories, f, indent=2, ensure_ascii=False)
+
+    print(f'\n💾 CATEGORÍAS GUARDADAS EN: {output_file}')
+    return categories
+
+def default_report_file():
+    """Nombre del reporte con fecha y hora"""
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+    return f'logs/categorias_jumbo_{timestamp}.md'
+
 def generate_markdown_report(input_file='categories_with_filters.json', output_file=None):
     """Generar archivo Markdown con categorías y filtros - Etapa 5"""
     print('🚀 GENERANDO REPORTE MARKDOWN - ETAPA 5')
     print('=' * 50)
 
-    # Generar nombre de archivo con fecha y hora si no se especifica
-    if output_file is None:
-        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-        output_file = f'logs/categorias_jumbo_{timestamp}.md'
+    output_file = output_file or default_report_file()
 
     # Cargar categorías con filtros
     try:
@@ -582,6 +802,10 @@ def generate_markdown_report(input_file='categories_with_filters.json', output_f
         print(f'❌ Error al leer JSON: {e}')
         return
 
+    return write_markdown_report(categories, output_file)
+
+def write_markdown_report(categories, output_file):
+    """Escribir el reporte Markdown de categorías y filtros"""
     # Crear directorio logs si no existe
     import os
     os.makedirs('logs', exist_ok=True)
@@ -639,5 +863,235 @@ def generate_markdown_report(input_file='categories_with_filters.json', output_f
 
     return output_file
 
+def stream_validated_categories(categories, scraper, validate_urls=True):
+    """Etapa 3.3 en streaming: produce cada categoría apenas queda filtrada, validada y limpia
+
+    Con validate_urls=False no se envían HEAD (la descarga de la etapa 4 valida).
+    """
+    categories_to_exclude = get_rules().category_exclude
+
+    def kept(categories):
+        for category in categories:
+            exclude_term = categories_to_exclude.search(category['name'].strip())
+            if exclude_term:
+                print(f'🚫 Excluyendo: "{category["name"]}" (contiene "{exclude_term}")')
+            else:
+                yield category
+
+    if validate_urls:
+        validations = validate_category_links(scraper, kept(categories))
+    else:
+        validations = ((category, True, None) for category in kept(categories))
+
+    for category, valid, status in validations:
+        if not valid:
+            print(f'⚠️  URL no válida: {category["url"]} ({status})')
+            continue
+
+        category = dict(category)  # La salida de la etapa 3.2 conserva el nombre original
+        clean_category_name(category)
+        canonicalize_categories([category])
+        print(f'✅ {"Validada" if validate_urls else "Aceptada"}: {category["name"]}')
+        yield category
+
+def stream_categories_with_filters(categories, scraper, rendered=False, workers=None,
+                                   fused_validation=False):
+    """Etapa 4 en streaming: produce cada categoría con sus filtros, en orden, apenas se extraen
+
+    Con workers > 1 varias categorías se procesan en paralelo mientras la
+    etapa anterior sigue produciendo (default: config workers, o el tamaño
+    del pool de navegadores con rendered=True). Con fused_validation=True
+    se descartan las categorías cuya descarga falla.
+    """
+    if rendered:
+        from browser_pool import extract_filters_rendered, get_browser_pool
+        workers = workers or get_browser_pool().size
+    workers = workers or get_config().get('workers', 1)
+
+    def process(category):
+        validation = None
+        if rendered:
+            filters = extract_filters_rendered(category['url'])
+        else:
+            filters, result = fetch_category_filters(scraper, category['url'], category['name'])
+            validation = result.validation()
+            if fused_validation and not result.ok:
+                print(f'⚠️  URL no válida: {category["url"]} ({result.status_code or result.error})')
+                return None
+
+        category_with_filters = category.copy()
+        category_with_filters['filters'] = filters
+        category_with_filters['filters_count'] = len(filters)
+        if validation is not None:
+            category_with_filters['validation'] = validation
+        canonicalize_categories([category_with_filters])
+        return category_with_filters
+
+    for category_with_filters in imap_bounded(process, categories, workers=workers):
+        if category_with_filters is not None:
+            yield category_with_filters
+
+def run_all_stages(discovery='api', side_outputs=False, rendered=False, report_file=None,
+                   validation='head'):
+    """Ejecutar las etapas 3.2 → 3.3 → 4 → 5 encadenadas como generadores
+
+    Cada categoría pasa a la etapa siguiente apenas termina la anterior; los
+    archivos JSON intermedios solo se escriben con side_outputs=True.
+    """
+    print('🚀 INICIANDO ETAPAS 3.2 → 3.3 → 4 → 5 EN STREAMING')
+    print('=' * 50)
+
+    start = time.monotonic()
+    scraper = get_shared_scraper()
+
+    # Etapa 3.2: el menú con Selenium es interactivo, se usa el archivo que genera
+    if discovery == 'api':
+        categories = iter(discover_categories(scraper))
+    else:
+        try:
+            with open('categories_extracted.json', 'r', encoding='utf-8') as f:
+                categories = iter(json.load(f))
+        except FileNotFoundError:
+            print('❌ Ejecuta primero --stage 3.2 --discovery selenium (genera categories_extracted.json)')
+            return None
+    if side_outputs and discovery == 'api':
+        categories = tee_to_json(categories, 'categories_extracted.json')
+
+    # Con validation='fetch' (y sin navegador) la descarga de la etapa 4 reemplaza al HEAD
+    fused_validation = validation == 'fetch' and not rendered
+    validated = stream_validated_categories(categories, scraper, validate_urls=not fused_validation)
+    if side_outputs:
+        validated = tee_to_json(validated, 'categories_filtered.json')
+
+    with_filters = stream_categories_with_filters(validated, scraper, rendered=rendered,
+                                                  fused_validation=fused_validation)
+    if side_outputs:
+        with_filters = tee_to_json(with_filters, 'categories_with_filters.json')
+
+    results = []
+    try:
+        for category in with_filters:
+            if not results:
+                print(f'⏱️  Primer resultado a los {time.monotonic() - start:.1f}s')
+            results.append(category)
+            print(f'📊 {len(results):3d}. {category["name"]}: {category["filters_count"]} filtros')
+    finally:
+        if rendered:
+            from browser_pool import close_browser_pool
+            close_browser_pool()
+
+    fingerprint_store = get_fingerprint_store()
+    if fingerprint_store is not None:
+        fingerprint_store.save()
+        print(f'♻️  Modo incremental: {fingerprint_store.summary()}')
+    apply_canonical_urls(results)
+
+    # Etapa 5: el reporte necesita los totales, se escribe al final
+    output_file = write_markdown_report(results, report_file or default_report_file())
+    print(f'🔌 Conexiones: {scraper.connection_summary()}')
+    print(f'⏱️  Tiempo total: {time.monotonic() - start:.1f}s')
+    return output_file
+
+def parse_arguments():
+    """Parsea los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description='Análisis del menú de categorías de Jumbo')
+
+    parser.add_argument(
+        '--stage',
+        choices=['3.2', '3.3', '4', '5', 'all'],
+        default='5',
+        help='Etapa a ejecutar: 3.2 categorías, 3.3 filtrado/validación, 4 filtros, 5 reporte, '
+             'all todas encadenadas en streaming (default: 5)'
+    )
+
+    parser.add_argument(
+        '--validation',
+        choices=['head', 'fetch'],
+        default='head',
+        help='Validación de URLs: HEAD en la etapa 3.3 (head) o como parte de la descarga '
+             'de la etapa 4 (fetch), registrando URL final, status y redirecciones'
+    )
+
+    parser.add_argument(
+        '--side-outputs',
+        action='store_true',
+        help='Con --stage all: guardar también los archivos JSON intermedios de cada etapa'
+    )
+
+    parser.add_argument(
+        '--discovery',
+        choices=['api', 'selenium'],
+        default='api',
+        help='Etapa 3.2: árbol de categorías de VTEX (api) o menú desplegado en Chrome (selenium)'
+    )
+
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Etapa 4: descargar las categorías con el cliente asíncrono (aiohttp)'
+    )
+
+    parser.add_argument(
+        '--rendered',
+        action='store_true',
+        help='Etapa 4: leer los filtros de la página renderizada en navegadores headless'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Etapa 4: reutilizar los filtros de las categorías cuya página no cambió'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Etapa 4: omitir las categorías ya registradas en el checkpoint de la ejecución anterior'
+    )
+
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument(
+        '--record',
+        metavar='DIR',
+        help='Grabar todas las respuestas HTTP en DIR'
+    )
+    recording.add_argument(
+        '--replay',
+        metavar='DIR',
+        help='Reproducir las respuestas grabadas en DIR sin acceso a la red'
+    )
+
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    generate_markdown_report()
+    args = parse_arguments()
+
+    # Grabación / reproducción (antes de crear cualquier scraper)
+    config = get_config()
+    if args.record:
+        config['record_dir'] = args.record
+    if args.replay:
+        config['replay_dir'] = args.replay
+    if args.incremental:
+        config['incremental'] = {**(config.get('incremental') or {}), 'enabled': True}
+    if args.use_async and (args.record or args.replay):
+        print('⚠️  --async no soporta grabación/reproducción, se usa el cliente síncrono')
+        args.use_async = False
+
+    if args.stage == '3.2':
+        if args.discovery == 'selenium':
+            analyze_main_menu()
+        else:
+            discover_categories_from_api()
+    elif args.stage == '3.3':
+        filter_and_validate_categories(validate_urls=args.validation == 'head')
+    elif args.stage == 'all':
+        run_all_stages(discovery=args.discovery, side_outputs=args.side_outputs, rendered=args.rendered,
+                       validation=args.validation)
+    elif args.stage == '4':
+        extract_filters_from_all_categories(use_async=args.use_async, rendered=args.rendered,
+                                            resume=args.resume,
+                                            fused_validation=args.validation == 'fetch')
+    else:
+        generate_markdown_report()
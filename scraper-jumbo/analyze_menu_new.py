@@ -15,7 +15,7 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 from scraper import JumboScraper
-from bs4 import BeautifulSoup
+from html_parser import parse_html
 import re
 
 def open_in_browser(url, delay=2):
@@ -42,7 +42,7 @@ def analyze_main_menu():
         print("❌ Error obteniendo la página")
         return
 
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     print('🔍 BUSCANDO ELEMENTO DEL MENÚ DESPLEGABLE...')
     print('=' * 50)
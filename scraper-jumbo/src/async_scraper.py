@@ -0,0 +1,243 @@
+"""
+Módulo Async Scraper - Cliente HTTP asíncrono basado en asyncio
+"""
+
+import asyncio
+from typing import Optional, Dict, List, Callable
+from config import get_config, get_logger
+from scraper import (build_default_headers, get_declared_charset, ResponseTooLargeError,
+                     MIN_CONTENT_LENGTH, DEFAULT_ENCODING, STREAM_CHUNK_SIZE)
+from rate_limiter import get_rate_limiter
+from http_cache import get_http_cache
+from redirects import get_redirect_map
+from recorder import get_archive_mode
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - dependencia opcional
+    aiohttp = None
+
+
+class AsyncJumboScraper:
+    """
+    Cliente HTTP asíncrono para scraping de Jumbo
+    Mantiene la semántica de reintentos de JumboScraper sobre un único event loop
+    """
+
+    def __init__(self, concurrency: Optional[int] = None):
+        if aiohttp is None:
+            raise ImportError("aiohttp es necesario para AsyncJumboScraper (pip install aiohttp)")
+        if get_archive_mode()[0] is not None:
+            raise RuntimeError("AsyncJumboScraper no soporta --record/--replay; usar el cliente síncrono")
+
+        self.config = get_config()
+        self.logger = get_logger()
+        self.concurrency = concurrency or self.config.get('async_concurrency', 50)
+        # Mismo tope de conexiones por host que el cliente síncrono
+        self.max_connections_per_host = min(self.concurrency, self.config.get('max_connections_per_host', 4))
+        self.session = None
+        self._semaphore = None
+        self.rate_limiter = get_rate_limiter()
+        self.http_cache = get_http_cache()
+        self.redirect_map = get_redirect_map()
+
+        self.logger.info(f"🔧 AsyncJumboScraper inicializado (concurrencia: {self.concurrency})")
+
+    def _get_default_headers(self) -> Dict[str, str]:
+        """Obtiene los headers por defecto para las requests"""
+        headers = build_default_headers(self.config)
+        try:
+            import brotli  # noqa: F401
+        except ImportError:
+            # aiohttp solo decodifica br si está instalado brotli
+            headers['Accept-Encoding'] = 'gzip, deflate'
+        return headers
+
+    async def open(self):
+        """Crea la sesión aiohttp (debe llamarse dentro del event loop)"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency,
+                                             limit_per_host=self.max_connections_per_host)
+            self.session = aiohttp.ClientSession(
+                headers=self._get_default_headers(),
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.config['timeout'] + self.config.get('body_timeout', 60),
+                    sock_read=self.config['timeout']
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def _read_body(self, response) -> bytes:
+        """Lee el cuerpo en bloques respetando max_body_bytes"""
+        max_bytes = self.config.get('max_body_bytes', 10 * 1024 * 1024)
+        chunks = []
+        size = 0
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ResponseTooLargeError(f"Respuesta supera el máximo de {max_bytes} bytes")
+            chunks.append(chunk)
+
+        return b''.join(chunks)
+
+    async def get_page(self, url: str, max_retries: Optional[int] = None) -> Optional[str]:
+        """
+        Obtiene el contenido de una página web con manejo de errores
+
+        Args:
+            url (str): URL de la página a obtener
+            max_retries (int, optional): Número máximo de reintentos
+
+        Returns:
+            Optional[str]: Contenido HTML de la página o None si falla
+        """
+        await self.open()
+
+        if max_retries is None:
+            max_retries = self.config['max_retries']
+
+        last_exception = None
+
+        # Redirección conocida: pedir directo la URL final
+        request_url = (self.redirect_map.resolve(url) if self.redirect_map is not None else None) or url
+
+        # Consultar el cache: dentro del TTL no hace falta ir a la red
+        cached = self.http_cache.get(request_url) if self.http_cache else None
+        if cached and self.http_cache.is_fresh(cached):
+            self.logger.debug(f"💾 Página servida desde cache: {request_url}")
+            return cached.text
+        conditional_headers = self.http_cache.conditional_headers(cached) if cached else None
+
+        for attempt in range(max_retries + 1):
+            try:
+                self.logger.debug(f"🌐 Intentando acceder a: {request_url} (intento {attempt + 1})")
+
+                await self.rate_limiter.acquire_async(request_url)
+
+                async with self._semaphore:
+                    async with self.session.get(request_url, headers=conditional_headers,
+                                                allow_redirects=True) as response:
+                        if cached and response.status == 304:
+                            self.logger.debug(f"💾 Página no modificada (304), servida desde cache: {request_url}")
+                            self.http_cache.touch(request_url)
+                            return cached.text
+
+                        response.raise_for_status()
+                        if self.redirect_map is not None and response.history:
+                            self.redirect_map.record(url, str(response.url))
+                        body = await self._read_body(response)
+
+                encoding = get_declared_charset(response.headers) or DEFAULT_ENCODING
+                content = body.decode(encoding, errors='replace')
+
+                # Verificar que el contenido sea válido
+                if len(content) < MIN_CONTENT_LENGTH:
+                    raise ValueError("Contenido de respuesta demasiado pequeño")
+
+                if self.http_cache:
+                    self.http_cache.store(
+                        request_url,
+                        body,
+                        encoding=encoding,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+
+                self.logger.debug(f"✅ Página obtenida exitosamente ({len(content)} caracteres)")
+                return content
+
+            except asyncio.TimeoutError:
+                last_exception = f"Timeout después de {self.config['timeout']} segundos"
+                self.logger.warning(f"⏱️ {last_exception}")
+            except aiohttp.ClientResponseError as e:
+                last_exception = f"Error HTTP {e.status}"
+                self.logger.warning(f"🌐 {last_exception}")
+
+                # No reintentar para errores 4xx (excepto 429)
+                if 400 <= e.status < 500 and e.status != 429:
+                    break
+            except ResponseTooLargeError as e:
+                last_exception = str(e)
+                self.logger.warning(f"📦 {last_exception}")
+                break
+            except aiohttp.ClientConnectionError:
+                last_exception = "Error de conexión"
+                self.logger.warning(f"🔌 {last_exception}")
+            except Exception as e:
+                last_exception = f"Error inesperado: {str(e)}"
+                self.logger.warning(f"❌ {last_exception}")
+
+            # Backoff antes del siguiente intento (solo tras un fallo)
+            if attempt < max_retries:
+                delay = self.config['delay_between_requests'] * (attempt + 1)
+                self.logger.info(f"⏳ Esperando {delay} segundos antes del siguiente intento...")
+                await asyncio.sleep(delay)
+
+        if request_url != url:
+            # La redirección guardada dejó de servir: la próxima vez se resuelve de nuevo
+            self.redirect_map.forget(url)
+
+        self.logger.error(f"❌ Fallaron todos los intentos para {url}. Último error: {last_exception}")
+        return None
+
+    async def get_many(self, urls: List[str],
+                       on_page: Optional[Callable[[str, Optional[str]], None]] = None) -> List[Optional[str]]:
+        """
+        Obtiene varias páginas en paralelo respetando el límite de concurrencia
+
+        Args:
+            urls (List[str]): URLs a obtener
+            on_page (Callable, optional): Se llama con (url, contenido) apenas
+                termina cada página, para no perder lo descargado si la ejecución se corta
+
+        Returns:
+            List[Optional[str]]: Contenidos en el mismo orden que las URLs
+        """
+        await self.open()
+        self.logger.info(f"⚡ Obteniendo {len(urls)} páginas en paralelo")
+
+        async def get_and_notify(url):
+            content = await self.get_page(url)
+            if on_page is not None:
+                on_page(url, content)
+            return content
+
+        return await asyncio.gather(*(get_and_notify(url) for url in urls))
+
+    async def close(self):
+        """Cierra la sesión HTTP"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self.logger.info("🔌 Sesión HTTP asíncrona cerrada")
+
+    async def __aenter__(self):
+        """Context manager entry"""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        await self.close()
+
+
+def fetch_pages(urls: List[str], concurrency: Optional[int] = None,
+                on_page: Optional[Callable[[str, Optional[str]], None]] = None) -> List[Optional[str]]:
+    """
+    Obtiene varias páginas con AsyncJumboScraper desde código síncrono
+
+    Args:
+        urls (List[str]): URLs a obtener
+        concurrency (int, optional): Límite de requests simultáneas
+        on_page (Callable, optional): Se llama con (url, contenido) al terminar cada página
+
+    Returns:
+        List[Optional[str]]: Contenidos en el mismo orden que las URLs
+    """
+    async def _run():
+        async with AsyncJumboScraper(concurrency) as scraper:
+            return await scraper.get_many(urls, on_page)
+
+    return asyncio.run(_run())
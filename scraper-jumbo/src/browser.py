@@ -0,0 +1,346 @@
+"""
+Módulo Browser - Utilidades de Selenium para páginas renderizadas
+
+Esperas basadas en eventos en lugar de sleeps fijos: cada paso espera
+solo lo que la página realmente necesita, con un timeout máximo.
+"""
+
+from typing import Optional, Dict, Any, List
+from config import get_config, get_logger
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+except ImportError:  # pragma: no cover - dependencia opcional
+    webdriver = Options = By = WebDriverWait = EC = None
+    TimeoutException = Exception
+
+
+logger = get_logger()
+
+# Enlaces del menú desplegable de categorías de VTEX
+MENU_TRIGGER_SELECTOR = 'span.vtex-menu-2-x-styledLink--header-category'
+MENU_LINK_SELECTORS = [
+    '.vtex-menu-2-x-menuItem a[href*="/"]',           # Enlaces en items del menú VTEX
+    '.vtex-menu-2-x-submenuItem a[href*="/"]',       # Items del submenú
+    '.vtex-menu-2-x-styledLink[href*="/"]',          # Enlaces estilizados del menú
+]
+MENU_LINK_SELECTOR = ', '.join(MENU_LINK_SELECTORS)
+
+# Contenedores del menú desplegado, en orden de prioridad
+MENU_CONTAINER_SELECTORS = [
+    '.vtex-menu-2-x-menuContainer',  # Contenedor principal del menú
+    '.vtex-menu-2-x-submenu',       # Submenú desplegado
+    '[class*="menuContainer"]',     # Contenedor genérico
+    '.vtex-menu-2-x-menuItem',      # Items del menú
+]
+# Dentro de un contenedor los selectores de enlaces se usan sin este prefijo
+MENU_ITEM_SCOPE_PREFIX = '.vtex-menu-2-x-menuItem '
+
+# Recursos que no se usan para leer enlaces ni filtros: imágenes, video,
+# fuentes y dominios de analítica/publicidad (patrones de Network.setBlockedURLs)
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+]
+BLOCKED_TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*googleadservices.com*',
+    '*doubleclick.net*', '*googlesyndication.com*', '*facebook.net*',
+    '*connect.facebook.com*', '*hotjar.com*', '*clarity.ms*', '*tiktok.com*',
+    '*criteo.com*', '*criteo.net*', '*taboola.com*', '*youtube.com*',
+]
+
+# Preferencias de Chrome: 2 = bloquear
+LEAN_CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+}
+
+# Títulos del panel de filtros (facets) de la página de búsqueda de VTEX
+FILTER_TITLE_SELECTOR = '.vtex-search-result-3-x-filterTitle'
+
+# Resuelve cuando la cantidad de elementos que cumplen el selector deja de
+# cambiar durante `quietMs` (vía MutationObserver), o al vencer `timeoutMs`.
+_WAIT_FOR_STABLE_COUNT_JS = """
+const selector = arguments[0];
+const quietMs = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+
+const count = () => document.querySelectorAll(selector).length;
+let last = count();
+let quietTimer = null;
+let observer = null;
+let hardTimer = null;
+
+const finish = (stable) => {
+    if (observer) observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done({count: count(), stable: stable});
+};
+const arm = () => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => (count() > 0 ? finish(true) : arm()), quietMs);
+};
+
+observer = new MutationObserver(() => {
+    const current = count();
+    if (current !== last) {
+        last = current;
+        arm();
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+hardTimer = setTimeout(() => finish(false), timeoutMs);
+arm();
+"""
+
+
+# Devuelve en un único round trip todos los enlaces candidatos del menú:
+# contenedor visible encontrado y, por enlace, href absoluto, texto
+# visible (como WebElement.text), visibilidad y selector que lo encontró.
+_COLLECT_MENU_LINKS_JS = """
+const containerSelectors = arguments[0];
+const linkSelectors = arguments[1];
+const scopePrefix = arguments[2];
+
+const isVisible = (el) => {
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+
+let container = null;
+let containerSelector = null;
+for (const selector of containerSelectors) {
+    for (const el of document.querySelectorAll(selector)) {
+        if (isVisible(el) && el.getBoundingClientRect().height > 50) {
+            container = el;
+            containerSelector = selector;
+            break;
+        }
+    }
+    if (container) break;
+}
+
+const links = [];
+for (const selector of linkSelectors) {
+    const scoped = container ? selector.replace(scopePrefix, '') : selector;
+    for (const a of (container || document).querySelectorAll(scoped)) {
+        const visible = isVisible(a);
+        links.push({
+            selector: selector,
+            href: a.href || a.getAttribute('href'),
+            text: visible ? (a.innerText || '') : '',
+            visible: visible,
+            container: containerSelector
+        });
+    }
+}
+return {container: containerSelector, links: links};
+"""
+
+
+def get_browser_settings() -> Dict[str, Any]:
+    """Obtiene la sección browser de la configuración con valores por defecto"""
+    settings = {
+        'page_load_timeout': 30,
+        'menu_timeout': 15,
+        'menu_quiet_ms': 500,
+        'headless': True,
+        'window_size': '1920,1080',
+        'pool_size': 2,
+        'filter_timeout': 10,
+        'block_resources': None,
+        'blocked_url_patterns': [],
+        'harvest_network': False,
+    }
+    settings.update(get_config().get('browser') or {})
+    return settings
+
+
+def get_blocked_url_patterns() -> List[str]:
+    """Patrones de URL bloqueados por el perfil liviano (defaults + browser.blocked_url_patterns)"""
+    extra = get_browser_settings().get('blocked_url_patterns') or []
+    return BLOCKED_RESOURCE_PATTERNS + BLOCKED_TRACKER_PATTERNS + list(extra)
+
+
+def apply_lean_profile(driver, patterns: Optional[List[str]] = None) -> bool:
+    """
+    Bloquea recursos pesados en una sesión ya iniciada vía CDP
+
+    Args:
+        driver: WebDriver de Chrome
+        patterns (List[str], optional): Patrones a bloquear (default: get_blocked_url_patterns())
+
+    Returns:
+        bool: True si el bloqueo quedó activo
+    """
+    patterns = get_blocked_url_patterns() if patterns is None else patterns
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo activar el bloqueo de recursos: {e}")
+        return False
+
+    logger.debug(f"🚫 Bloqueando {len(patterns)} patrones de recursos")
+    return True
+
+
+def create_chrome_driver(headless: Optional[bool] = None, lean: Optional[bool] = None,
+                         harvest_network: Optional[bool] = None):
+    """
+    Inicia un Chrome controlado por Selenium
+
+    Args:
+        headless (bool, optional): Sin ventana (default: browser.headless)
+        lean (bool, optional): Bloquear imágenes, media, fuentes y trackers
+            (default: browser.block_resources, o headless si no está definido)
+        harvest_network (bool, optional): Activar el log de red para capturar
+            las respuestas JSON de VTEX (default: browser.harvest_network)
+
+    Returns:
+        WebDriver de Chrome con el timeout de carga configurado
+    """
+    if webdriver is None:
+        raise RuntimeError("Selenium no está instalado (pip install selenium)")
+
+    settings = get_browser_settings()
+    headless = settings['headless'] if headless is None else headless
+    if lean is None:
+        lean = headless if settings['block_resources'] is None else settings['block_resources']
+
+    harvest_network = settings['harvest_network'] if harvest_network is None else harvest_network
+
+    options = Options()
+    if harvest_network:
+        from network_harvest import enable_network_logging
+        enable_network_logging(options)
+    if lean:
+        options.add_experimental_option('prefs', LEAN_CHROME_PREFS)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={settings['window_size']}")
+        options.add_argument("--disable-gpu")
+    else:
+        options.add_argument("--start-maximized")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--disable-features=VizDisplayCompositor")
+
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(settings['page_load_timeout'])
+    if lean:
+        apply_lean_profile(driver)
+    return driver
+
+
+def wait_for_element(driver, css_selector: str, timeout: Optional[float] = None):
+    """
+    Espera a que un elemento sea visible
+
+    Args:
+        driver: WebDriver de Selenium
+        css_selector (str): Selector CSS del elemento
+        timeout (float, optional): Espera máxima en segundos (default: browser.menu_timeout)
+
+    Returns:
+        El WebElement visible, o None si venció el timeout
+    """
+    timeout = timeout or get_browser_settings()['menu_timeout']
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+    except TimeoutException:
+        logger.warning(f"⏱️ Elemento no visible después de {timeout}s: {css_selector}")
+        return None
+
+
+def wait_for_stable_count(driver, css_selector: str, timeout: Optional[float] = None,
+                          quiet_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Espera a que los elementos de un selector terminen de renderizarse
+
+    Un MutationObserver resuelve la espera cuando hay al menos un elemento y
+    la cantidad no cambió durante quiet_ms.
+
+    Args:
+        driver: WebDriver de Selenium
+        css_selector (str): Selector CSS de los elementos
+        timeout (float, optional): Espera máxima en segundos (default: browser.menu_timeout)
+        quiet_ms (int, optional): Tiempo sin cambios requerido (default: browser.menu_quiet_ms)
+
+    Returns:
+        Dict[str, Any]: {'count': cantidad de elementos, 'stable': False si venció el timeout}
+    """
+    settings = get_browser_settings()
+    timeout = timeout or settings['menu_timeout']
+    quiet_ms = quiet_ms or settings['menu_quiet_ms']
+
+    # Margen para que el timeout del script no corte antes que el de JS
+    driver.set_script_timeout(timeout + 5)
+    result = driver.execute_async_script(_WAIT_FOR_STABLE_COUNT_JS, css_selector, quiet_ms, int(timeout * 1000))
+
+    if not result.get('stable'):
+        logger.warning(f"⏱️ {css_selector}: sin estabilizar después de {timeout}s ({result.get('count')} elementos)")
+    return result
+
+
+def collect_menu_links(driver, container_selectors: Optional[List[str]] = None,
+                       link_selectors: Optional[List[str]] = None,
+                       scope_prefix: str = MENU_ITEM_SCOPE_PREFIX) -> Dict[str, Any]:
+    """
+    Obtiene todos los enlaces candidatos del menú con un único execute_script
+
+    Reemplaza las llamadas por elemento (is_displayed, size, get_attribute,
+    text), cada una un round trip al driver, por una sola consulta: busca el
+    primer contenedor visible (alto > 50px) y, dentro de él o en toda la
+    página si no hay, los enlaces de cada selector.
+
+    Args:
+        driver: WebDriver de Selenium
+        container_selectors (List[str], optional): Contenedores en orden de prioridad
+        link_selectors (List[str], optional): Selectores de enlaces
+        scope_prefix (str): Prefijo a quitar de los selectores dentro del contenedor
+
+    Returns:
+        Dict[str, Any]: {'container': selector o None,
+                         'links': [{'selector', 'href', 'text', 'visible', 'container'}]}
+    """
+    snapshot = driver.execute_script(
+        _COLLECT_MENU_LINKS_JS,
+        list(container_selectors or MENU_CONTAINER_SELECTORS),
+        list(link_selectors or MENU_LINK_SELECTORS),
+        scope_prefix
+    )
+    logger.debug(f"📦 {len(snapshot.get('links', []))} enlaces del menú en un único round trip")
+    return snapshot
+
+
+def collect_filter_titles(driver) -> List[str]:
+    """
+    Lee los títulos del panel de filtros renderizado con un único execute_script
+
+    Args:
+        driver: WebDriver de Selenium con una página de categoría cargada
+
+    Returns:
+        List[str]: Títulos de filtros tal como se muestran
+    """
+    titles = driver.execute_script(
+        "return Array.from(document.querySelectorAll(arguments[0]), el => el.innerText || el.textContent || '');",
+        FILTER_TITLE_SELECTOR
+    )
+    return [title.strip() for title in titles or [] if title and title.strip()]
@@ -0,0 +1,193 @@
+"""
+Módulo Browser Pool - Navegadores headless reutilizables
+
+VTEX renderiza parte del panel de filtros en el cliente, así que la única
+fuente fiable es un navegador. El pool mantiene N instancias de Chrome
+abiertas durante toda la ejecución y presta su pestaña de trabajo a los
+workers de categorías: el costo de arranque se paga una vez por ejecución
+y las categorías se procesan en paralelo (una por navegador, ya que una
+sesión de WebDriver no admite comandos concurrentes).
+"""
+
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+from config import get_logger
+from browser import (create_chrome_driver, get_browser_settings, wait_for_stable_count,
+                     collect_filter_titles, FILTER_TITLE_SELECTOR)
+from rate_limiter import get_rate_limiter
+from network_harvest import drain_network_log, harvest_json_responses, parse_harvested
+
+
+logger = get_logger()
+
+
+class BrowserPool:
+    """
+    Pool de navegadores headless precalentados
+
+    Ejemplo:
+        with pool.checkout() as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, size: Optional[int] = None,
+                 driver_factory: Optional[Callable] = None,
+                 checkout_timeout: Optional[float] = None):
+        """
+        Args:
+            size (int, optional): Cantidad de navegadores (default: browser.pool_size)
+            driver_factory (Callable, optional): Crea un WebDriver (default: Chrome headless)
+            checkout_timeout (float, optional): Espera máxima por un navegador libre (None = sin límite)
+        """
+        self.size = max(1, size or get_browser_settings()['pool_size'])
+        self.driver_factory = driver_factory or (lambda: create_chrome_driver(headless=True))
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = queue.Queue()
+        self._drivers: List = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._start()
+
+    def _start(self):
+        """Inicia todos los navegadores del pool"""
+        for _ in range(self.size):
+            self._add_driver()
+        logger.info(f"🧭 Pool de navegadores listo: {self.size} instancias headless")
+
+    def _add_driver(self):
+        driver = self.driver_factory()
+        with self._lock:
+            self._drivers.append(driver)
+        self._idle.put(driver)
+
+    def _discard(self, driver):
+        """Cierra un navegador que quedó en mal estado"""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def checkout(self):
+        """
+        Presta un navegador libre durante el bloque with
+
+        Si el bloque falla, el navegador se reemplaza por uno nuevo para no
+        devolver al pool una sesión rota.
+
+        Yields:
+            WebDriver listo para navegar
+        """
+        if self._closed:
+            raise RuntimeError("El pool de navegadores está cerrado")
+
+        try:
+            driver = self._idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Ningún navegador libre después de {self.checkout_timeout}s") from None
+
+        try:
+            yield driver
+        except Exception:
+            self._discard(driver)
+            if not self._closed:
+                self._add_driver()
+            raise
+        else:
+            if self._closed:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+
+    def close(self):
+        """Cierra todos los navegadores del pool"""
+        self._closed = True
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        logger.debug(f"🧭 Pool de navegadores cerrado ({len(drivers)} instancias)")
+
+
+def extract_filters_rendered(category_url: str, pool: Optional[BrowserPool] = None) -> List[str]:
+    """
+    Extrae los filtros de una categoría desde la página renderizada
+
+    Args:
+        category_url (str): URL de la categoría
+        pool (BrowserPool, optional): Pool a usar (default: pool global)
+
+    Returns:
+        List[str]: Filtros base + específicos, o [] si la página no cargó
+    """
+    from extractor import finalize_filters, parse_filters_from_html, BASE_FILTERS
+
+    pool = pool or get_browser_pool()
+    settings = get_browser_settings()
+
+    get_rate_limiter().acquire(category_url)
+    try:
+        with pool.checkout() as driver:
+            if settings['harvest_network']:
+                drain_network_log(driver)
+            driver.get(category_url)
+            wait_for_stable_count(driver, FILTER_TITLE_SELECTOR, timeout=settings['filter_timeout'])
+
+            if settings['harvest_network']:
+                # Facets tal como los recibió el storefront, sin recorrer el DOM
+                harvested = parse_harvested(harvest_json_responses(driver))['filters']
+                if harvested is not None:
+                    logger.info(f"✅ Extraídos {len(harvested) - len(BASE_FILTERS)} filtros específicos "
+                                f"de {category_url} (red)")
+                    return harvested
+
+            titles = collect_filter_titles(driver)
+            html_content = None if titles else driver.page_source
+    except Exception as e:
+        logger.error(f"❌ Error renderizando {category_url}: {e}")
+        return []
+
+    if not titles:
+        # Panel sin títulos reconocibles: parsear el HTML renderizado
+        return parse_filters_from_html(html_content, category_url)
+
+    filters = finalize_filters([title for title in titles if 'precio' not in title.lower()])
+    logger.info(f"✅ Extraídos {len(filters) - len(BASE_FILTERS)} filtros específicos de {category_url} (navegador)")
+    return filters
+
+
+# Pool global compartido por todos los workers del proceso
+BROWSER_POOL = None
+_BROWSER_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Obtiene el pool global, iniciando los navegadores la primera vez"""
+    global BROWSER_POOL
+
+    with _BROWSER_POOL_LOCK:
+        if BROWSER_POOL is None:
+            BROWSER_POOL = BrowserPool()
+            atexit.register(close_browser_pool)
+    return BROWSER_POOL
+
+
+def close_browser_pool():
+    """Cierra el pool global si fue iniciado"""
+    global BROWSER_POOL
+
+    with _BROWSER_POOL_LOCK:
+        pool, BROWSER_POOL = BROWSER_POOL, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,116 @@
+"""
+Módulo Checkpoint - Diario de categorías terminadas para reanudar ejecuciones
+
+Cada categoría procesada se agrega como una línea JSON al diario apenas
+termina, así una ejecución interrumpida (timeouts, Ctrl+C, un Chrome caído)
+conserva el trabajo hecho y con --resume solo se procesan las restantes.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from config import get_logger
+
+
+logger = get_logger()
+
+
+class CheckpointJournal:
+    """
+    Diario append-only (JSON Lines) de categorías terminadas, indexado por URL
+
+    Ejemplo:
+        journal = CheckpointJournal('checkpoints/filters.jsonl', resume=True)
+        pending = journal.restore(categories)
+    """
+
+    def __init__(self, path, resume: bool = False):
+        """
+        Args:
+            path: Archivo del diario
+            resume (bool): Conservar el diario existente (False = empezar uno nuevo)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._completed = self._load() if resume else {}
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Lee los registros del diario (una línea incompleta al final se ignora)"""
+        completed = {}
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"⚠️ Línea {line_number} del checkpoint incompleta, se ignora")
+                    continue
+                if isinstance(record, dict) and record.get('url'):
+                    completed[record['url']] = record
+
+        logger.info(f"♻️ Checkpoint {self.path}: {len(completed)} categorías ya procesadas")
+        return completed
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Obtiene el registro de una categoría terminada, o None"""
+        return self._completed.get(url)
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def record(self, url: str, **fields):
+        """
+        Agrega una categoría terminada al diario y la persiste en disco
+
+        Args:
+            url (str): URL de la categoría
+            **fields: Datos del resultado (ej: name, filters)
+        """
+        entry = {'url': url, **fields}
+        line = json.dumps(entry, ensure_ascii=False)
+
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._completed[url] = entry
+
+    def restore(self, categories: List[Dict[str, Any]], field: str = 'filters') -> List[Dict[str, Any]]:
+        """
+        Completa las categorías ya terminadas y devuelve las pendientes
+
+        Args:
+            categories (List[Dict[str, Any]]): Categorías con 'url'
+            field (str): Campo del resultado a restaurar
+
+        Returns:
+            List[Dict[str, Any]]: Categorías que faltan procesar, en el mismo orden
+        """
+        pending = []
+        for category in categories:
+            entry = self._completed.get(category['url'])
+            if entry is not None and field in entry:
+                category[field] = entry[field]
+            else:
+                pending.append(category)
+
+        if len(pending) < len(categories):
+            logger.info(f"♻️ Reanudando: {len(categories) - len(pending)} categorías restauradas, "
+                        f"{len(pending)} pendientes")
+        return pending
+
+    def close(self):
+        """Cierra el archivo del diario"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
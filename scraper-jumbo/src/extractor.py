@@ -3,18 +3,104 @@ Módulo Extractor - Extracción de categorías y filtros
 """
 
 import re
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
-from config import get_logger
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union
+from config import get_config, get_logger
+from html_parser import parse_html
+from rules import get_rules, CategoryRules
 
 
 logger = get_logger()
 
 
+# Filtros base que siempre deben estar presentes
+BASE_FILTERS = ['Categoría', 'Sub-Categoría', 'Tipo de Producto']
+
+# Scripts embebidos con filtros (método 3) y patrones de los nombres dentro de ellos
+SCRIPT_FILTER_HINT = re.compile(r'filter|facet')
+SCRIPT_FILTER_PATTERNS = [
+    r'"name"\s*:\s*"([^"]+)"',
+    r'filters.*?"([^"]+)"',
+    r'facets.*?"([^"]+)"'
+]
+
+# Enlaces candidatos a categoría: rutas relativas del sitio
+CATEGORY_HREF_PATTERN = re.compile(r'^/[a-z-]+')
+
+# Contenedores de menú, en el orden de prioridad de la estrategia 2
+MENU_CLASS_NEEDLES = ('menu', 'nav', 'category')
+MENU_RANK_NAV_TAG = len(MENU_CLASS_NEEDLES)
+MENU_RANK_NAVIGATION_ROLE = MENU_RANK_NAV_TAG + 1
+
+
+def _menu_rank(element) -> Optional[int]:
+    """
+    Prioridad del elemento como contenedor de menú (None si no lo es)
+
+    0-2: clase que contiene 'menu', 'nav' o 'category'; 3: etiqueta nav;
+    4: role="navigation".
+    """
+    classes = element.get('class') if hasattr(element, 'get') else None
+    class_attr = ' '.join(classes) if isinstance(classes, list) else (classes or '')
+
+    for rank, needle in enumerate(MENU_CLASS_NEEDLES):
+        if needle in class_attr:
+            return rank
+    if element.name == 'nav':
+        return MENU_RANK_NAV_TAG
+    if hasattr(element, 'get') and element.get('role') == 'navigation':
+        return MENU_RANK_NAVIGATION_ROLE
+    return None
+
+
+def _ancestor_menu_rank(element, cache: Dict[int, Optional[int]]) -> Optional[int]:
+    """
+    Mejor prioridad de menú entre los ancestros del elemento
+
+    Memoiza por elemento, así cada nodo del documento se evalúa una sola vez.
+    """
+    pending = []
+    node = element.parent
+    while node is not None and id(node) not in cache:
+        pending.append(node)
+        node = node.parent
+
+    rank = cache[id(node)] if node is not None else None
+    for node in reversed(pending):
+        own = _menu_rank(node)
+        rank = own if rank is None else (rank if own is None else min(rank, own))
+        cache[id(node)] = rank
+
+    return rank
+
+
+def _is_category_link(href: str, text: str, rules: CategoryRules) -> bool:
+    """Filtros de la estrategia 1 (enlaces en toda la página)"""
+    return (len(href) > 3 and
+            not href.startswith(('http', 'javascript:', '#', 'mailto:')) and
+            len(text) > 2 and
+            len(text) < 50 and  # Evitar textos muy largos (productos)
+            not rules.href_exclude.matches(href) and
+            not rules.text_exclude.matches(text))
+
+
+def _is_menu_link(href: str, text: str, rules: CategoryRules) -> bool:
+    """Filtros de la estrategia 2 (enlaces dentro de elementos de menú)"""
+    return (len(text) > 2 and len(text) < 50 and
+            not rules.menu_href_exclude.matches(href))
+
+
 def extract_categories(html_content: str) -> List[Dict[str, Any]]:
     """
     Extrae las categorías principales de la página de Jumbo
 
+    Recorre los enlaces una sola vez. Primero van los enlaces que pasan los
+    filtros generales (estrategia 1), en orden de documento; luego los que
+    solo pasan los filtros de menú (estrategia 2), ordenados por tipo de
+    contenedor y posición. Los duplicados se descartan por URL.
+
     Args:
         html_content (str): Contenido HTML de la página principal
 
@@ -27,76 +113,218 @@ def extract_categories(html_content: str) -> List[Dict[str, Any]]:
         logger.warning("⚠️ Contenido HTML vacío")
         return []
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html(html_content)
+    rules = get_rules()
     categories = []
+    seen_urls = set()
+    menu_candidates = []
+    rank_cache: Dict[int, Optional[int]] = {}
 
-    # Estrategia 1: Buscar todos los enlaces que podrían ser categorías
-    all_links = soup.find_all('a', href=re.compile(r'^/[a-z-]+'))
-
-    for link in all_links:
+    for position, link in enumerate(soup.find_all('a', href=CATEGORY_HREF_PATTERN)):
         href = link.get('href')
+        if not href:
+            continue
         text = link.get_text().strip()
+        full_url = f"https://www.jumbo.com.ar{href}"
 
-        # Filtros para identificar categorías válidas
-        if (href and
-            len(href) > 3 and
-            not href.startswith(('http', 'javascript:', '#', 'mailto:')) and
-            len(text) > 2 and
-            len(text) < 50 and  # Evitar textos muy largos (productos)
-            not any(word in href.lower() for word in ['login', 'carrito', 'ofertas', 'novedades', 'ayuda', 'contacto', 'sucursales', 'entrega', 'actualiza', 'descuentos']) and
-            not any(word in text.lower() for word in ['ver', 'click', 'comprar', 'precio', 'regular', 'producto', 'descuentos', 'sucursal', 'entrega', 'actualiza'])):
-
-            full_url = f"https://www.jumbo.com.ar{href}"
-
-            # Evitar duplicados por URL
-            if not any(cat['url'] == full_url for cat in categories):
+        # Estrategia 1: enlaces que parecen categorías en cualquier parte
+        if _is_category_link(href, text, rules):
+            if full_url not in seen_urls:
+                seen_urls.add(full_url)
                 categories.append({
                     'name': text,
                     'url': full_url,
                     'filters': []
                 })
+            continue
+
+        # Estrategia 2: enlaces dentro de elementos de menú / navegación
+        if _is_menu_link(href, text, rules):
+            rank = _ancestor_menu_rank(link, rank_cache)
+            if rank is not None:
+                menu_candidates.append((rank, position, text, full_url))
+
+    menu_candidates.sort(key=lambda candidate: candidate[:2])
+    for _, _, text, full_url in menu_candidates:
+        if full_url not in seen_urls:
+            seen_urls.add(full_url)
+            categories.append({
+                'name': text,
+                'url': full_url,
+                'filters': []
+            })
+
+    logger.info(f"📋 Encontradas {len(categories)} categorías potenciales")
+    return categories
 
-    # Estrategia 2: Buscar en elementos específicos de menú
-    menu_selectors = [
-        ('[class*="menu"]', 'Elementos de menú'),
-        ('[class*="nav"]', 'Elementos de navegación'),
-        ('[class*="category"]', 'Elementos de categoría'),
-        ('nav', 'Etiquetas nav'),
-        ('[role="navigation"]', 'Role navigation')
-    ]
 
-    for selector, description in menu_selectors:
-        try:
-            menu_elements = soup.select(selector)
-            for menu_elem in menu_elements:
-                links = menu_elem.find_all('a', href=re.compile(r'^/[a-z-]+'))
-                for link in links:
-                    href = link.get('href')
-                    text = link.get_text().strip()
-
-                    if (href and len(text) > 2 and len(text) < 50 and
-                        not any(word in href.lower() for word in ['login', 'carrito', 'ofertas', 'novedades', 'ayuda', 'contacto', 'sucursales', 'entrega'])):
-
-                        full_url = f"https://www.jumbo.com.ar{href}"
-
-                        # Evitar duplicados
-                        if not any(cat['url'] == full_url for cat in categories):
-                            categories.append({
-                                'name': text,
-                                'url': full_url,
-                                'filters': []
-                            })
-        except Exception as e:
-            logger.debug(f"Error buscando {description}: {e}")
-
-    logger.info(f"� Encontradas {len(categories)} categorías potenciales")
-    return categories
+class ExtractionStats:
+    """
+    Contadores por ejecución de la vía que dio los filtros de cada categoría
+
+    'html': página estática, 'api': facets de VTEX, 'browser': página
+    renderizada (cada categoría suma en una sola de estas). 'escalated'
+    cuenta además las categorías que en modo híbrido se renderizaron en el
+    navegador porque la vía estática devolvió solo los filtros base.
+    """
+
+    PATHS = ('html', 'api', 'browser', 'escalated')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Pone todos los contadores en cero"""
+        with self._lock:
+            self._counts = {path: 0 for path in self.PATHS}
+
+    def record(self, path: str):
+        """Suma una categoría resuelta por la vía indicada"""
+        with self._lock:
+            self._counts[path] = self._counts.get(path, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copia de los contadores actuales"""
+        with self._lock:
+            return dict(self._counts)
+
+    def summary(self) -> str:
+        """Resumen legible de los contadores"""
+        counts = self.snapshot()
+        return ', '.join(f"{path}: {counts.get(path, 0)}" for path in self.PATHS)
+
+
+# Contadores globales de la ejecución
+EXTRACTION_STATS = ExtractionStats()
+
+
+def get_extraction_stats() -> ExtractionStats:
+    """Obtiene los contadores de vías de extracción de la ejecución"""
+    return EXTRACTION_STATS
+
+
+# Orígenes de filtros que parten del HTML de la página (--async y --pipeline lo
+# descargan antes): hybrid lo usa como vía estática y escala al navegador
+DOWNLOADED_PAGE_SOURCES = ('html', 'hybrid')
+
+
+def filters_look_incomplete(filters: Optional[List[str]]) -> bool:
+    """Indica si solo se obtuvieron los filtros base (o ninguno)"""
+    return not filters or len(filters) <= len(BASE_FILTERS)
+
+
+def find_unchanged_filters(content: Optional[Union[str, bytes]], category_url: str,
+                           encoding: Optional[str] = None,
+                           scope: Optional[str] = None) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Busca los filtros de la ejecución anterior si el contenido no cambió (modo incremental)
+
+    Args:
+        content (Optional[Union[str, bytes]]): Página o payload descargado
+        category_url (str): URL de la categoría
+        encoding (str, optional): Charset de los bytes
+        scope (str, optional): Alcance de la huella (default: incremental.scope)
+
+    Returns:
+        Tuple[Optional[List[str]], Optional[str]]: Filtros reutilizables (o None)
+        y la huella del contenido (None si el modo incremental está deshabilitado)
+    """
+    from fingerprints import get_fingerprint_store
+
+    store = get_fingerprint_store()
+    if store is None or not content:
+        return None, None
+
+    fingerprint = store.fingerprint(content, encoding=encoding, scope=scope)
+    filters = store.lookup(category_url, fingerprint, _fingerprint_producer())
+    if filters is not None:
+        logger.info(f"♻️ {category_url} sin cambios, se reutilizan {len(filters)} filtros")
+    return filters, fingerprint
+
+
+def remember_filters(category_url: str, fingerprint: Optional[str], filters: Optional[List[str]]):
+    """Guarda los filtros extraídos bajo la huella del contenido (si hay huella y filtros)"""
+    from fingerprints import get_fingerprint_store
+
+    store = get_fingerprint_store()
+    if store is not None and fingerprint is not None and filters:
+        store.update(category_url, fingerprint, filters, _fingerprint_producer())
+
+
+def _fingerprint_producer() -> str:
+    """Productor de las huellas: este parser con el filter_source configurado"""
+    return f"extractor/{get_config().get('filter_source', 'html')}"
+
+
+def _extract_filters_static(scraper, category_url: str, source: str) -> Tuple[List[str], str, Optional[str]]:
+    """
+    Extrae los filtros por HTTP, sin navegador
+
+    Args:
+        scraper: Instancia del JumboScraper
+        category_url (str): URL de la categoría
+        source (str): 'vtex_api' (con el HTML como fallback) o 'html'
+
+    Returns:
+        Tuple[List[str], str, Optional[str]]: Filtros, vía que los obtuvo ('api'
+        o 'html') y huella del contenido (None sin modo incremental)
+    """
+    # Estrategia API: facets JSON de VTEX, con el HTML como fallback
+    if source == 'vtex_api':
+        from vtex_api import fetch_facets_payload, parse_facets_payload, log_api_filters
+
+        payload = fetch_facets_payload(scraper, category_url)
+        if payload is not None:
+            # La huella del payload completo: el JSON de facets no trae tokens por request
+            content = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+            filters, fingerprint = find_unchanged_filters(content, category_url, scope='page')
+            if filters is None:
+                filters = parse_facets_payload(payload)
+                remember_filters(category_url, fingerprint, filters)
+            if filters is not None:
+                log_api_filters(category_url, filters)
+                return filters, 'api', fingerprint
+        logger.info(f"↩️ API de facets sin datos para {category_url}, usando HTML")
+
+    # Obtener contenido de la página de categoría
+    html_content = scraper.get_page(category_url)
+
+    filters, fingerprint = _parse_filters_incremental(html_content, category_url)
+    return filters, 'html', fingerprint
+
+
+def _extract_filters_rendered_incremental(scraper, category_url: str) -> List[str]:
+    """
+    Extrae los filtros de la página renderizada, salvo que la página no haya cambiado
+
+    Con el modo incremental la huella se toma de la página servida por HTTP
+    (una request, sin navegador): si coincide con la anterior se reutilizan
+    los filtros renderizados entonces y no se abre el navegador.
+    """
+    from browser_pool import extract_filters_rendered
+
+    fingerprint = None
+    if get_config().get('incremental', {}).get('enabled'):
+        filters, fingerprint = find_unchanged_filters(scraper.get_page(category_url), category_url)
+        if filters is not None:
+            return filters
+
+    filters = extract_filters_rendered(category_url)
+    remember_filters(category_url, fingerprint, filters)
+    return filters
 
 
 def extract_filters_from_category(scraper, category_url: str) -> List[str]:
     """
     Extrae los filtros de una categoría específica
 
+    Según filter_source usa el HTML de la página ('html'), el endpoint
+    de facets de VTEX ('vtex_api', con el HTML como fallback), la página
+    renderizada en el pool de navegadores headless ('browser'), o primero
+    la vía estática de hybrid_static_source y el navegador solo si el
+    resultado parece incompleto ('hybrid').
+
     Args:
         scraper: Instancia del JumboScraper
         category_url (str): URL de la categoría
@@ -106,18 +334,127 @@ def extract_filters_from_category(scraper, category_url: str) -> List[str]:
     """
     logger.info(f"🔍 Extrayendo filtros de: {category_url}")
 
-    # Obtener contenido de la página de categoría
-    html_content = scraper.get_page(category_url)
+    config = get_config()
+    filter_source = config.get('filter_source', 'html')
+
+    # Estrategia navegador: panel de filtros renderizado en el cliente
+    if filter_source == 'browser':
+        EXTRACTION_STATS.record('browser')
+        return _extract_filters_rendered_incremental(scraper, category_url)
+
+    if filter_source != 'hybrid':
+        filters, path, _ = _extract_filters_static(scraper, category_url, filter_source)
+        EXTRACTION_STATS.record(path)
+        return filters
+
+    # Estrategia híbrida: HTTP primero, navegador solo para las páginas difíciles
+    filters, path, fingerprint = _extract_filters_static(scraper, category_url,
+                                                         config.get('hybrid_static_source', 'vtex_api'))
+    filters, path = escalate_incomplete_filters(category_url, filters, path, fingerprint)
+
+    EXTRACTION_STATS.record(path)
+    return filters
+
+
+def escalate_incomplete_filters(category_url: str, filters: List[str], path: str,
+                                fingerprint: Optional[str] = None) -> Tuple[List[str], str]:
+    """
+    Estrategia híbrida: renderiza la página si la vía estática solo dio los filtros base
+
+    Args:
+        category_url (str): URL de la categoría
+        filters (List[str]): Filtros obtenidos por la vía estática
+        path (str): Vía estática que los obtuvo ('html' o 'api')
+        fingerprint (str, optional): Huella del contenido estático (modo incremental)
+
+    Returns:
+        Tuple[List[str], str]: Filtros finales y vía que los obtuvo
+    """
+    if not filters_look_incomplete(filters):
+        return filters, path
+
+    from browser_pool import extract_filters_rendered
+
+    logger.info(f"🧭 Solo filtros base para {category_url}, renderizando en el navegador")
+    EXTRACTION_STATS.record('escalated')
+    rendered = extract_filters_rendered(category_url)
+    if len(rendered) > len(filters):
+        filters, path = rendered, 'browser'
+        # Con la misma página estática, la próxima ejecución reutiliza el resultado renderizado
+        remember_filters(category_url, fingerprint, filters)
+    return filters, path
+
+
+def extract_filters_from_page(html_content: Optional[Union[str, bytes]], category_url: str,
+                              encoding: Optional[str] = None) -> List[str]:
+    """
+    Extrae los filtros de una página ya descargada (--async)
+
+    Con filter_source hybrid la página descargada es la vía estática y se
+    escala al navegador igual que en extract_filters_from_category.
+
+    Args:
+        html_content (Optional[Union[str, bytes]]): Contenido HTML de la categoría
+        category_url (str): URL de la categoría
+        encoding (str, optional): Charset declarado, si el contenido son bytes
+
+    Returns:
+        List[str]: Lista de nombres de filtros
+    """
+    filters, fingerprint = _parse_filters_incremental(html_content, category_url, encoding)
+    path = 'html'
+    if get_config().get('filter_source', 'html') == 'hybrid':
+        filters, path = escalate_incomplete_filters(category_url, filters, path, fingerprint)
+
+    EXTRACTION_STATS.record(path)
+    return filters
+
 
+def _parse_filters_incremental(html_content: Optional[Union[str, bytes]], category_url: str,
+                               encoding: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+    """
+    Parsea los filtros salvo que la página sea idéntica a la de la ejecución anterior
+
+    Con incremental.enabled se compara la huella de la región de filtros con
+    la guardada; si coincide se reutilizan los filtros anteriores sin parsear.
+
+    Args:
+        html_content (Optional[Union[str, bytes]]): Contenido HTML de la categoría
+        category_url (str): URL de la categoría
+        encoding (str, optional): Charset declarado, si el contenido son bytes
+
+    Returns:
+        Tuple[List[str], Optional[str]]: Filtros y huella de la página
+    """
+    filters, fingerprint = find_unchanged_filters(html_content, category_url, encoding)
+    if filters is None:
+        filters = parse_filters_from_html(html_content, category_url, encoding)
+        remember_filters(category_url, fingerprint, filters)
+    return filters, fingerprint
+
+
+def parse_filters_from_html(html_content: Optional[Union[str, bytes]], category_url: str,
+                            encoding: Optional[str] = None) -> List[str]:
+    """
+    Extrae los filtros del HTML ya descargado de una categoría
+
+    Args:
+        html_content (Optional[Union[str, bytes]]): Contenido HTML de la categoría
+        category_url (str): URL de la categoría (para logging)
+        encoding (str, optional): Charset declarado por el servidor, si el contenido son bytes
+
+    Returns:
+        List[str]: Lista de nombres de filtros
+    """
     if not html_content:
         logger.warning(f"⚠️ No se pudo obtener contenido de {category_url}")
         return []
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html(html_content, from_encoding=encoding)
     filters = []
 
     # Filtros base que siempre deben estar presentes
-    base_filters = ['Categoría', 'Sub-Categoría', 'Tipo de Producto']
+    base_filters = BASE_FILTERS
 
     # Buscar elementos que contengan filtros
     # Jumbo puede usar diferentes selectores
@@ -154,17 +491,11 @@ def extract_filters_from_category(scraper, category_url: str) -> List[str]:
                 filters.append(text)
 
     # Método 3: Buscar en scripts embebidos (JSON con filtros)
-    scripts = soup.find_all('script', string=re.compile(r'filter|facet'))
+    scripts = soup.find_all('script', string=SCRIPT_FILTER_HINT)
     for script in scripts:
         if script.string:
             # Buscar patrones de filtros en JavaScript
-            filter_patterns = [
-                r'"name"\s*:\s*"([^"]+)"',
-                r'filters.*?"([^"]+)"',
-                r'facets.*?"([^"]+)"'
-            ]
-
-            for pattern in filter_patterns:
+            for pattern in SCRIPT_FILTER_PATTERNS:
                 matches = re.findall(pattern, script.string, re.IGNORECASE)
                 for match in matches:
                     if (len(match) > 2 and
@@ -173,6 +504,24 @@ def extract_filters_from_category(scraper, category_url: str) -> List[str]:
                         match not in filters):
                         filters.append(match)
 
+    all_filters = finalize_filters(filters)
+
+    logger.info(f"✅ Extraídos {len(all_filters) - len(BASE_FILTERS)} filtros específicos de {category_url}")
+    return all_filters
+
+
+def finalize_filters(filters: List[str]) -> List[str]:
+    """
+    Limpia, valida y ordena los filtros encontrados
+
+    Args:
+        filters (List[str]): Nombres de filtros sin procesar
+
+    Returns:
+        List[str]: Filtros base seguidos de los filtros específicos únicos y ordenados
+    """
+    base_filters = list(BASE_FILTERS)
+
     # Limpiar y validar filtros
     cleaned_filters = []
     for f in filters:
@@ -187,10 +536,79 @@ def extract_filters_from_category(scraper, category_url: str) -> List[str]:
     unique_filters = list(set(cleaned_filters))
     unique_filters.sort()
 
-    all_filters = base_filters + unique_filters
+    return base_filters + unique_filters
 
-    logger.info(f"✅ Extraídos {len(unique_filters)} filtros específicos de {category_url}")
-    return all_filters
+
+def extract_filters_from_categories(scraper, categories: List[Dict[str, Any]],
+                                    workers: int = 1,
+                                    use_async: bool = False,
+                                    journal=None) -> List[Dict[str, Any]]:
+    """
+    Extrae los filtros de varias categorías, opcionalmente en paralelo
+
+    Los workers comparten la sesión del scraper, que limita las requests
+    simultáneas por host. El orden de las categorías se conserva.
+
+    Args:
+        scraper: Instancia del JumboScraper
+        categories (List[Dict[str, Any]]): Categorías con 'name' y 'url'
+        workers (int): Cantidad de categorías procesadas en paralelo
+        use_async (bool): Descargar todas las páginas con AsyncJumboScraper
+        journal (CheckpointJournal, optional): Diario donde se registra cada
+            categoría terminada; las ya registradas no se vuelven a procesar
+
+    Returns:
+        List[Dict[str, Any]]: Las mismas categorías con 'filters' completado
+    """
+    pending = journal.restore(categories) if journal is not None else categories
+    total = len(pending)
+
+    def checkpoint(category):
+        # Sin filtros (ni siquiera los base) la descarga o el renderizado fallaron:
+        # la categoría no se registra, así --resume la vuelve a intentar
+        if journal is None:
+            return
+        if not category['filters']:
+            logger.warning(f"⚠️ {category['name']} sin filtros, no se registra en el checkpoint")
+            return
+        journal.record(category['url'], name=category['name'], filters=category['filters'])
+
+    filter_source = get_config().get('filter_source', 'html')
+    if use_async and filter_source not in DOWNLOADED_PAGE_SOURCES:
+        logger.warning(f"⚠️ --async descarga el HTML de las páginas y no aplica a filter_source "
+                       f"{filter_source}, se procesa cada categoría con el cliente síncrono")
+        use_async = False
+
+    pages = None
+    if use_async:
+        from async_scraper import fetch_pages
+
+        # Descarga de todas las páginas; el parseo (y el escalado híbrido) sigue abajo
+        pages = fetch_pages([category['url'] for category in pending])
+
+    def process(indexed_category):
+        i, category = indexed_category
+        logger.info(f"🔍 Procesando categoría {i}/{total}: {category['name']}")
+        if pages is not None:
+            category['filters'] = extract_filters_from_page(pages[i - 1], category['url'])
+        else:
+            category['filters'] = extract_filters_from_category(scraper, category['url'])
+        checkpoint(category)
+        logger.info(f"✅ Extraídos {len(category['filters'])} filtros para {category['name']}")
+
+    indexed = list(enumerate(pending, 1))
+
+    if workers <= 1:
+        for item in indexed:
+            process(item)
+    else:
+        logger.info(f"⚡ Procesando {total} categorías con {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Cada worker completa su propia categoría; list() propaga errores
+            list(executor.map(process, indexed))
+
+    logger.info(f"📊 Vías de extracción: {EXTRACTION_STATS.summary()}")
+    return categories
 
 
 def validate_category_url(url: str) -> bool:
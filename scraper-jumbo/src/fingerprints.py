@@ -0,0 +1,232 @@
+"""
+Módulo Fingerprints - Re-scraping incremental por huella de contenido
+
+Guarda, por categoría, una huella (SHA-256) de la página descargada junto
+con los filtros que se extrajeron de ella. En la ejecución siguiente, si
+la huella no cambió se reutilizan esos filtros sin volver a parsear el HTML.
+
+Por defecto la huella cubre solo la región de filtros: lo que leen los
+parsers (texto, etiquetas con su class / data-filter y los valores que se
+toman de los scripts de facets). Los tokens por request que VTEX agrega a
+cada página (nonces, ids de request, hashes del runtime) quedan afuera.
+"""
+
+import json
+import os
+import re
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
+from config import get_config, get_logger, get_project_root
+from extractor import SCRIPT_FILTER_HINT, SCRIPT_FILTER_PATTERNS
+
+
+FINGERPRINT_SCOPES = ('region', 'page')
+
+_SCRIPT_PATTERN = re.compile(r'<script\b[^>]*>(.*?)</script\s*>', re.S | re.I)
+_IGNORED_MARKUP_PATTERN = re.compile(r'<style\b[^>]*>.*?</style\s*>|<!--.*?-->', re.S | re.I)
+_TAG_PATTERN = re.compile(r'<\s*(/?)\s*([a-zA-Z][\w-]*)([^>]*)>')
+_CLASS_PATTERN = re.compile(r'\bclass\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+)', re.I)
+_DATA_FILTER_PATTERN = re.compile(r'\bdata-filter\b', re.I)
+
+
+def filter_region(content: Union[str, bytes], encoding: Optional[str] = None) -> bytes:
+    """
+    Reduce la página a lo que leen los parsers de filtros
+
+    Conserva el texto, cada etiqueta con su nombre, class y data-filter, y
+    de los scripts que mencionan filtros/facets solo los valores que extrae
+    parse_filters_from_html. Se descartan el resto de los atributos, los
+    demás scripts, los estilos y los comentarios.
+
+    Args:
+        content (Union[str, bytes]): Página descargada
+        encoding (str, optional): Charset de los bytes (default: utf-8)
+
+    Returns:
+        bytes: Región de filtros normalizada
+    """
+    text = content.decode(encoding or 'utf-8', errors='replace') if isinstance(content, bytes) else content
+    script_values = []
+
+    def keep_script_values(match):
+        body = match.group(1)
+        if SCRIPT_FILTER_HINT.search(body):
+            for pattern in SCRIPT_FILTER_PATTERNS:
+                script_values.extend(re.findall(pattern, body, re.IGNORECASE))
+        return ''
+
+    def reduce_tag(match):
+        closing, name, attributes = match.groups()
+        if closing:
+            return f'</{name.lower()}>'
+        parts = [name.lower()]
+        class_attr = _CLASS_PATTERN.search(attributes)
+        if class_attr:
+            parts.append('class=' + class_attr.group(1).strip('"\''))
+        if _DATA_FILTER_PATTERN.search(attributes):
+            parts.append('data-filter')
+        return '<' + ' '.join(parts) + '>'
+
+    text = _SCRIPT_PATTERN.sub(keep_script_values, text)
+    text = _IGNORED_MARKUP_PATTERN.sub('', text)
+    text = ' '.join(_TAG_PATTERN.sub(reduce_tag, text).split())
+    return '\n'.join([text] + script_values).encode('utf-8')
+
+
+def content_fingerprint(content: Union[str, bytes], strip_patterns: Optional[List[re.Pattern]] = None,
+                        scope: str = 'page', encoding: Optional[str] = None) -> str:
+    """
+    Calcula la huella de una página
+
+    Args:
+        content (Union[str, bytes]): Contenido de la página
+        strip_patterns (List[re.Pattern], optional): Fragmentos volátiles a
+            ignorar (tokens, timestamps), como patrones de bytes
+        scope (str): 'page' (contenido completo) o 'region' (solo la región de filtros)
+        encoding (str, optional): Charset de los bytes (solo para 'region')
+
+    Returns:
+        str: SHA-256 en hexadecimal
+    """
+    if scope == 'region':
+        body = filter_region(content, encoding)
+    else:
+        body = content.encode('utf-8') if isinstance(content, str) else content
+    for pattern in strip_patterns or []:
+        body = pattern.sub(b'', body)
+    return hashlib.sha256(body).hexdigest()
+
+
+class FingerprintStore:
+    """
+    Huellas y filtros de la ejecución anterior, indexados por productor y URL
+
+    Cada productor (herramienta + origen de filtros, ej. 'extractor/hybrid')
+    tiene sus propias entradas: los filtros de un parser o de una vía no se
+    reutilizan en otra. Se carga completo al iniciar y se reescribe de forma
+    atómica con save(). Cuenta cuántas categorías se reutilizaron y cuántas
+    se re-extrajeron, una vez por categoría.
+    """
+
+    def __init__(self, path, strip_patterns: Optional[List[str]] = None, scope: str = 'region'):
+        if scope not in FINGERPRINT_SCOPES:
+            raise ValueError(f"incremental.scope debe ser uno de {FINGERPRINT_SCOPES}: {scope!r}")
+        self.path = Path(path)
+        self.scope = scope
+        self.strip_patterns = [re.compile(pattern.encode('utf-8')) for pattern in strip_patterns or []]
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._reused_keys = set()
+        self._extracted_keys = set()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['FingerprintStore']:
+        """Crea el almacén desde la sección incremental (None si está deshabilitado)"""
+        settings = config.get('incremental') or {}
+        if not settings.get('enabled', False):
+            return None
+
+        path = Path(settings.get('path', 'cache/fingerprints.json'))
+        if not path.is_absolute():
+            path = get_project_root() / path
+
+        return cls(path, strip_patterns=settings.get('strip_patterns'),
+                   scope=settings.get('scope', 'region'))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"⚠️ No se pudieron leer las huellas de {self.path}: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def fingerprint(self, content: Union[str, bytes], encoding: Optional[str] = None,
+                    scope: Optional[str] = None) -> str:
+        """Huella del contenido con el alcance y los patrones volátiles configurados"""
+        return content_fingerprint(content, self.strip_patterns, scope or self.scope, encoding)
+
+    @property
+    def reused(self) -> int:
+        """Categorías reutilizadas sin cambios en esta ejecución"""
+        return len(self._reused_keys)
+
+    @property
+    def extracted(self) -> int:
+        """Categorías re-extraídas en esta ejecución"""
+        return len(self._extracted_keys)
+
+    @staticmethod
+    def _key(url: str, producer: Optional[str]) -> str:
+        return f"{producer} {url}" if producer else url
+
+    def lookup(self, url: str, fingerprint: str, producer: Optional[str] = None) -> Optional[List[str]]:
+        """
+        Obtiene los filtros anteriores si la página no cambió
+
+        Args:
+            url (str): URL de la categoría
+            fingerprint (str): Huella de la página actual
+            producer (str, optional): Herramienta y origen de filtros que los extrajo
+
+        Returns:
+            Optional[List[str]]: Filtros reutilizables, o None si hay que re-extraer
+        """
+        key = self._key(url, producer)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get('fingerprint') != fingerprint:
+                return None
+            if key not in self._extracted_keys:
+                self._reused_keys.add(key)
+            return list(entry['filters'])
+
+    def update(self, url: str, fingerprint: str, filters: List[str], producer: Optional[str] = None):
+        """Registra la huella y los filtros recién extraídos de una categoría"""
+        key = self._key(url, producer)
+        with self._lock:
+            self._entries[key] = {
+                'fingerprint': fingerprint,
+                'filters': list(filters),
+                'updated_at': time.time()
+            }
+            # Una categoría re-extraída (ej. escalada al navegador) cuenta una sola vez
+            self._reused_keys.discard(key)
+            self._extracted_keys.add(key)
+
+    def summary(self) -> str:
+        """Resumen de la ejecución: categorías reutilizadas y re-extraídas"""
+        return f"{self.reused} reutilizadas sin cambios, {self.extracted} re-extraídas"
+
+    def save(self):
+        """Escribe las huellas en disco (archivo temporal + reemplazo atómico)"""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+
+# Almacén global compartido por todos los workers del proceso
+FINGERPRINT_STORE = None
+_FINGERPRINT_STORE_LOADED = False
+_FINGERPRINT_STORE_LOCK = threading.Lock()
+
+
+def get_fingerprint_store() -> Optional[FingerprintStore]:
+    """Obtiene el almacén global (None si incremental.enabled es false)"""
+    global FINGERPRINT_STORE, _FINGERPRINT_STORE_LOADED
+
+    with _FINGERPRINT_STORE_LOCK:
+        if not _FINGERPRINT_STORE_LOADED:
+            FINGERPRINT_STORE = FingerprintStore.from_config(get_config())
+            _FINGERPRINT_STORE_LOADED = True
+    return FINGERPRINT_STORE
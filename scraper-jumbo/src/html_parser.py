@@ -0,0 +1,56 @@
+"""
+Módulo HTML Parser - Backend de parseo HTML configurable
+"""
+
+from functools import lru_cache
+from typing import Optional, Union
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from config import get_config, get_logger
+
+
+DEFAULT_PARSER = 'html.parser'
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(requested: Optional[str] = None) -> str:
+    """
+    Resuelve el backend de BeautifulSoup a usar
+
+    Usa el backend configurado en html_parser: 'lxml' (default, el más
+    rápido), 'html.parser' o 'html5lib' (el más lento, tolerante como un
+    navegador); si no está instalado se usa html.parser.
+
+    Args:
+        requested (str, optional): Backend pedido (default: config html_parser)
+
+    Returns:
+        str: Nombre del backend disponible
+    """
+    if requested is None:
+        requested = get_config().get('html_parser', DEFAULT_PARSER)
+
+    if builder_registry.lookup(requested) is None:
+        get_logger().warning(f"⚠️ Parser HTML '{requested}' no disponible, usando '{DEFAULT_PARSER}'")
+        return DEFAULT_PARSER
+
+    return requested
+
+
+def parse_html(html_content: Union[str, bytes], parser: Optional[str] = None,
+               from_encoding: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parsea HTML con el backend configurado
+
+    Args:
+        html_content (Union[str, bytes]): Contenido HTML
+        parser (str, optional): Backend a usar en lugar del configurado
+        from_encoding (str, optional): Charset declarado por el servidor (solo
+            para bytes; sin él BeautifulSoup lo adivina)
+
+    Returns:
+        BeautifulSoup: Documento parseado
+    """
+    if from_encoding and isinstance(html_content, bytes):
+        return BeautifulSoup(html_content, resolve_parser(parser), from_encoding=from_encoding)
+    return BeautifulSoup(html_content, resolve_parser(parser))
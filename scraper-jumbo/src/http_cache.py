@@ -0,0 +1,186 @@
+"""
+Módulo HTTP Cache - Cache persistente en disco con revalidación condicional
+"""
+
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any
+from config import get_config, get_logger, get_project_root
+
+
+@dataclass
+class CacheEntry:
+    """Respuesta almacenada en el cache"""
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def text(self) -> str:
+        """Contenido decodificado de la respuesta"""
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class HttpCache:
+    """
+    Cache HTTP persistente en SQLite, indexado por URL
+
+    Las entradas dentro del TTL se sirven sin red; las vencidas se revalidan
+    con If-None-Match / If-Modified-Since. Al superar el tamaño máximo se
+    eliminan las entradas usadas hace más tiempo (LRU).
+    """
+
+    def __init__(self, path, ttl_seconds: float = 86400, max_size_mb: float = 200):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['HttpCache']:
+        """Crea el cache desde la sección http_cache (None si está deshabilitado)"""
+        settings = config.get('http_cache') or {}
+        if not settings.get('enabled', False):
+            return None
+
+        path = Path(settings.get('path', 'cache/http_cache.sqlite'))
+        if not path.is_absolute():
+            path = get_project_root() / path
+
+        return cls(
+            path,
+            ttl_seconds=settings.get('ttl_seconds', 86400),
+            max_size_mb=settings.get('max_size_mb', 200)
+        )
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Obtiene la entrada de una URL y la marca como usada
+
+        Args:
+            url (str): URL de la request
+
+        Returns:
+            Optional[CacheEntry]: Entrada almacenada o None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, encoding, etag, last_modified, stored_at FROM entries WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+        return CacheEntry(*row)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Indica si la entrada puede servirse sin revalidar"""
+        return time.time() - entry.stored_at < self.ttl_seconds
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        """Headers para revalidar la entrada con el servidor"""
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: bytes, encoding: Optional[str] = None,
+              etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Guarda una respuesta y aplica el límite de tamaño
+
+        Args:
+            url (str): URL de la request
+            body (bytes): Cuerpo de la respuesta
+            encoding (str, optional): Charset del cuerpo
+            etag (str, optional): Header ETag
+            last_modified (str, optional): Header Last-Modified
+        """
+        if len(body) > self.max_size_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, encoding, etag, last_modified, now, now, len(body))
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """Renueva el TTL de una entrada revalidada (respuesta 304)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url)
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        """Elimina las entradas menos usadas hasta respetar el tamaño máximo"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        rows = self._conn.execute("SELECT url, size FROM entries ORDER BY accessed_at ASC").fetchall()
+        for url, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            total -= size
+            self.logger.debug(f"🗑️ Cache: eliminada entrada LRU {url}")
+
+    def close(self):
+        """Cierra la base de datos del cache"""
+        with self._lock:
+            self._conn.close()
+
+
+# Cache global compartido por todos los scrapers del proceso
+HTTP_CACHE = None
+_HTTP_CACHE_LOADED = False
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Obtiene el cache global (None si http_cache.enabled es false)"""
+    global HTTP_CACHE, _HTTP_CACHE_LOADED
+
+    with _HTTP_CACHE_LOCK:
+        if not _HTTP_CACHE_LOADED:
+            HTTP_CACHE = HttpCache.from_config(get_config())
+            _HTTP_CACHE_LOADED = True
+    return HTTP_CACHE
@@ -10,6 +10,14 @@ Uso:
     python main.py --test-connection
     python main.py --site-info
     python main.py --validate-content
+    python main.py --workers 8
+    python main.py --async
+    python main.py --pipeline
+    python main.py --filter-source hybrid
+    python main.py --resume
+    python main.py --incremental
+    python main.py --record grabaciones/2025-09-05
+    python main.py --replay grabaciones/2025-09-05
 """
 
 import sys
@@ -23,9 +31,14 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 from config import initialize_config, get_logger
-from scraper import JumboScraper
-from extractor import extract_categories, extract_filters_from_category
+from scraper import get_shared_scraper, close_shared_scraper
+from extractor import extract_categories, extract_filters_from_categories
 from generator import generate_markdown
+from pipeline import extract_filters_pipelined
+from browser_pool import close_browser_pool
+from checkpoint import CheckpointJournal
+from fingerprints import get_fingerprint_store
+from redirects import canonicalize_categories
 
 
 def parse_arguments():
@@ -62,6 +75,56 @@ def parse_arguments():
         help='Validar contenido del sitio web'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Cantidad de categorías procesadas en paralelo (default: config workers)'
+    )
+
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Descargar las categorías con el cliente asíncrono (aiohttp)'
+    )
+
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Descargar con threads y parsear en un pool de procesos (usa todos los núcleos)'
+    )
+
+    parser.add_argument(
+        '--filter-source',
+        choices=['html', 'vtex_api', 'browser', 'hybrid'],
+        help='Origen de los filtros (default: config filter_source); hybrid usa HTTP y '
+             'renderiza en el navegador solo las categorías con resultado incompleto'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Reutilizar los filtros de las categorías cuya página no cambió desde la ejecución anterior'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Reanudar la ejecución anterior: omitir las categorías ya registradas en el checkpoint'
+    )
+
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument(
+        '--record',
+        metavar='DIR',
+        help='Grabar todas las respuestas HTTP en DIR'
+    )
+    recording.add_argument(
+        '--replay',
+        metavar='DIR',
+        help='Reproducir las respuestas grabadas en DIR sin acceso a la red'
+    )
+
     return parser.parse_args()
 
 
@@ -101,9 +164,24 @@ def main():
         logger.setLevel(logging.DEBUG)
         logger.info("🔍 Modo verbose activado")
 
+    # Grabación / reproducción (antes de crear cualquier scraper)
+    if args.record:
+        config['record_dir'] = args.record
+        logger.info(f"📼 Grabando respuestas en: {args.record}")
+    if args.replay:
+        config['replay_dir'] = args.replay
+        logger.info(f"📼 Reproduciendo respuestas de: {args.replay}")
+    if args.filter_source:
+        config['filter_source'] = args.filter_source
+    if args.incremental:
+        config['incremental'] = {**(config.get('incremental') or {}), 'enabled': True}
+    if args.use_async and (config.get('record_dir') or config.get('replay_dir')):
+        logger.warning("⚠️ --async no soporta grabación/reproducción, se usa el cliente síncrono")
+        args.use_async = False
+
     # Crear instancia del scraper
     try:
-        scraper = JumboScraper()
+        scraper = get_shared_scraper()
         logger.info("🔧 Scraper inicializado correctamente")
     except Exception as e:
         logger.error(f"❌ Error al inicializar scraper: {e}")
@@ -132,6 +210,7 @@ def main():
             sys.exit(1)
 
     # Flujo principal de extracción
+    journal = None
     try:
         logger.info("🌐 Obteniendo página principal...")
 
@@ -151,15 +230,34 @@ def main():
 
         logger.info(f"📋 Encontradas {len(categories)} categorías")
 
-        # 3. Procesar cada categoría
-        for i, category in enumerate(categories, 1):
-            logger.info(f"🔍 Procesando categoría {i}/{len(categories)}: {category['name']}")
-
-            # Extraer filtros de la categoría
-            filters = extract_filters_from_category(scraper, category['url'])
-            category['filters'] = filters
+        # 3. Procesar cada categoría (cada una terminada queda en el checkpoint)
+        checkpoint_path = project_root / config.get('checkpoint_file', 'checkpoints/filters.jsonl')
+        journal = CheckpointJournal(checkpoint_path, resume=args.resume)
 
-            logger.info(f"✅ Extraídos {len(filters)} filtros para {category['name']}")
+        if args.pipeline:
+            extract_filters_pipelined(scraper, categories, io_workers=args.workers, journal=journal)
+        else:
+            workers = args.workers or config.get('workers', 1)
+            if config.get('filter_source') == 'browser' and not args.workers:
+                # Una categoría por navegador del pool
+                workers = max(workers, (config.get('browser') or {}).get('pool_size', 2))
+            extract_filters_from_categories(scraper, categories, workers=workers,
+                                            use_async=args.use_async, journal=journal)
+
+        # Guardar huellas para la próxima ejecución incremental
+        fingerprint_store = get_fingerprint_store()
+        if fingerprint_store is not None:
+            fingerprint_store.save()
+            logger.info(f"♻️ Modo incremental: {fingerprint_store.summary()}")
+
+        # Guardar las categorías con su URL canónica (sin redirecciones en la próxima ejecución);
+        # el mapa del scraper es None con --record / --replay, que no leen ni modifican el del disco
+        redirect_map = scraper.redirect_map
+        if redirect_map is not None:
+            rewritten = canonicalize_categories(categories, redirect_map)
+            redirect_map.save()
+            logger.info(f"↪️ {rewritten} URLs reescritas a su URL canónica "
+                        f"({len(redirect_map)} redirecciones conocidas)")
 
         # 4. Generar archivo Markdown
         logger.info("📝 Generando archivo Markdown...")
@@ -167,15 +265,21 @@ def main():
         generate_markdown(categories, str(output_path))
 
         logger.info(f"✅ Archivo generado: {output_path}")
+        logger.info(f"🔌 Conexiones: {scraper.connection_summary()}")
         logger.info("🎉 ¡Extracción completada exitosamente!")
 
     except KeyboardInterrupt:
-        logger.info("⏹️ Proceso interrumpido por el usuario")
+        logger.info("⏹️ Proceso interrumpido por el usuario (continuar con --resume)")
         sys.exit(1)
     except Exception as e:
         logger.error(f"❌ Error durante la extracción: {e}")
         logger.debug("Traceback completo:", exc_info=True)
         sys.exit(1)
+    finally:
+        if journal is not None:
+            journal.close()
+        close_browser_pool()
+        close_shared_scraper()
 
 
 if __name__ == "__main__":
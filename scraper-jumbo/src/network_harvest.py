@@ -0,0 +1,165 @@
+"""
+Módulo Network Harvest - Datos de VTEX desde el tráfico de red del navegador
+
+El storefront de VTEX obtiene categorías y facets como JSON (GraphQL de
+VTEX IO y endpoints del catálogo). Con el log de performance de Chrome
+activo se capturan esas respuestas de la página actual y se parsean de
+forma estructurada, sin recorrer el DOM renderizado.
+"""
+
+import base64
+import json
+from typing import List, Dict, Any, Optional
+from config import get_logger
+from extractor import finalize_filters
+from vtex_api import parse_facets_payload, category_tree_to_records
+
+
+logger = get_logger()
+
+# Capability de ChromeDriver que habilita driver.get_log('performance')
+PERFORMANCE_LOG_CAPABILITY = 'goog:loggingPrefs'
+
+# Facets que no son filtros específicos de la categoría
+GRAPHQL_SKIPPED_FACET_TYPES = {'PRICERANGE', 'CATEGORYTREE'}
+
+
+def enable_network_logging(options) -> None:
+    """
+    Activa el log de performance (eventos de red) en las opciones de Chrome
+
+    Args:
+        options: ChromeOptions de Selenium
+    """
+    options.set_capability(PERFORMANCE_LOG_CAPABILITY, {'performance': 'ALL'})
+
+
+def drain_network_log(driver) -> None:
+    """Descarta los eventos de red acumulados (por ejemplo, de la página anterior)"""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def _is_json_response(response: Dict[str, Any]) -> bool:
+    mime_type = (response.get('mimeType') or '').lower()
+    return 'json' in mime_type or '/graphql' in (response.get('url') or '')
+
+
+def harvest_json_responses(driver) -> List[Dict[str, Any]]:
+    """
+    Obtiene las respuestas JSON recibidas desde la última lectura del log
+
+    Args:
+        driver: WebDriver de Chrome iniciado con enable_network_logging
+
+    Returns:
+        List[Dict[str, Any]]: [{'url': url, 'payload': JSON decodificado}] en orden de llegada
+    """
+    responses = []
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        if message.get('method') != 'Network.responseReceived':
+            continue
+
+        params = message.get('params') or {}
+        response = params.get('response') or {}
+        if not _is_json_response(response):
+            continue
+
+        try:
+            result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params.get('requestId')})
+            body = result.get('body', '')
+            if result.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            payload = json.loads(body)
+        except Exception as e:
+            # El cuerpo ya no está disponible (redirect, preflight, respuesta descartada)
+            logger.debug(f"Sin cuerpo JSON para {response.get('url')}: {e}")
+            continue
+
+        responses.append({'url': response.get('url'), 'payload': payload})
+
+    logger.debug(f"📡 {len(responses)} respuestas JSON capturadas del tráfico de red")
+    return responses
+
+
+def _find_graphql_facets(payload: Any) -> Optional[List[Dict[str, Any]]]:
+    """Busca la lista de facets en una respuesta GraphQL (facets / facetsV2)"""
+    data = payload.get('data') if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        return None
+
+    for value in data.values():
+        facets = value.get('facets') if isinstance(value, dict) else None
+        if isinstance(facets, list) and all(isinstance(facet, dict) for facet in facets):
+            return facets
+    return None
+
+
+def parse_graphql_facets(payload: Any) -> Optional[List[str]]:
+    """
+    Obtiene los nombres de filtros de una respuesta GraphQL de facets de VTEX IO
+
+    Args:
+        payload: JSON de la respuesta GraphQL
+
+    Returns:
+        Optional[List[str]]: Filtros base + específicos, o None si no hay facets
+    """
+    facets = _find_graphql_facets(payload)
+    if facets is None:
+        return None
+
+    filters = []
+    for facet in facets:
+        name = (facet.get('name') or '').strip()
+        if (name and facet.get('values') and not facet.get('hidden') and
+                facet.get('type') not in GRAPHQL_SKIPPED_FACET_TYPES and
+                'precio' not in name.lower()):
+            filters.append(name)
+
+    return finalize_filters(filters)
+
+
+def _is_category_tree(payload: Any) -> bool:
+    return (isinstance(payload, list) and bool(payload) and
+            all(isinstance(node, dict) and 'url' in node and 'children' in node for node in payload))
+
+
+def parse_harvested(responses: List[Dict[str, Any]], site_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convierte las respuestas capturadas en categorías y filtros
+
+    Args:
+        responses (List[Dict[str, Any]]): Resultado de harvest_json_responses
+        site_url (str, optional): URL base del sitio (default: config site_url)
+
+    Returns:
+        Dict[str, Any]: {'categories': registros {name, url, text_original},
+                         'filters': filtros de la página o None si no hubo facets}
+    """
+    categories = []
+    filters = None
+
+    for response in responses:
+        payload = response.get('payload')
+
+        if _is_category_tree(payload):
+            categories.extend(category_tree_to_records(payload, site_url))
+            continue
+
+        page_filters = parse_graphql_facets(payload)
+        if page_filters is None:
+            page_filters = parse_facets_payload(payload)
+
+        # La página puede pedir facets más de una vez: se conserva la más completa
+        if page_filters is not None and (filters is None or len(page_filters) > len(filters)):
+            filters = page_filters
+
+    return {'categories': categories, 'filters': filters}
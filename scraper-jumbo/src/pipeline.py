@@ -0,0 +1,172 @@
+"""
+Módulo Pipeline - Descarga y parseo de categorías en paralelo
+
+Los workers de I/O (threads) descargan las páginas de categoría y entregan
+los bytes a un pool de procesos que ejecuta el parseo de filtros, de modo
+que el parseo (CPU, con GIL) usa todos los núcleos mientras continúan las
+descargas. Un semáforo limita las páginas pendientes en memoria.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+from config import get_config, get_logger
+from extractor import (parse_filters_from_html, find_unchanged_filters, remember_filters,
+                       escalate_incomplete_filters, extract_filters_from_categories,
+                       get_extraction_stats, DOWNLOADED_PAGE_SOURCES)
+
+
+logger = get_logger()
+
+
+def extract_filters_pipelined(scraper, categories: List[Dict[str, Any]],
+                              io_workers: Optional[int] = None,
+                              parse_workers: Optional[int] = None,
+                              max_pending: Optional[int] = None,
+                              journal=None) -> List[Dict[str, Any]]:
+    """
+    Extrae los filtros de las categorías con descarga y parseo encadenados
+
+    Args:
+        scraper: Instancia del JumboScraper (compartida por los workers de I/O)
+        categories (List[Dict[str, Any]]): Categorías con 'name' y 'url'
+        io_workers (int, optional): Threads de descarga (default: pipeline.io_workers)
+        parse_workers (int, optional): Procesos de parseo (default: núcleos disponibles)
+        max_pending (int, optional): Páginas descargadas sin parsear como máximo
+        journal (CheckpointJournal, optional): Diario de categorías terminadas (se omiten al reanudar)
+
+    Returns:
+        List[Dict[str, Any]]: Las mismas categorías con 'filters' completado
+    """
+    config = get_config()
+    settings = config.get('pipeline') or {}
+    io_workers = io_workers or settings.get('io_workers', 8)
+    parse_workers = parse_workers or settings.get('parse_workers') or os.cpu_count() or 1
+    max_pending = max_pending or settings.get('max_pending', 2 * parse_workers)
+
+    filter_source = config.get('filter_source', 'html')
+    if filter_source not in DOWNLOADED_PAGE_SOURCES:
+        logger.warning(f"⚠️ --pipeline parsea el HTML descargado y no aplica a filter_source "
+                       f"{filter_source}, se procesa cada categoría con {io_workers} workers")
+        return extract_filters_from_categories(scraper, categories, workers=io_workers, journal=journal)
+    hybrid = filter_source == 'hybrid'
+    stats = get_extraction_stats()
+
+    all_categories = categories
+    if journal is not None:
+        categories = journal.restore(categories)
+
+    total = len(categories)
+    logger.info(f"⚡ Pipeline: {io_workers} workers de descarga, {parse_workers} procesos de parseo, "
+                f"máximo {max_pending} páginas pendientes")
+
+    # Cada página ocupa un lugar desde que empieza su descarga hasta que termina su parseo
+    pending_slots = threading.BoundedSemaphore(max_pending)
+    done = threading.Event()
+    remaining = [total]
+    finished = set()
+    remaining_lock = threading.Lock()
+
+    def finish(index: int, filters: List[str]):
+        # Cada categoría termina una sola vez, y siempre libera su lugar: si no,
+        # done.wait() no volvería nunca
+        with remaining_lock:
+            if index in finished:
+                return
+            finished.add(index)
+
+        try:
+            category = categories[index]
+            category['filters'] = filters
+            # Lista vacía = descarga o parseo fallido: queda pendiente para --resume
+            if journal is not None and filters:
+                try:
+                    journal.record(category['url'], name=category['name'], filters=filters)
+                except OSError as e:
+                    # Sin checkpoint la categoría se repetirá al reanudar, pero el pipeline sigue
+                    logger.error(f"❌ No se pudo registrar {category['url']} en el checkpoint: {e}")
+            logger.info(f"✅ Extraídos {len(filters)} filtros para {category['name']}")
+        finally:
+            pending_slots.release()
+            with remaining_lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    done.set()
+
+    def guarded(index: int, step, *args):
+        # Cualquier error no previsto en una etapa termina la categoría sin filtros
+        try:
+            step(*args)
+        except Exception as e:
+            logger.error(f"❌ Error procesando {categories[index]['url']}: {e}")
+            finish(index, [])
+
+    def complete(index: int, filters: List[str], fingerprint: Optional[str] = None):
+        # Con hybrid las páginas con solo filtros base se renderizan en un worker
+        # de I/O, para no bloquear el thread que entrega los resultados del pool
+        if hybrid:
+            io_pool.submit(guarded, index, escalate, index, filters, fingerprint)
+            return
+        stats.record('html')
+        finish(index, filters)
+
+    def escalate(index: int, filters: List[str], fingerprint: Optional[str]):
+        path = 'html'
+        try:
+            filters, path = escalate_incomplete_filters(categories[index]['url'], filters, path, fingerprint)
+        except Exception as e:
+            logger.error(f"❌ Error renderizando {categories[index]['url']}: {e}")
+        stats.record(path)
+        finish(index, filters)
+
+    def on_parsed(index: int, future, fingerprint: Optional[str]):
+        try:
+            filters = future.result()
+        except Exception as e:
+            logger.error(f"❌ Error parseando {categories[index]['url']}: {e}")
+            filters = []
+        else:
+            remember_filters(categories[index]['url'], fingerprint, filters)
+        complete(index, filters, fingerprint)
+
+    def fetch(index: int, parse_pool: ProcessPoolExecutor):
+        category = categories[index]
+        logger.info(f"🔍 Procesando categoría {index + 1}/{total}: {category['name']}")
+        try:
+            result = scraper.fetch(category['url'], as_bytes=True)
+            body, encoding = result.content, result.encoding
+        except Exception as e:
+            logger.error(f"❌ Error descargando {category['url']}: {e}")
+            body, encoding = None, None
+
+        if not body:
+            complete(index, parse_filters_from_html(body, category['url']))
+            return
+
+        # Modo incremental (misma lógica que _parse_filters_incremental, repartida
+        # entre este thread y el pool): región de filtros sin cambios → sin parseo
+        previous, fingerprint = find_unchanged_filters(body, category['url'], encoding)
+        if previous is not None:
+            complete(index, previous, fingerprint)
+            return
+
+        try:
+            # Con el charset declarado, igual que al decodificar en get_page
+            future = parse_pool.submit(parse_filters_from_html, body, category['url'], encoding)
+        except Exception as e:
+            logger.error(f"❌ No se pudo enviar {category['url']} al pool de parseo: {e}")
+            finish(index, [])
+            return
+        future.add_done_callback(lambda f: guarded(index, on_parsed, index, f, fingerprint))
+
+    if total > 0:
+        with ProcessPoolExecutor(max_workers=parse_workers) as parse_pool, \
+                ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+            for index in range(total):
+                pending_slots.acquire()  # Backpressure: esperar a que se libere una página
+                io_pool.submit(guarded, index, fetch, index, parse_pool)
+            done.wait()
+
+    logger.info(f"📊 Vías de extracción: {stats.summary()}")
+    return all_categories
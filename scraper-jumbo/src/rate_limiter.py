@@ -0,0 +1,134 @@
+"""
+Módulo Rate Limiter - Control de tasa de requests por host (token bucket)
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+from config import get_config
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe
+
+    Cada request consume un token; los tokens se reponen a `rate` por segundo
+    hasta un máximo de `burst`. Las reservas pueden dejar el balance negativo,
+    de modo que cada llamador recibe su propio turno sin reintentar.
+    Con rate 0 no hay límite de tasa, pero min_interval se sigue aplicando.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.last_grant = None
+        self._lock = threading.Lock()
+
+    def reserve(self, min_interval: Optional[float] = None) -> float:
+        """
+        Reserva un token y devuelve cuántos segundos hay que esperar para usarlo
+
+        Args:
+            min_interval (float, optional): Separación mínima con la reserva anterior
+
+        Returns:
+            float: Segundos de espera (0 si el token está disponible)
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self.rate > 0:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                self.tokens -= 1
+                wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            if min_interval and self.last_grant is not None:
+                wait = max(wait, self.last_grant + min_interval - now)
+
+            self.last_grant = now + wait
+            return wait
+
+
+class RateLimiter:
+    """
+    Limitador de tasa con un token bucket por host
+    """
+
+    def __init__(self, requests_per_second: float = 0, burst: int = 1):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RateLimiter':
+        """Crea el limitador a partir de la sección rate_limit de la configuración"""
+        settings = config.get('rate_limit') or {}
+        return cls(
+            requests_per_second=settings.get('requests_per_second', 0),
+            burst=settings.get('burst', 1)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si el limitador restringe la tasa (0 = sin límite)"""
+        return self.requests_per_second > 0
+
+    def _get_bucket(self, url: str) -> TokenBucket:
+        """Obtiene el bucket del host de la URL"""
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_second, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: str, min_interval: Optional[float] = None) -> float:
+        """
+        Reserva un turno para una request a la URL
+
+        Sin límite de tasa (requests_per_second: 0) solo se aplica min_interval,
+        que igual requiere registrar cada request al host.
+
+        Args:
+            url (str): URL de la request
+            min_interval (float, optional): Separación mínima con la request anterior al host
+
+        Returns:
+            float: Segundos a esperar antes de enviar la request
+        """
+        return self._get_bucket(url).reserve(min_interval)
+
+    def acquire(self, url: str, min_interval: Optional[float] = None):
+        """Bloquea hasta que se pueda enviar una request a la URL"""
+        wait = self.reserve(url, min_interval)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str, min_interval: Optional[float] = None):
+        """Versión asíncrona de acquire()"""
+        wait = self.reserve(url, min_interval)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Limitador global compartido por todos los scrapers del proceso
+RATE_LIMITER = None
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Obtiene el limitador global, creándolo desde la configuración"""
+    global RATE_LIMITER
+
+    with _RATE_LIMITER_LOCK:
+        if RATE_LIMITER is None:
+            RATE_LIMITER = RateLimiter.from_config(get_config())
+    return RATE_LIMITER
@@ -0,0 +1,208 @@
+"""
+Módulo Recorder - Grabación y reproducción de respuestas HTTP
+
+Permite grabar todas las respuestas que recibe JumboScraper en un archivo
+comprimido (--record DIR) y reproducirlas luego sin acceso a la red
+(--replay DIR), para tests de regresión y benchmarks repetibles.
+"""
+
+import io
+import json
+import gzip
+import base64
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+from config import get_config, get_logger
+
+
+ARCHIVE_FILE_NAME = 'responses.jsonl.gz'
+
+# Tamaño de los bloques al leer el cuerpo para grabarlo
+RECORD_CHUNK_SIZE = 64 * 1024
+
+# Headers que dejan de ser válidos porque el cuerpo se guarda ya decodificado
+_DROPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length'}
+
+
+class ResponseArchive:
+    """
+    Archivo de respuestas grabadas (JSON Lines comprimido con gzip)
+
+    Cada línea guarda método, URL, status, headers y cuerpo (base64).
+    Cada respuesta se agrega como un miembro gzip independiente, así el
+    archivo sigue siendo legible aunque la ejecución se interrumpa.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / ARCHIVE_FILE_NAME
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+
+    def append(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Agrega una respuesta al archivo"""
+        record = {
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'body': base64.b64encode(body).decode('ascii'),
+        }
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, 'ab') as f:
+                f.write(line)
+
+    def load(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Carga el índice (método, URL) → respuesta; la última grabación gana"""
+        with self._lock:
+            if self._index is None:
+                index = {}
+                if self.path.exists():
+                    with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                        for line in f:
+                            if line.strip():
+                                record = json.loads(line)
+                                index[(record['method'], record['url'])] = record
+                self._index = index
+            return self._index
+
+    def lookup(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Busca la respuesta grabada para una request"""
+        return self.load().get((method.upper(), url))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Adapter de requests que graba cada respuesta recibida
+
+    El cuerpo se lee con el mismo límite que JumboScraper (max_body_bytes):
+    una respuesta más grande no se graba y se devuelve con solo los bytes
+    leídos, de modo que el scraper la rechace igual que sin grabación.
+    """
+
+    def __init__(self, archive: ResponseArchive, max_body_bytes: Optional[int] = None, **kwargs):
+        self.archive = archive
+        self.max_body_bytes = max_body_bytes or get_config().get('max_body_bytes', 10 * 1024 * 1024)
+        self.logger = get_logger()
+        super().__init__(**kwargs)
+
+    def _read_limited(self, response) -> Tuple[bytes, bool]:
+        """Lee hasta max_body_bytes + 1 bytes; indica si el cuerpo entra en el límite"""
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            return b'', False
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=RECORD_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return b''.join(chunks), False
+        return b''.join(chunks), True
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body, within_limit = self._read_limited(response)
+
+        # El cuerpo leído queda en la respuesta, como si se hubiera leído con .content
+        response._content = body
+        response._content_consumed = True
+
+        if not within_limit:
+            response.close()
+            self.logger.warning(f"📼 Respuesta supera {self.max_body_bytes} bytes, no se graba: {request.url}")
+            return response
+
+        self.archive.append(request.method, request.url, response.status_code,
+                            dict(response.headers), body)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Adapter de requests que sirve respuestas grabadas sin acceso a la red"""
+
+    def __init__(self, archive: ResponseArchive, **kwargs):
+        self.archive = archive
+        self.logger = get_logger()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        record = self.archive.lookup(request.method, request.url)
+
+        if record is None:
+            self.logger.warning(f"📼 Respuesta no grabada: {request.method} {request.url}")
+            status, headers, body = 404, {}, b''
+        else:
+            status, headers = record['status'], record['headers']
+            body = base64.b64decode(record['body'])
+
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+# Archivo global compartido por todos los scrapers del proceso
+_ARCHIVE = None
+_ARCHIVE_MODE = None
+_ARCHIVE_LOADED = False
+_ARCHIVE_LOCK = threading.Lock()
+
+
+def get_archive_mode() -> Tuple[Optional[str], Optional[ResponseArchive]]:
+    """
+    Obtiene el modo de grabación configurado ('record', 'replay' o None)
+
+    Returns:
+        Tuple[Optional[str], Optional[ResponseArchive]]: Modo y archivo asociado
+    """
+    global _ARCHIVE, _ARCHIVE_MODE, _ARCHIVE_LOADED
+
+    with _ARCHIVE_LOCK:
+        if not _ARCHIVE_LOADED:
+            config = get_config()
+            if config.get('replay_dir'):
+                _ARCHIVE_MODE, _ARCHIVE = 'replay', ResponseArchive(config['replay_dir'])
+            elif config.get('record_dir'):
+                _ARCHIVE_MODE, _ARCHIVE = 'record', ResponseArchive(config['record_dir'])
+            _ARCHIVE_LOADED = True
+    return _ARCHIVE_MODE, _ARCHIVE
+
+
+def create_http_adapter(**kwargs) -> HTTPAdapter:
+    """
+    Crea el adapter HTTP según el modo de grabación configurado
+
+    Args:
+        **kwargs: Argumentos para HTTPAdapter (tamaños de pool, etc.)
+
+    Returns:
+        HTTPAdapter: Adapter normal, de grabación o de reproducción
+    """
+    mode, archive = get_archive_mode()
+    if mode == 'replay':
+        return ReplayAdapter(archive, **kwargs)
+    if mode == 'record':
+        return RecordingAdapter(archive, **kwargs)
+    return HTTPAdapter(**kwargs)
+
+
+def is_replaying() -> bool:
+    """Indica si las respuestas se sirven desde un archivo grabado"""
+    return get_archive_mode()[0] == 'replay'
+
+
+def is_recording() -> bool:
+    """Indica si las respuestas de la red se están grabando"""
+    return get_archive_mode()[0] == 'record'
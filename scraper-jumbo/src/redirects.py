@@ -0,0 +1,153 @@
+"""
+Módulo Redirects - Mapa persistente de redirecciones de URLs de categorías
+
+Varias URLs de categorías (clusters como /39293?map=productClusterIds,
+variantes con o sin barra final) responden con una redirección. El mapa
+guarda, con TTL, la URL final de cada URL pedida: las ejecuciones
+siguientes van directo a la URL final sin pagar los saltos intermedios, y
+los registros de categorías se reescriben con la URL canónica.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from config import get_config, get_logger, get_project_root
+
+
+class RedirectMap:
+    """
+    URL pedida -> URL final, con vencimiento por entrada
+
+    Se carga completo al iniciar y se reescribe de forma atómica con save().
+    """
+
+    def __init__(self, path, ttl_seconds: float = 604800):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['RedirectMap']:
+        """Crea el mapa desde la sección redirect_cache (None si está deshabilitado)"""
+        settings = config.get('redirect_cache') or {}
+        if not settings.get('enabled', False):
+            return None
+
+        path = Path(settings.get('path', 'cache/redirects.json'))
+        if not path.is_absolute():
+            path = get_project_root() / path
+
+        return cls(path, ttl_seconds=settings.get('ttl_seconds', 604800))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"⚠️ No se pudieron leer las redirecciones de {self.path}: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, url: str) -> Optional[str]:
+        """
+        Obtiene la URL final conocida de una URL
+
+        Args:
+            url (str): URL pedida
+
+        Returns:
+            Optional[str]: URL final, o None si no hay una redirección vigente
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            if time.time() - entry.get('resolved_at', 0) >= self.ttl_seconds:
+                del self._entries[url]
+                self._dirty = True
+                return None
+            return entry['final_url']
+
+    def canonical(self, url: str) -> str:
+        """URL final si hay una redirección vigente, o la misma URL"""
+        return self.resolve(url) or url
+
+    def record(self, url: str, final_url: str):
+        """Registra la URL final a la que redirige una URL"""
+        if not final_url or final_url == url:
+            return
+        with self._lock:
+            self._entries[url] = {'final_url': final_url, 'resolved_at': time.time()}
+            self._dirty = True
+
+    def forget(self, url: str):
+        """Elimina una redirección que dejó de ser válida"""
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+
+    def save(self):
+        """Escribe el mapa en disco si cambió (archivo temporal + reemplazo atómico)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+def canonicalize_categories(categories: List[Dict[str, Any]],
+                            redirect_map: Optional[RedirectMap] = None) -> int:
+    """
+    Reescribe la 'url' de cada categoría con su URL final conocida
+
+    Args:
+        categories (List[Dict[str, Any]]): Categorías con 'url' (se modifican)
+        redirect_map (RedirectMap, optional): Mapa a usar (default: mapa global)
+
+    Returns:
+        int: Cantidad de URLs reescritas
+    """
+    if redirect_map is None:
+        redirect_map = get_redirect_map()
+    if redirect_map is None:
+        return 0
+
+    rewritten = 0
+    for category in categories:
+        canonical = redirect_map.canonical(category['url'])
+        if canonical != category['url']:
+            category['url'] = canonical
+            rewritten += 1
+    return rewritten
+
+
+# Mapa global compartido por todos los scrapers del proceso
+REDIRECT_MAP = None
+_REDIRECT_MAP_LOADED = False
+_REDIRECT_MAP_LOCK = threading.Lock()
+
+
+def get_redirect_map() -> Optional[RedirectMap]:
+    """Obtiene el mapa global (None si redirect_cache.enabled es false)"""
+    global REDIRECT_MAP, _REDIRECT_MAP_LOADED
+
+    with _REDIRECT_MAP_LOCK:
+        if not _REDIRECT_MAP_LOADED:
+            REDIRECT_MAP = RedirectMap.from_config(get_config())
+            _REDIRECT_MAP_LOADED = True
+    return REDIRECT_MAP
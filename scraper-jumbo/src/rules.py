@@ -0,0 +1,125 @@
+"""
+Módulo Rules - Reglas de inclusión/exclusión de categorías y filtros
+
+Cada lista de términos se compila una sola vez en una expresión regular
+con alternación, de modo que clasificar un texto cuesta un único recorrido
+sin importar cuántos términos tenga la regla.
+"""
+
+import re
+import threading
+from typing import Optional, Dict, List, Iterable
+from config import get_config
+
+
+# Reglas por defecto (se pueden sobreescribir en config.yaml → category_rules)
+DEFAULT_RULES: Dict[str, List[str]] = {
+    # extractor.extract_categories - estrategia 1 (toda la página)
+    'href_exclude': [
+        'login', 'carrito', 'ofertas', 'novedades', 'ayuda', 'contacto',
+        'sucursales', 'entrega', 'actualiza', 'descuentos'
+    ],
+    'text_exclude': [
+        'ver', 'click', 'comprar', 'precio', 'regular', 'producto',
+        'descuentos', 'sucursal', 'entrega', 'actualiza'
+    ],
+    # extractor.extract_categories - estrategia 2 (elementos de menú)
+    'menu_href_exclude': [
+        'login', 'carrito', 'ofertas', 'novedades', 'ayuda', 'contacto',
+        'sucursales', 'entrega'
+    ],
+    # analyze_menu.extract_categories_from_menu - enlaces del menú desplegado
+    'menu_link_href_exclude': ['descuentos', 'sucursales', 'arrepentimiento'],
+    'menu_link_text_exclude': ['legales', 'bancarios'],
+    'menu_generic_terms': [
+        'ver más', 'ver todo', 'todos', 'ofertas', 'novedades',
+        'comprar', 'compra', 'inicio', 'home', 'contacto',
+        'ayuda', 'servicio', 'atención', 'sucursales',
+        'legales', 'bancarios', 'arrepentimiento'
+    ],
+    'menu_exclude_keywords': [
+        'ver más', 'ver todo', 'todos', 'ofertas', 'novedades',
+        'comprar', 'compra', 'inicio', 'home', 'contacto',
+        'ayuda', 'servicio', 'atención', 'sucursales', 'legales',
+        'bancarios', 'arrepentimiento', 'descuentos'
+    ],
+    # analyze_menu.filter_and_validate_categories - Etapa 3.3
+    'category_exclude': [
+        'viví saludable', 'vivi saludable',
+        'ofertas', 'novedades', 'promociones',
+        'servicios', 'atención al cliente', 'contacto'
+    ],
+}
+
+
+class KeywordMatcher:
+    """
+    Busca cualquiera de varios términos como subcadena (sin distinguir mayúsculas)
+
+    Equivale a any(term in text.lower() for term in terms) pero con un único
+    recorrido del texto.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = [term.lower() for term in terms if term]
+        # Términos más largos primero para que search() devuelva el más específico
+        alternatives = sorted(set(self.terms), key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, alternatives))) if alternatives else None
+
+    def search(self, text: Optional[str]) -> Optional[str]:
+        """
+        Devuelve el primer término encontrado en el texto
+
+        Args:
+            text (str): Texto a clasificar
+
+        Returns:
+            Optional[str]: Término encontrado o None
+        """
+        if not text or self._pattern is None:
+            return None
+        match = self._pattern.search(text.lower())
+        return match.group(0) if match else None
+
+    def matches(self, text: Optional[str]) -> bool:
+        """Indica si el texto contiene alguno de los términos"""
+        return self.search(text) is not None
+
+
+class CategoryRules:
+    """
+    Conjunto de reglas compiladas, accesibles como atributos
+
+    Ejemplo: get_rules().href_exclude.matches(href)
+    """
+
+    def __init__(self, rules: Dict[str, List[str]]):
+        self._matchers = {name: KeywordMatcher(terms) for name, terms in rules.items()}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'CategoryRules':
+        """Combina las reglas por defecto con la sección category_rules"""
+        rules = dict(DEFAULT_RULES)
+        rules.update(config.get('category_rules') or {})
+        return cls(rules)
+
+    def __getattr__(self, name: str) -> KeywordMatcher:
+        try:
+            return self.__dict__['_matchers'][name]
+        except KeyError:
+            raise AttributeError(f"Regla desconocida: {name}") from None
+
+
+# Reglas globales compartidas por todos los módulos del proceso
+RULES = None
+_RULES_LOCK = threading.Lock()
+
+
+def get_rules() -> CategoryRules:
+    """Obtiene las reglas globales, compilándolas desde la configuración"""
+    global RULES
+
+    with _RULES_LOCK:
+        if RULES is None:
+            RULES = CategoryRules.from_config(get_config())
+    return RULES
@@ -2,10 +2,118 @@
 Módulo Scraper - Manejo de conexiones HTTP
 """
 
+import os
+import re
+import json
 import time
+import atexit
+import threading
 import requests
-from typing import Optional, Dict, Any
-from config import get_config, get_logger
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+from urllib.parse import urlparse
+from config import get_config, get_logger, get_project_root
+from rate_limiter import get_rate_limiter, RateLimiter
+from http_cache import get_http_cache
+from redirects import get_redirect_map
+from recorder import create_http_adapter, is_replaying, is_recording
+
+
+MIN_CONTENT_LENGTH = 100
+JSON_ACCEPT = 'application/json'
+DEFAULT_ENCODING = 'utf-8'
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(ValueError):
+    """La respuesta supera el tamaño máximo configurado (no se reintenta)"""
+
+
+@dataclass
+class FetchResult:
+    """Resultado de descargar una página: contenido y datos de la request"""
+    url: str
+    content: Optional[Union[str, bytes]]
+    final_url: Optional[str] = None
+    status_code: Optional[int] = None
+    redirect_chain: List[str] = field(default_factory=list)
+    from_cache: bool = False
+    error: Optional[str] = None
+    encoding: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Indica si se obtuvo el contenido"""
+        return self.content is not None
+
+    def validation(self) -> Dict[str, Any]:
+        """Datos de validación para guardar en el registro de la categoría"""
+        return {
+            'final_url': self.final_url,
+            'status': self.status_code,
+            'redirect_chain': self.redirect_chain,
+        }
+
+
+def get_declared_charset(headers) -> Optional[str]:
+    """
+    Obtiene el charset declarado en el header Content-Type
+
+    Args:
+        headers: Headers de la respuesta
+
+    Returns:
+        Optional[str]: Charset declarado o None
+    """
+    content_type = headers.get('Content-Type') or ''
+    match = re.search(r'charset=["\']?([\w.:-]+)', content_type, re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def build_default_headers(config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Construye los headers por defecto compartidos por los clientes HTTP
+
+    Args:
+        config (Dict[str, Any]): Configuración del proyecto
+
+    Returns:
+        Dict[str, str]: Headers de la request
+    """
+    return {
+        'User-Agent': config['user_agent'],
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'es-AR,es;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+
+
+def get_session_settings(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Obtiene la configuración de la sesión HTTP con valores por defecto
+
+    Args:
+        config (Dict[str, Any], optional): Configuración del proyecto (default: config global)
+
+    Returns:
+        Dict[str, Any]: pool_connections, pool_maxsize, cookie_file y persist_cookies
+    """
+    config = config or get_config()
+    settings = {
+        'pool_connections': 10,
+        'pool_maxsize': None,
+        'cookie_file': 'cache/session_cookies.json',
+        'persist_cookies': ['vtex_segment', 'vtex_session'],
+    }
+    settings.update(config.get('http_session') or {})
+
+    # Sin valor explícito, una conexión keep-alive por cada request simultánea permitida
+    if not settings['pool_maxsize']:
+        settings['pool_maxsize'] = config.get('max_connections_per_host', 4)
+    return settings
 
 
 class JumboScraper:
@@ -20,53 +128,223 @@ class JumboScraper:
         self.session = requests.Session()
         self.session.headers.update(self._get_default_headers())
 
+        # Límite de requests simultáneas por host (compartido entre workers)
+        self.max_connections_per_host = self.config.get('max_connections_per_host', 4)
+        self.session_settings = get_session_settings(self.config)
+        self.adapter = create_http_adapter(pool_connections=self.session_settings['pool_connections'],
+                                           pool_maxsize=self.session_settings['pool_maxsize'])
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+        # Token bucket por host compartido por todos los scrapers del proceso
+        self.rate_limiter = get_rate_limiter()
+
+        # Cache HTTP persistente (None si está deshabilitado)
+        self.http_cache = get_http_cache()
+
+        # Redirecciones conocidas: se pide directo la URL final (None si está deshabilitado)
+        self.redirect_map = get_redirect_map()
+
+        # En modo replay no hay red: sin rate limiting ni cache, respuestas deterministas
+        if is_replaying():
+            self.rate_limiter = RateLimiter()
+            self.http_cache = None
+            self.redirect_map = None
+            self.logger.info("📼 Modo replay: respuestas servidas desde el archivo grabado")
+
+        # Al grabar toda request tiene que llegar a la red: sin cache ni saltos de
+        # redirección omitidos, así el replay encuentra cada URL que pide
+        if is_recording():
+            self.http_cache = None
+            self.redirect_map = None
+            self.logger.info("📼 Modo grabación: cache HTTP y redirecciones conocidas deshabilitadas")
+
+        # Cookies de segmento de VTEX de la ejecución anterior (región, canal de venta)
+        self.cookie_file = None
+        if self.session_settings['cookie_file'] and not is_replaying():
+            self.cookie_file = Path(self.session_settings['cookie_file'])
+            if not self.cookie_file.is_absolute():
+                self.cookie_file = get_project_root() / self.cookie_file
+            self.load_cookies()
+
         self.logger.info("🔧 JumboScraper inicializado")
 
     def _get_default_headers(self) -> Dict[str, str]:
         """Obtiene los headers por defecto para las requests"""
-        return {
-            'User-Agent': self.config['user_agent'],
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'es-AR,es;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        return build_default_headers(self.config)
+
+    def _resolve_redirect(self, url: str) -> str:
+        """URL a pedir: la URL final conocida, para no repetir los saltos de redirección"""
+        final_url = self.redirect_map.resolve(url) if self.redirect_map is not None else None
+        if final_url:
+            self.logger.debug(f"↪️ Redirección conocida: {url} -> {final_url}")
+            return final_url
+        return url
+
+    def _remember_redirect(self, url: str, response: requests.Response):
+        """Registra la URL final si la respuesta llegó tras una redirección"""
+        if self.redirect_map is not None and response.history and response.url:
+            self.redirect_map.record(url, response.url)
+
+    def _get_host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Obtiene el semáforo que limita las requests en curso para el host de la URL"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _read_body(self, response) -> bytes:
+        """
+        Lee el cuerpo de una respuesta en streaming con límites de tamaño y tiempo
 
-    def get_page(self, url: str, max_retries: Optional[int] = None) -> Optional[str]:
+        Args:
+            response: Respuesta obtenida con stream=True
+
+        Returns:
+            bytes: Cuerpo completo de la respuesta
+
+        Raises:
+            ResponseTooLargeError: Si el cuerpo supera max_body_bytes
+            requests.exceptions.Timeout: Si la lectura supera body_timeout
+        """
+        max_bytes = self.config.get('max_body_bytes', 10 * 1024 * 1024)
+        body_timeout = self.config.get('body_timeout', 60)
+
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise ResponseTooLargeError(f"Respuesta de {content_length} bytes supera el máximo ({max_bytes})")
+
+        deadline = time.monotonic() + body_timeout
+        chunks = []
+        size = 0
+
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ResponseTooLargeError(f"Respuesta supera el máximo de {max_bytes} bytes")
+            if time.monotonic() > deadline:
+                raise requests.exceptions.Timeout(f"Lectura del cuerpo supera {body_timeout} segundos")
+            chunks.append(chunk)
+
+        return b''.join(chunks)
+
+    def get_page(self, url: str, max_retries: Optional[int] = None,
+                 min_interval: Optional[float] = None,
+                 as_bytes: bool = False) -> Optional[Union[str, bytes]]:
         """
         Obtiene el contenido de una página web con manejo de errores
 
         Args:
             url (str): URL de la página a obtener
             max_retries (int, optional): Número máximo de reintentos
+            min_interval (float, optional): Separación mínima con la request anterior al host
+            as_bytes (bool): Devolver el cuerpo sin decodificar
 
         Returns:
-            Optional[str]: Contenido HTML de la página o None si falla
+            Optional[Union[str, bytes]]: Contenido de la página o None si falla
+        """
+        return self.fetch(url, max_retries=max_retries, min_interval=min_interval, as_bytes=as_bytes).content
+
+    def fetch(self, url: str, max_retries: Optional[int] = None,
+              min_interval: Optional[float] = None,
+              as_bytes: bool = False,
+              min_length: int = MIN_CONTENT_LENGTH,
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Obtiene una página junto con el resultado de la request
+
+        El cuerpo se lee en streaming (con tamaño máximo y timeout total) y se
+        decodifica una sola vez con el charset declarado por el servidor. El
+        resultado incluye la URL final, el status y las redirecciones, de modo
+        que la descarga también sirve como validación de la URL.
+        Si la URL tiene una redirección conocida (redirect_cache) se pide
+        directamente la URL final.
+
+        Args:
+            url (str): URL de la página a obtener
+            max_retries (int, optional): Número máximo de reintentos
+            min_interval (float, optional): Separación mínima con la request anterior al host
+            as_bytes (bool): Devolver el cuerpo sin decodificar
+            min_length (int): Largo mínimo del contenido para considerarlo válido
+                (0 para respuestas que pueden ser cortas, como JSON)
+            headers (Dict[str, str], optional): Headers adicionales de la request
+
+        Returns:
+            FetchResult: Contenido (None si falla), URL final, status y redirecciones
         """
         if max_retries is None:
             max_retries = self.config['max_retries']
 
         last_exception = None
+        last_status = None
+        request_url = self._resolve_redirect(url)
+
+        # Consultar el cache: dentro del TTL no hace falta ir a la red
+        cached = self.http_cache.get(request_url) if self.http_cache else None
+        if cached and self.http_cache.is_fresh(cached):
+            self.logger.debug(f"💾 Página servida desde cache: {request_url}")
+            return FetchResult(url, cached.body if as_bytes else cached.text,
+                               final_url=request_url, status_code=200, from_cache=True,
+                               encoding=cached.encoding)
+        conditional_headers = self.http_cache.conditional_headers(cached) if cached else None
+        request_headers = {**(headers or {}), **(conditional_headers or {})} or None
 
         for attempt in range(max_retries + 1):
             try:
-                self.logger.debug(f"🌐 Intentando acceder a: {url} (intento {attempt + 1})")
-
-                response = self.session.get(
-                    url,
-                    timeout=self.config['timeout'],
-                    allow_redirects=True
-                )
-
-                response.raise_for_status()
+                self.logger.debug(f"🌐 Intentando acceder a: {request_url} (intento {attempt + 1})")
+
+                self.rate_limiter.acquire(request_url, min_interval)
+
+                with self._get_host_slot(request_url):
+                    response = self.session.get(
+                        request_url,
+                        headers=request_headers,
+                        timeout=self.config['timeout'],
+                        allow_redirects=True,
+                        stream=True
+                    )
+                    try:
+                        if cached and response.status_code == 304:
+                            self.logger.debug(f"💾 Página no modificada (304), servida desde cache: {request_url}")
+                            self.http_cache.touch(request_url)
+                            self._remember_redirect(url, response)
+                            return FetchResult(url, cached.body if as_bytes else cached.text,
+                                               final_url=response.url or request_url, status_code=304,
+                                               redirect_chain=[r.url for r in response.history],
+                                               from_cache=True, encoding=cached.encoding)
+
+                        response.raise_for_status()
+                        body = self._read_body(response)
+                    finally:
+                        response.close()
+
+                encoding = get_declared_charset(response.headers) or DEFAULT_ENCODING
+                content = body if as_bytes else body.decode(encoding, errors='replace')
 
                 # Verificar que el contenido sea válido
-                if len(response.text) < 100:
+                if len(content) < min_length:
                     raise ValueError("Contenido de respuesta demasiado pequeño")
 
-                self.logger.debug(f"✅ Página obtenida exitosamente ({len(response.text)} caracteres)")
-                return response.text
+                if self.http_cache:
+                    self.http_cache.store(
+                        request_url,
+                        body,
+                        encoding=encoding,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+
+                self._remember_redirect(url, response)
+                self.logger.debug(f"✅ Página obtenida exitosamente ({len(body)} bytes)")
+                return FetchResult(url, content, final_url=response.url or request_url,
+                                   status_code=response.status_code,
+                                   redirect_chain=[r.url for r in response.history],
+                                   encoding=encoding)
 
             except requests.exceptions.Timeout:
                 last_exception = f"Timeout después de {self.config['timeout']} segundos"
@@ -76,29 +354,117 @@ class JumboScraper:
                 self.logger.warning(f"🔌 {last_exception}")
             except requests.exceptions.HTTPError as e:
                 status_code = e.response.status_code
+                last_status = status_code
                 last_exception = f"Error HTTP {status_code}"
                 self.logger.warning(f"🌐 {last_exception}")
 
                 # No reintentar para errores 4xx (excepto 429)
                 if 400 <= status_code < 500 and status_code != 429:
                     break
+            except ResponseTooLargeError as e:
+                last_exception = str(e)
+                self.logger.warning(f"📦 {last_exception}")
+                break
             except Exception as e:
                 last_exception = f"Error inesperado: {str(e)}"
                 self.logger.warning(f"❌ {last_exception}")
 
-            # Esperar antes del siguiente intento
+            # Backoff antes del siguiente intento (solo tras un fallo)
             if attempt < max_retries:
                 delay = self.config['delay_between_requests'] * (attempt + 1)
                 self.logger.info(f"⏳ Esperando {delay} segundos antes del siguiente intento...")
                 time.sleep(delay)
 
+        if request_url != url:
+            # La redirección guardada dejó de servir: la próxima vez se resuelve de nuevo
+            self.redirect_map.forget(url)
+
         self.logger.error(f"❌ Fallaron todos los intentos para {url}. Último error: {last_exception}")
+        return FetchResult(url, None, status_code=last_status, error=last_exception)
+
+    def head(self, url: str, max_retries: Optional[int] = None,
+             allow_redirects: bool = True) -> Optional[requests.Response]:
+        """
+        Envía una request HEAD por la sesión compartida (validación de URLs)
+
+        Usa el pool de conexiones, los headers y el timeout configurados y
+        respeta el rate limit y el límite de conexiones por host. Solo se
+        reintentan los timeouts y errores de conexión.
+
+        Args:
+            url (str): URL a validar
+            max_retries (int, optional): Número máximo de reintentos
+            allow_redirects (bool): Seguir redirecciones
+
+        Returns:
+            Optional[requests.Response]: Respuesta (cualquier status) o None si no hubo respuesta
+        """
+        if max_retries is None:
+            max_retries = self.config['max_retries']
+
+        last_exception = None
+        request_url = self._resolve_redirect(url) if allow_redirects else url
+
+        for attempt in range(max_retries + 1):
+            try:
+                self.rate_limiter.acquire(request_url)
+
+                with self._get_host_slot(request_url):
+                    response = self.session.head(request_url, timeout=self.config['timeout'],
+                                                 allow_redirects=allow_redirects)
+                response.close()
+                if response.status_code < 400:
+                    self._remember_redirect(url, response)
+                elif request_url != url:
+                    self.redirect_map.forget(url)
+                return response
+
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                last_exception = str(e)
+                self.logger.warning(f"🔌 HEAD {url} falló (intento {attempt + 1}): {last_exception[:80]}")
+            except requests.RequestException as e:
+                last_exception = str(e)
+                break
+
+            if attempt < max_retries:
+                time.sleep(self.config['delay_between_requests'] * (attempt + 1))
+
+        self.logger.error(f"❌ HEAD {url} sin respuesta. Último error: {last_exception}")
         return None
 
+    def get_json(self, url: str, max_retries: Optional[int] = None) -> Optional[Any]:
+        """
+        Obtiene y decodifica una respuesta JSON (endpoints de VTEX)
+
+        Pide application/json y acepta respuestas cortas (una lista de facets
+        vacía o un nodo de categoría son válidos).
+
+        Args:
+            url (str): URL del endpoint
+            max_retries (int, optional): Número máximo de reintentos
+
+        Returns:
+            Optional[Any]: JSON decodificado o None si falla
+        """
+        content = self.fetch(url, max_retries=max_retries, min_length=0,
+                             headers={'Accept': JSON_ACCEPT}).content
+        if content is None:
+            return None
+
+        try:
+            return json.loads(content)
+        except ValueError as e:
+            self.logger.warning(f"⚠️ Respuesta JSON inválida de {url}: {e}")
+            return None
+
     def get_page_with_retry(self, url: str, custom_delay: Optional[float] = None) -> Optional[str]:
         """
         Obtiene una página con delay personalizado entre requests
 
+        El delay se aplica como separación mínima con la request anterior al
+        mismo host (a través del rate limiter), sin esperar después de una
+        request exitosa.
+
         Args:
             url (str): URL de la página
             custom_delay (float, optional): Delay personalizado en segundos
@@ -106,14 +472,10 @@ class JumboScraper:
         Returns:
             Optional[str]: Contenido de la página
         """
-        result = self.get_page(url)
-
-        # Aplicar delay personalizado si se especifica
         if custom_delay:
             self.logger.debug(f"⏳ Aplicando delay personalizado: {custom_delay}s")
-            time.sleep(custom_delay)
 
-        return result
+        return self.get_page(url, min_interval=custom_delay)
 
     def test_connection(self) -> bool:
         """
@@ -190,15 +552,102 @@ class JumboScraper:
             str: Título de la página
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
+            from html_parser import parse_html
+            soup = parse_html(content)
             title_tag = soup.find('title')
             return title_tag.text.strip() if title_tag else "Sin título"
         except Exception:
             return "Error al extraer título"
 
+    def load_cookies(self) -> int:
+        """
+        Carga en la sesión las cookies persistidas en la ejecución anterior
+
+        Returns:
+            int: Cantidad de cookies cargadas
+        """
+        if self.cookie_file is None or not self.cookie_file.exists():
+            return 0
+        loaded = 0
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            for cookie in cookies:
+                if cookie.get('expires') and cookie['expires'] < time.time():
+                    continue
+                loaded += 1
+                self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                         path=cookie.get('path', '/'), expires=cookie.get('expires'),
+                                         secure=cookie.get('secure', False))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"⚠️ No se pudieron leer las cookies de {self.cookie_file}: {e}")
+            return 0
+
+        self.logger.debug(f"🍪 {loaded} cookies de sesión restauradas")
+        return loaded
+
+    def save_cookies(self) -> int:
+        """
+        Guarda las cookies de segmento de VTEX para la próxima ejecución
+
+        Returns:
+            int: Cantidad de cookies guardadas
+        """
+        if self.cookie_file is None:
+            return 0
+
+        names = set(self.session_settings['persist_cookies'] or [])
+        cookies = [
+            {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain,
+             'path': cookie.path, 'expires': cookie.expires, 'secure': cookie.secure}
+            for cookie in self.session.cookies if cookie.name in names
+        ]
+        if not cookies:
+            return 0
+
+        self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cookie_file.with_suffix(self.cookie_file.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cookie_file)
+        return len(cookies)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Obtiene cuántas requests reutilizaron una conexión abierta
+
+        Returns:
+            Dict[str, int]: {'requests', 'connections', 'reused'} sumados sobre
+            los pools de conexiones activos del adapter
+        """
+        stats = {'requests': 0, 'connections': 0, 'reused': 0}
+        poolmanager = getattr(self.adapter, 'poolmanager', None)
+        if poolmanager is None:
+            return stats
+
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            stats['requests'] += pool.num_requests
+            stats['connections'] += pool.num_connections
+
+        stats['reused'] = max(0, stats['requests'] - stats['connections'])
+        return stats
+
+    def connection_summary(self) -> str:
+        """Resumen de reutilización de conexiones para las estadísticas de la ejecución"""
+        stats = self.connection_stats()
+        ratio = stats['reused'] / stats['requests'] * 100 if stats['requests'] else 0
+        return (f"{stats['requests']} requests sobre {stats['connections']} conexiones "
+                f"({stats['reused']} reutilizadas, {ratio:.0f}%)")
+
     def close(self):
-        """Cierra la sesión HTTP"""
+        """Guarda las cookies de segmento y cierra la sesión HTTP"""
+        try:
+            self.save_cookies()
+        except OSError as e:
+            self.logger.warning(f"⚠️ No se pudieron guardar las cookies: {e}")
         self.session.close()
         self.logger.info("🔌 Sesión HTTP cerrada")
 
@@ -209,3 +658,30 @@ class JumboScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.close()
+
+
+# Scraper compartido por todas las etapas y workers del proceso: un solo
+# pool de conexiones keep-alive y un solo cookie jar
+SHARED_SCRAPER = None
+_SHARED_SCRAPER_LOCK = threading.Lock()
+
+
+def get_shared_scraper() -> JumboScraper:
+    """Obtiene el scraper global, creándolo la primera vez"""
+    global SHARED_SCRAPER
+
+    with _SHARED_SCRAPER_LOCK:
+        if SHARED_SCRAPER is None:
+            SHARED_SCRAPER = JumboScraper()
+            atexit.register(close_shared_scraper)
+    return SHARED_SCRAPER
+
+
+def close_shared_scraper():
+    """Cierra el scraper global si fue creado (guarda las cookies de segmento)"""
+    global SHARED_SCRAPER
+
+    with _SHARED_SCRAPER_LOCK:
+        scraper, SHARED_SCRAPER = SHARED_SCRAPER, None
+    if scraper is not None:
+        scraper.close()
@@ -0,0 +1,81 @@
+"""
+Módulo Streaming - Utilidades para encadenar etapas como generadores
+
+Cada etapa consume un iterable y produce sus resultados a medida que los
+obtiene, así la etapa siguiente empieza con el primer elemento en lugar
+de esperar a que la anterior termine completa.
+"""
+
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+from config import get_logger
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+logger = get_logger()
+
+
+def imap_bounded(func: Callable[[T], R], items: Iterable[T], workers: int = 1,
+                 max_pending: Optional[int] = None) -> Iterator[R]:
+    """
+    Aplica func a cada elemento en paralelo y produce los resultados en orden
+
+    A diferencia de ThreadPoolExecutor.map, consume la entrada de a poco: como
+    máximo max_pending elementos en vuelo, de modo que funciona con
+    generadores (incluso infinitos) y entrega cada resultado apenas están
+    listos todos los anteriores.
+
+    Args:
+        func (Callable): Función a aplicar
+        items (Iterable): Elementos de entrada (puede ser un generador)
+        workers (int): Threads en paralelo (1 = secuencial, sin threads)
+        max_pending (int, optional): Elementos en vuelo como máximo (default: 2 * workers)
+
+    Yields:
+        Resultados de func en el orden de la entrada
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    max_pending = max(workers, max_pending or 2 * workers)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def tee_to_json(items: Iterable[T], path) -> Iterator[T]:
+    """
+    Deja pasar los elementos y al agotarse los guarda como arreglo JSON
+
+    Permite conservar los archivos intermedios de cada etapa como salida
+    secundaria sin frenar el flujo.
+
+    Args:
+        items (Iterable): Elementos de la etapa
+        path: Archivo JSON a escribir
+
+    Yields:
+        Los mismos elementos, sin modificar
+    """
+    collected: List[T] = []
+    for item in items:
+        collected.append(item)
+        yield item
+
+    path = Path(path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(collected, f, indent=2, ensure_ascii=False)
+    logger.info(f"💾 Salida intermedia guardada: {path} ({len(collected)} elementos)")
@@ -0,0 +1,177 @@
+"""
+Módulo VTEX API - Extracción vía los endpoints JSON públicos de VTEX
+
+Jumbo es una tienda VTEX: los facets de búsqueda de cada categoría se
+obtienen como JSON compacto desde /api/catalog_system/pub/facets/search,
+y el árbol completo de categorías desde /api/catalog_system/pub/category/tree,
+sin descargar ni parsear páginas HTML ni abrir un navegador.
+"""
+
+import re
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse, parse_qs, quote
+from config import get_config, get_logger
+from extractor import finalize_filters, BASE_FILTERS
+
+
+logger = get_logger()
+
+FACETS_ENDPOINT = '/api/catalog_system/pub/facets/search'
+CATEGORY_TREE_ENDPOINT = '/api/catalog_system/pub/category/tree'
+
+# Nombre del filtro que corresponde a las marcas en el storefront
+BRAND_FILTER_NAME = 'Marca'
+
+
+def build_facets_url(category_url: str, site_url: Optional[str] = None) -> str:
+    """
+    Construye la URL del endpoint de facets para una categoría
+
+    /electro/televisores → /api/.../facets/search/electro/televisores?map=c,c
+    /39293?map=productClusterIds → /api/.../facets/search/39293?map=productClusterIds
+
+    Args:
+        category_url (str): URL de la categoría en el storefront
+        site_url (str, optional): URL base del sitio (default: config site_url)
+
+    Returns:
+        str: URL del endpoint de facets
+    """
+    site_url = (site_url or get_config()['site_url']).rstrip('/')
+    parsed = urlparse(category_url)
+    path = parsed.path.rstrip('/')
+
+    query_map = parse_qs(parsed.query).get('map')
+    if query_map:
+        search_map = query_map[0]
+    else:
+        segments = [segment for segment in path.split('/') if segment]
+        search_map = ','.join('c' for _ in segments)
+
+    return f"{site_url}{FACETS_ENDPOINT}{quote(path, safe='/%')}?map={search_map}"
+
+
+def parse_facets_payload(payload: Any) -> Optional[List[str]]:
+    """
+    Obtiene los nombres de filtros de una respuesta de facets
+
+    Args:
+        payload: JSON de la respuesta de facets
+
+    Returns:
+        Optional[List[str]]: Filtros base + específicos, o None si el JSON no trae facets
+    """
+    if not isinstance(payload, dict) or not ({'SpecificationFilters', 'Brands'} & payload.keys()):
+        return None
+
+    filters = []
+
+    if payload.get('Brands'):
+        filters.append(BRAND_FILTER_NAME)
+
+    for name, values in (payload.get('SpecificationFilters') or {}).items():
+        if values and 'precio' not in name.lower():
+            filters.append(name)
+
+    return finalize_filters(filters)
+
+
+def fetch_facets_payload(scraper, category_url: str) -> Optional[Any]:
+    """
+    Descarga la respuesta de facets de una categoría
+
+    Args:
+        scraper: Instancia del JumboScraper
+        category_url (str): URL de la categoría
+
+    Returns:
+        Optional[Any]: JSON de facets, o None si la request falla
+    """
+    return scraper.get_json(build_facets_url(category_url))
+
+
+def log_api_filters(category_url: str, filters: List[str]):
+    """Registra los filtros obtenidos de la API"""
+    logger.info(f"✅ Extraídos {len(filters) - len(BASE_FILTERS)} filtros específicos de {category_url} (API)")
+
+
+def fetch_category_tree(scraper, levels: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Obtiene el árbol de categorías (departamento → categoría → subcategoría)
+
+    Args:
+        scraper: Instancia del JumboScraper
+        levels (int, optional): Niveles del árbol (default: config category_tree_levels)
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: Departamentos con sus 'children', o None si falla
+    """
+    config = get_config()
+    levels = levels or config.get('category_tree_levels', 3)
+    tree_url = f"{config['site_url'].rstrip('/')}{CATEGORY_TREE_ENDPOINT}/{levels}"
+
+    tree = scraper.get_json(tree_url)
+    if not isinstance(tree, list):
+        logger.error(f"❌ No se pudo obtener el árbol de categorías de {tree_url}")
+        return None
+    return tree
+
+
+def category_tree_to_records(tree: List[Dict[str, Any]], site_url: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Aplana el árbol de categorías en registros {name, url, text_original}
+
+    Conserva el formato de categories_extracted.json: recorrido en
+    profundidad (cada departamento seguido de sus categorías), URLs del
+    storefront y nombre limpio de caracteres especiales.
+
+    Args:
+        tree (List[Dict[str, Any]]): Árbol devuelto por fetch_category_tree
+        site_url (str, optional): URL base del sitio (default: config site_url)
+
+    Returns:
+        List[Dict[str, Any]]: Registros de categorías sin URLs duplicadas
+    """
+    site_url = (site_url or get_config()['site_url']).rstrip('/')
+    records = []
+    seen_urls = set()
+
+    stack = list(reversed(tree or []))
+    while stack:
+        node = stack.pop()
+        name = (node.get('name') or '').strip()
+        path = urlparse(node.get('url') or '').path.rstrip('/')
+
+        if name and path:
+            url = f"{site_url}{path}"
+            clean_name = re.sub(r'[^\w\sáéíóúñÁÉÍÓÚÑ]', '', name).strip()
+            if clean_name and url not in seen_urls:
+                seen_urls.add(url)
+                records.append({
+                    'name': clean_name,
+                    'url': url,
+                    'text_original': name
+                })
+
+        stack.extend(reversed(node.get('children') or []))
+
+    return records
+
+
+def discover_categories(scraper) -> List[Dict[str, Any]]:
+    """
+    Descubre todas las categorías del sitio con una sola request al árbol de VTEX
+
+    Args:
+        scraper: Instancia del JumboScraper
+
+    Returns:
+        List[Dict[str, Any]]: Registros {name, url, text_original}
+    """
+    tree = fetch_category_tree(scraper)
+    if tree is None:
+        return []
+
+    records = category_tree_to_records(tree)
+    logger.info(f"🌳 Árbol de categorías: {len(tree)} departamentos, {len(records)} categorías")
+    return records
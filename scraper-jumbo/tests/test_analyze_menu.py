@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests para las etapas de analyze_menu.py
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Agregar la raíz del proyecto y el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(project_root))
+
+import pytest
+from unittest.mock import Mock, patch
+
+import analyze_menu
+from scraper import FetchResult
+
+
+PAGE = '<html><body>' + '<div class="filter-item">Marca</div>' * 5 + '</body></html>'
+
+
+def write_categories(tmp_path, count):
+    path = tmp_path / 'categories_filtered.json'
+    categories = [{'name': f'Cat {i}', 'url': f'https://www.jumbo.com.ar/cat-{i}'} for i in range(count)]
+    path.write_text(json.dumps(categories), encoding='utf-8')
+    return path
+
+
+def read_journal_urls(tmp_path):
+    """URLs registradas en el checkpoint de la etapa 4"""
+    path = tmp_path / 'out.checkpoint.jsonl'
+    if not path.exists():
+        return []
+    return [json.loads(line)['url'] for line in path.read_text(encoding='utf-8').splitlines() if line.strip()]
+
+
+def mock_scraper(fetch=None, head=None):
+    scraper = Mock()
+    scraper.connection_summary.return_value = ''
+    scraper.redirect_map = None
+    if fetch:
+        scraper.fetch.side_effect = fetch
+    if head:
+        scraper.head.side_effect = head
+    return scraper
+
+
+class TestFusedValidation:
+    """Tests de la validación de URLs durante la etapa 4 (--validation fetch)"""
+
+    def test_failed_downloads_are_dropped(self, tmp_path):
+        """Test que sin descargas exitosas la etapa termina sin categorías (y sin dividir por cero)"""
+        input_file = write_categories(tmp_path, 2)
+        scraper = mock_scraper(fetch=lambda url: FetchResult(url, None, status_code=404, error='Error HTTP 404'))
+
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=scraper):
+            result = analyze_menu.extract_filters_from_all_categories(
+                str(input_file), str(tmp_path / 'out.json'), fused_validation=True)
+
+        assert result == []
+
+    def test_successful_download_records_validation(self, tmp_path):
+        """Test que cada categoría descargada guarda URL final, status y redirecciones"""
+        input_file = write_categories(tmp_path, 1)
+        scraper = mock_scraper(fetch=lambda url: FetchResult(url, PAGE, final_url=url + '/', status_code=200,
+                                                             redirect_chain=[url]))
+
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=scraper):
+            result = analyze_menu.extract_filters_from_all_categories(
+                str(input_file), str(tmp_path / 'out.json'), fused_validation=True)
+
+        assert result[0]['validation'] == {'final_url': 'https://www.jumbo.com.ar/cat-0/', 'status': 200,
+                                           'redirect_chain': ['https://www.jumbo.com.ar/cat-0']}
+
+    def test_rendered_mode_validates_with_head(self, tmp_path):
+        """Test que con el navegador (sin status de la request) las URLs se validan con HEAD"""
+        input_file = write_categories(tmp_path, 2)
+        scraper = mock_scraper(head=lambda url: Mock(status_code=404 if url.endswith('cat-1') else 200))
+        rendered = Mock(return_value=['Categoría', 'Sub-Categoría', 'Tipo de Producto', 'Marca'])
+
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=scraper), \
+                patch('browser_pool.get_browser_pool', return_value=Mock(size=1)), \
+                patch('browser_pool.close_browser_pool'), \
+                patch('browser_pool.extract_filters_rendered', rendered):
+            result = analyze_menu.extract_filters_from_all_categories(
+                str(input_file), str(tmp_path / 'out.json'), rendered=True, fused_validation=True)
+
+        assert [category['url'] for category in result] == ['https://www.jumbo.com.ar/cat-0']
+        rendered.assert_called_once_with('https://www.jumbo.com.ar/cat-0')
+
+
+class TestCheckpointDuringBatch:
+    """Tests para el checkpoint de --rendered / --async mientras avanza el lote"""
+
+    def test_rendered_crash_keeps_finished_categories(self, tmp_path):
+        """Test que si el navegador se cae a mitad del lote, --resume solo repite lo pendiente"""
+        input_file = write_categories(tmp_path, 2)
+        output_file = str(tmp_path / 'out.json')
+        filters = ['Categoría', 'Sub-Categoría', 'Tipo de Producto', 'Marca']
+
+        def crash_on_second(url):
+            if url.endswith('cat-1'):
+                raise RuntimeError('Chrome se cerró')
+            return filters
+
+        def run(render, resume):
+            with patch.object(analyze_menu, 'get_shared_scraper', return_value=mock_scraper()), \
+                    patch('browser_pool.get_browser_pool', return_value=Mock(size=1)), \
+                    patch('browser_pool.close_browser_pool'), \
+                    patch('browser_pool.extract_filters_rendered', render):
+                return analyze_menu.extract_filters_from_all_categories(
+                    str(input_file), output_file, rendered=True, resume=resume)
+
+        with pytest.raises(RuntimeError):
+            run(Mock(side_effect=crash_on_second), resume=False)
+
+        render = Mock(return_value=filters)
+        result = run(render, resume=True)
+
+        render.assert_called_once_with('https://www.jumbo.com.ar/cat-1')
+        assert [category['filters'] for category in result] == [filters, filters]
+
+    def test_async_pages_are_recorded_as_they_arrive(self, tmp_path):
+        """Test que con --async cada página queda en el checkpoint al terminar su descarga"""
+        input_file = write_categories(tmp_path, 2)
+        recorded = []
+
+        def fetch_pages(urls, on_page=None):
+            on_page(urls[0], PAGE)
+            recorded.append(read_journal_urls(tmp_path))
+            on_page(urls[1], None)
+            return [PAGE, None]
+
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=mock_scraper()), \
+                patch('async_scraper.fetch_pages', fetch_pages):
+            result = analyze_menu.extract_filters_from_all_categories(
+                str(input_file), str(tmp_path / 'out.json'), use_async=True)
+
+        assert recorded == [['https://www.jumbo.com.ar/cat-0']]
+        assert read_journal_urls(tmp_path) == ['https://www.jumbo.com.ar/cat-0']
+        assert len(result) == 2
+
+
+class TestFilterMenuLinks:
+    """Tests para el filtrado de los enlaces del menú (sin navegador)"""
+
+    def test_duplicates_and_excluded_links(self):
+        """Test que se descartan duplicados, productos, descuentos, legales y enlaces genéricos"""
+        links = [
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/almacen', 'text': 'Almacén'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/almacen', 'text': 'Almacén'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/bebidas', 'text': ' Bebidas! '},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/descuentos', 'text': 'Promos'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/info', 'text': 'Legales'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/ofertas', 'text': 'Ofertas'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/yerba-x/p', 'text': 'Yerba'},
+            {'selector': 'menu', 'href': 'https://www.jumbo.com.ar/frescos#top', 'text': 'Frescos'},
+            {'selector': 'menu', 'href': 'https://otro-sitio.com/almacen', 'text': 'Externo'},
+            {'selector': 'footer', 'href': None, 'text': 'Sin enlace'},
+        ]
+
+        categories = analyze_menu.filter_menu_links(links)
+
+        assert categories == [
+            {'name': 'Almacén', 'url': 'https://www.jumbo.com.ar/almacen', 'text_original': 'Almacén'},
+            {'name': 'Bebidas', 'url': 'https://www.jumbo.com.ar/bebidas', 'text_original': 'Bebidas!'},
+        ]
+
+
+class TestNetworkDiscovery:
+    """Tests para las categorías de la etapa 3.2 tomadas del tráfico de red"""
+
+    def test_harvested_tree_goes_through_menu_filter(self):
+        """Test que el árbol capturado se filtra igual que los enlaces del menú"""
+        tree = [{'name': 'Almacén', 'url': '/almacen', 'children': [
+            {'name': 'Aceites', 'url': '/almacen/aceites', 'children': []},
+        ]}, {'name': 'Descuentos', 'url': '/descuentos', 'children': []}]
+        responses = [{'url': 'tree', 'payload': tree}]
+
+        with patch('network_harvest.harvest_json_responses', return_value=responses):
+            categories = analyze_menu.extract_categories_from_network(Mock())
+
+        assert [category['url'] for category in categories] == [
+            'https://www.jumbo.com.ar/almacen', 'https://www.jumbo.com.ar/almacen/aceites'
+        ]
+
+    def test_without_tree_falls_back_to_menu(self):
+        """Test que sin árbol capturado se devuelve [] para recorrer el DOM"""
+        with patch('network_harvest.harvest_json_responses', return_value=[{'url': 'x', 'payload': {}}]):
+            assert analyze_menu.extract_categories_from_network(Mock()) == []
+
+
+class TestCanonicalUrls:
+    """Tests para la reescritura de URLs con el mapa de redirecciones"""
+
+    def test_uses_the_scraper_map(self, tmp_path):
+        """Test que se usa el mapa del scraper (None con --record / --replay), no el del disco"""
+        from redirects import RedirectMap
+
+        redirect_map = RedirectMap(tmp_path / 'redirects.json')
+        redirect_map.record('https://www.jumbo.com.ar/viejo', 'https://www.jumbo.com.ar/nuevo')
+        categories = [{'name': 'Viejo', 'url': 'https://www.jumbo.com.ar/viejo'}]
+
+        replaying = mock_scraper()
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=replaying), \
+                patch('redirects.get_redirect_map', return_value=redirect_map):
+            analyze_menu.apply_canonical_urls(categories)
+        assert categories[0]['url'] == 'https://www.jumbo.com.ar/viejo'
+
+        live = mock_scraper()
+        live.redirect_map = redirect_map
+        with patch.object(analyze_menu, 'get_shared_scraper', return_value=live):
+            analyze_menu.apply_canonical_urls(categories)
+        assert categories[0]['url'] == 'https://www.jumbo.com.ar/nuevo'
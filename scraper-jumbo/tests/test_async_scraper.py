@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Async Scraper
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from async_scraper import AsyncJumboScraper
+from rate_limiter import RateLimiter
+from config import get_config
+
+
+def _build_app(calls):
+    """Servidor local con páginas de categorías de prueba"""
+    async def category(request):
+        calls.append(request.path)
+        name = request.match_info['name']
+        if name == 'missing':
+            raise web.HTTPNotFound()
+        if name == 'short':
+            return web.Response(text='Short', content_type='text/html')
+        return web.Response(text=f'<html><body>{name} ' + 'x' * 200 + '</body></html>',
+                            content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/{name}', category)
+    return app
+
+
+def _run_with_server(coro_factory):
+    """Ejecuta una corutina con un servidor local levantado"""
+    calls = []
+
+    async def _run():
+        server = TestServer(_build_app(calls))
+        await server.start_server()
+        try:
+            return await coro_factory(str(server.make_url('')))
+        finally:
+            await server.close()
+
+    return asyncio.run(_run()), calls
+
+
+class TestAsyncJumboScraper:
+    """Tests para la clase AsyncJumboScraper"""
+
+    def test_get_many_preserves_order(self):
+        """Test que get_many devuelve los contenidos en el orden de las URLs"""
+        names = [f'cat-{i}' for i in range(20)]
+
+        async def fetch(base_url):
+            async with AsyncJumboScraper(concurrency=5) as scraper:
+                scraper.rate_limiter = RateLimiter()  # Sin límite en el servidor local
+                return await scraper.get_many([f'{base_url}/{name}' for name in names])
+
+        results, calls = _run_with_server(fetch)
+
+        assert len(results) == 20
+        for name, content in zip(names, results):
+            assert content.startswith(f'<html><body>{name} ')
+        assert len(calls) == 20
+
+    def test_connections_per_host_are_capped(self):
+        """Test que el connector respeta max_connections_per_host además de async_concurrency"""
+        async def open_connector(base_url):
+            async with AsyncJumboScraper(concurrency=50) as scraper:
+                return scraper.session.connector.limit, scraper.session.connector.limit_per_host
+
+        (limit, per_host), _ = _run_with_server(open_connector)
+
+        assert limit == 50
+        assert per_host == get_config().get('max_connections_per_host', 4)
+
+    def test_4xx_is_not_retried(self):
+        """Test que los errores 4xx (excepto 429) no se reintentan"""
+        async def fetch(base_url):
+            async with AsyncJumboScraper() as scraper:
+                return await scraper.get_page(f'{base_url}/missing', max_retries=2)
+
+        result, calls = _run_with_server(fetch)
+
+        assert result is None
+        assert calls == ['/missing']
+
+    def test_content_validation(self):
+        """Test que el contenido demasiado pequeño se considera inválido"""
+        async def fetch(base_url):
+            async with AsyncJumboScraper() as scraper:
+                return await scraper.get_page(f'{base_url}/short', max_retries=0)
+
+        result, calls = _run_with_server(fetch)
+
+        assert result is None
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Browser (utilidades de Selenium, sin navegador real)
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from unittest.mock import Mock, patch
+
+pytest.importorskip('selenium')
+from selenium.common.exceptions import NoSuchElementException
+
+import browser
+from browser import (wait_for_element, wait_for_stable_count, collect_menu_links,
+                     create_chrome_driver, apply_lean_profile, BLOCKED_RESOURCE_PATTERNS,
+                     MENU_LINK_SELECTOR, MENU_LINK_SELECTORS, MENU_CONTAINER_SELECTORS)
+
+
+class TestReadinessWaits:
+    """Tests para las esperas basadas en eventos"""
+
+    def test_wait_for_element_returns_visible_element(self):
+        """Test que devuelve el elemento apenas es visible, sin sleeps fijos"""
+        element = Mock()
+        element.is_displayed.return_value = True
+        driver = Mock()
+        driver.find_element.side_effect = [NoSuchElementException(), element]
+
+        assert wait_for_element(driver, 'span.trigger', timeout=2) is element
+        assert driver.find_element.call_count == 2
+
+    def test_wait_for_element_timeout(self):
+        """Test que devuelve None al vencer el timeout"""
+        driver = Mock()
+        driver.find_element.side_effect = NoSuchElementException()
+
+        assert wait_for_element(driver, 'span.trigger', timeout=0.3) is None
+
+    def test_wait_for_stable_count(self):
+        """Test que la espera del submenú se delega al MutationObserver con timeout"""
+        driver = Mock()
+        driver.execute_async_script.return_value = {'count': 42, 'stable': True}
+
+        result = wait_for_stable_count(driver, MENU_LINK_SELECTOR, timeout=10, quiet_ms=300)
+
+        assert result == {'count': 42, 'stable': True}
+        driver.set_script_timeout.assert_called_once_with(15)
+        args = driver.execute_async_script.call_args.args
+        assert 'MutationObserver' in args[0]
+        assert args[1:] == (MENU_LINK_SELECTOR, 300, 10000)
+
+
+class TestCollectMenuLinks:
+    """Tests para la extracción en bloque de enlaces del menú"""
+
+    def test_single_round_trip(self):
+        """Test que contenedor, hrefs y textos se obtienen con un único execute_script"""
+        snapshot = {
+            'container': '.vtex-menu-2-x-submenu',
+            'links': [
+                {'selector': MENU_LINK_SELECTORS[0], 'href': 'https://www.jumbo.com.ar/almacen',
+                 'text': 'Almacén', 'visible': True, 'container': '.vtex-menu-2-x-submenu'},
+            ]
+        }
+        driver = Mock()
+        driver.execute_script.return_value = snapshot
+
+        assert collect_menu_links(driver) == snapshot
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+
+        script, containers, links, prefix = driver.execute_script.call_args.args
+        assert 'querySelectorAll' in script
+        assert containers == MENU_CONTAINER_SELECTORS
+        assert links == MENU_LINK_SELECTORS
+        assert prefix == '.vtex-menu-2-x-menuItem '
+
+    def test_custom_selectors(self):
+        """Test que se pueden pasar selectores propios"""
+        driver = Mock()
+        driver.execute_script.return_value = {'container': None, 'links': []}
+
+        collect_menu_links(driver, ['nav'], ['nav a'], scope_prefix='')
+
+        assert driver.execute_script.call_args.args[1:] == (['nav'], ['nav a'], '')
+
+
+class TestLeanProfile:
+    """Tests para el bloqueo de recursos pesados"""
+
+    def test_headless_blocks_resources_by_default(self):
+        """Test que en headless se bloquean imágenes, fuentes y trackers"""
+        with patch.object(browser.webdriver, 'Chrome') as chrome:
+            driver = create_chrome_driver(headless=True)
+
+        options = chrome.call_args.kwargs['options']
+        assert '--headless=new' in options.arguments
+        assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+
+        commands = [call.args for call in driver.execute_cdp_cmd.call_args_list]
+        assert commands[0] == ('Network.enable', {})
+        blocked = commands[1][1]['urls']
+        assert commands[1][0] == 'Network.setBlockedURLs'
+        assert '*.woff2' in blocked and '*.jpg' in blocked
+        assert '*google-analytics.com*' in blocked
+
+    def test_visible_browser_not_blocked(self):
+        """Test que con ventana (verificación visual) no se bloquea nada por defecto"""
+        with patch.object(browser.webdriver, 'Chrome') as chrome:
+            driver = create_chrome_driver(headless=False)
+
+        options = chrome.call_args.kwargs['options']
+        assert 'prefs' not in options.experimental_options
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_cdp_failure_is_not_fatal(self):
+        """Test que si CDP no está disponible el driver sigue funcionando"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = Exception('CDP no soportado')
+
+        assert apply_lean_profile(driver, BLOCKED_RESOURCE_PATTERNS) is False
+
+    def test_network_logging_capability(self):
+        """Test que harvest_network activa el log de performance de Chrome"""
+        with patch.object(browser.webdriver, 'Chrome') as chrome:
+            create_chrome_driver(headless=True, harvest_network=True)
+
+        options = chrome.call_args.kwargs['options']
+        assert options.to_capabilities()['goog:loggingPrefs'] == {'performance': 'ALL'}
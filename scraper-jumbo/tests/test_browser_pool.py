@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Browser Pool (con drivers simulados, sin Chrome real)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from browser_pool import BrowserPool, extract_filters_rendered
+from extractor import BASE_FILTERS
+
+
+def make_driver(titles=None):
+    """Driver simulado con un panel de filtros renderizado"""
+    driver = Mock()
+    driver.execute_async_script.return_value = {'count': len(titles or []), 'stable': True}
+    driver.execute_script.return_value = titles or []
+    driver.page_source = '<html><body></body></html>'
+    return driver
+
+
+class TestBrowserPool:
+    """Tests para el pool de navegadores"""
+
+    def test_browsers_started_once(self):
+        """Test que los navegadores se inician al crear el pool y se reutilizan"""
+        factory = Mock(side_effect=lambda: make_driver())
+        pool = BrowserPool(size=2, driver_factory=factory)
+        assert factory.call_count == 2
+
+        for _ in range(5):
+            with pool.checkout() as driver:
+                driver.get('https://www.jumbo.com.ar/almacen')
+
+        assert factory.call_count == 2
+        pool.close()
+
+    def test_checkout_limits_parallelism(self):
+        """Test que cada navegador atiende una categoría a la vez"""
+        pool = BrowserPool(size=2, driver_factory=make_driver)
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def work(_):
+            with pool.checkout():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(work, range(12)))
+
+        assert peak[0] == 2
+        pool.close()
+
+    def test_broken_browser_is_replaced(self):
+        """Test que un navegador que falla se reemplaza por uno nuevo"""
+        factory = Mock(side_effect=lambda: make_driver())
+        pool = BrowserPool(size=1, driver_factory=factory)
+
+        with pytest.raises(RuntimeError):
+            with pool.checkout() as driver:
+                raise RuntimeError('sesión perdida')
+
+        driver.quit.assert_called_once()
+        assert factory.call_count == 2
+        with pool.checkout() as replacement:
+            assert replacement is not driver
+        pool.close()
+
+    def test_close_quits_browsers(self):
+        """Test que close cierra todos los navegadores"""
+        drivers = []
+
+        def factory():
+            drivers.append(make_driver())
+            return drivers[-1]
+
+        pool = BrowserPool(size=3, driver_factory=factory)
+        pool.close()
+
+        assert all(driver.quit.called for driver in drivers)
+        with pytest.raises(RuntimeError):
+            with pool.checkout():
+                pass
+
+
+class TestExtractFiltersRendered:
+    """Tests para la extracción de filtros desde la página renderizada"""
+
+    def test_reads_filter_panel(self):
+        """Test que los filtros se leen del panel renderizado"""
+        pool = BrowserPool(size=1, driver_factory=lambda: make_driver(['Marca', 'Precio', 'Tamaño']))
+
+        with patch('browser_pool.get_rate_limiter') as limiter:
+            filters = extract_filters_rendered('https://www.jumbo.com.ar/almacen', pool=pool)
+
+        limiter.return_value.acquire.assert_called_once_with('https://www.jumbo.com.ar/almacen')
+        assert filters == BASE_FILTERS + ['Marca', 'Tamaño']
+        pool.close()
+
+    def test_failed_render_returns_empty(self):
+        """Test que un error del navegador no interrumpe la extracción"""
+        driver = make_driver()
+        driver.get.side_effect = RuntimeError('timeout')
+        pool = BrowserPool(size=1, driver_factory=lambda: driver)
+
+        with patch('browser_pool.get_rate_limiter'):
+            assert extract_filters_rendered('https://www.jumbo.com.ar/almacen', pool=pool) == []
+        pool.close()
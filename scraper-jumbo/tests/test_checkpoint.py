@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Checkpoint (diario de categorías terminadas)
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from unittest.mock import Mock
+
+from checkpoint import CheckpointJournal
+from extractor import extract_filters_from_categories
+
+
+def make_categories(count):
+    return [{'name': f'Cat {i}', 'url': f'https://www.jumbo.com.ar/cat-{i}'} for i in range(count)]
+
+
+def page(url):
+    return f'<html><body><div class="filter-item">Marca {url[-1]}</div></body></html>'
+
+
+class TestCheckpointJournal:
+    """Tests para el diario append-only"""
+
+    def test_records_survive_reopen(self, tmp_path):
+        """Test que cada registro queda en disco y se recupera al reanudar"""
+        path = tmp_path / 'filters.jsonl'
+        journal = CheckpointJournal(path)
+        journal.record('https://www.jumbo.com.ar/a', name='A', filters=['Marca'])
+        journal.close()
+
+        resumed = CheckpointJournal(path, resume=True)
+        assert resumed.get('https://www.jumbo.com.ar/a') == {
+            'url': 'https://www.jumbo.com.ar/a', 'name': 'A', 'filters': ['Marca']
+        }
+        assert len(resumed) == 1
+        resumed.close()
+
+    def test_without_resume_starts_over(self, tmp_path):
+        """Test que sin --resume se empieza un diario nuevo"""
+        path = tmp_path / 'filters.jsonl'
+        journal = CheckpointJournal(path)
+        journal.record('https://www.jumbo.com.ar/a', filters=[])
+        journal.close()
+
+        fresh = CheckpointJournal(path)
+        assert len(fresh) == 0
+        fresh.close()
+        assert path.read_text(encoding='utf-8') == ''
+
+    def test_truncated_last_line_is_ignored(self, tmp_path):
+        """Test que una escritura cortada por un crash no impide reanudar"""
+        path = tmp_path / 'filters.jsonl'
+        path.write_text(json.dumps({'url': 'https://www.jumbo.com.ar/a', 'filters': []}) +
+                        '\n{"url": "https://www.jumbo.com.ar/b", "fil', encoding='utf-8')
+
+        journal = CheckpointJournal(path, resume=True)
+        assert journal.get('https://www.jumbo.com.ar/a') is not None
+        assert journal.get('https://www.jumbo.com.ar/b') is None
+        journal.close()
+
+
+class TestResumeExtraction:
+    """Tests para reanudar la extracción de filtros"""
+
+    def test_resume_skips_finished_categories(self, tmp_path):
+        """Test que al reanudar solo se procesan las categorías pendientes"""
+        path = tmp_path / 'filters.jsonl'
+
+        # Primera ejecución: se cae en la categoría 3
+        def crash_at_3(url):
+            if url.endswith('cat-3'):
+                raise KeyboardInterrupt()
+            return page(url)
+
+        scraper = Mock()
+        scraper.get_page.side_effect = crash_at_3
+        journal = CheckpointJournal(path)
+        with pytest.raises(KeyboardInterrupt):
+            extract_filters_from_categories(scraper, make_categories(5), journal=journal)
+        journal.close()
+
+        # Segunda ejecución con --resume
+        scraper = Mock()
+        scraper.get_page.side_effect = page
+        categories = make_categories(5)
+        journal = CheckpointJournal(path, resume=True)
+        extract_filters_from_categories(scraper, categories, workers=2, journal=journal)
+        journal.close()
+
+        fetched = sorted(call.args[0] for call in scraper.get_page.call_args_list)
+        assert fetched == ['https://www.jumbo.com.ar/cat-3', 'https://www.jumbo.com.ar/cat-4']
+        for i, category in enumerate(categories):
+            assert f'Marca {i}' in category['filters']
+        resumed = CheckpointJournal(path, resume=True)
+        assert len(resumed) == 5
+        resumed.close()
+
+    def test_failed_category_is_retried_on_resume(self, tmp_path):
+        """Test que una categoría cuya descarga falló no queda como terminada"""
+        path = tmp_path / 'filters.jsonl'
+
+        # Primera ejecución: la categoría 1 agota los reintentos
+        scraper = Mock()
+        scraper.get_page.side_effect = lambda url: None if url.endswith('cat-1') else page(url)
+        categories = make_categories(3)
+        journal = CheckpointJournal(path)
+        extract_filters_from_categories(scraper, categories, journal=journal)
+        journal.close()
+        assert categories[1]['filters'] == []
+
+        # Segunda ejecución con --resume: solo se reintenta la que falló
+        scraper = Mock()
+        scraper.get_page.side_effect = page
+        categories = make_categories(3)
+        journal = CheckpointJournal(path, resume=True)
+        extract_filters_from_categories(scraper, categories, journal=journal)
+        journal.close()
+
+        assert [call.args[0] for call in scraper.get_page.call_args_list] == ['https://www.jumbo.com.ar/cat-1']
+        assert 'Marca 1' in categories[1]['filters']
+        resumed = CheckpointJournal(path, resume=True)
+        assert len(resumed) == 3
+        resumed.close()
@@ -6,7 +6,7 @@ Tests para la función extract_categories
 import sys
 from pathlib import Path
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 # Agregar el directorio src al path
 project_root = Path(__file__).parent.parent
@@ -132,6 +132,28 @@ class TestExtractCategories:
         assert 'Bebidas' in category_names
         assert 'Lácteos' in category_names
 
+    def test_extract_categories_menu_only_links_order(self):
+        """Test que los enlaces que solo valen dentro de menús van al final, por tipo de contenedor"""
+        html_content = '''
+        <html>
+        <body>
+            <nav><a href="/ver-todo-nav">Ver todo Nav</a></nav>
+            <div class="menu-principal">
+                <div class="submenu"><a href="/ver-todo-menu">Ver todo Menú</a></div>
+                <a href="/almacen">Almacén</a>
+            </div>
+            <a href="/ver-fuera">Ver fuera de menú</a>
+            <a href="/bebidas">Bebidas</a>
+        </body>
+        </html>
+        '''
+
+        categories = extract_categories(html_content)
+
+        assert [cat['name'] for cat in categories] == [
+            'Almacén', 'Bebidas', 'Ver todo Menú', 'Ver todo Nav'
+        ]
+
     def test_extract_categories_filters_long_text(self):
         """Test que filtra textos muy largos (productos)"""
         html_content = '''
@@ -148,3 +170,255 @@ class TestExtractCategories:
         # Solo debería encontrar Almacén
         assert len(categories) == 1
         assert categories[0]['name'] == 'Almacén'
+
+
+class TestExtractFiltersFromCategories:
+    """Tests para la extracción de filtros de varias categorías"""
+
+    def test_workers_preserve_category_order(self):
+        """Test que el modo concurrente conserva el orden de las categorías"""
+        from extractor import extract_filters_from_categories
+
+        pages = {
+            f'https://www.jumbo.com.ar/cat-{i}': (
+                f'<html><body><div class="filter-item">Marca{i}</div></body></html>'
+            )
+            for i in range(10)
+        }
+        scraper = Mock()
+        scraper.get_page.side_effect = lambda url: pages[url]
+
+        categories = [
+            {'name': f'Cat {i}', 'url': f'https://www.jumbo.com.ar/cat-{i}', 'filters': []}
+            for i in range(10)
+        ]
+
+        result = extract_filters_from_categories(scraper, categories, workers=4)
+
+        assert [cat['name'] for cat in result] == [f'Cat {i}' for i in range(10)]
+        for i, category in enumerate(result):
+            assert f'Marca{i}' in category['filters']
+        assert scraper.get_page.call_count == 10
+
+
+class TestHybridExtraction:
+    """Tests para la extracción híbrida (HTTP primero, navegador a demanda)"""
+
+    HYBRID_CONFIG = {'filter_source': 'hybrid', 'hybrid_static_source': 'html'}
+
+    def test_escalates_only_incomplete_pages(self):
+        """Test que solo las páginas con filtros base se renderizan en el navegador"""
+        import extractor
+        from extractor import extract_filters_from_categories, BASE_FILTERS
+
+        pages = {
+            'https://www.jumbo.com.ar/completa': '<html><body><div class="filter-item">Marca</div></body></html>',
+            'https://www.jumbo.com.ar/dinamica': '<html><body><p>Cargando...</p></body></html>',
+        }
+        scraper = Mock()
+        scraper.get_page.side_effect = lambda url: pages[url]
+        rendered = Mock(return_value=BASE_FILTERS + ['Tamaño'])
+
+        categories = [{'name': 'Completa', 'url': 'https://www.jumbo.com.ar/completa'},
+                      {'name': 'Dinámica', 'url': 'https://www.jumbo.com.ar/dinamica'}]
+
+        extractor.get_extraction_stats().reset()
+        with patch.object(extractor, 'get_config', return_value=self.HYBRID_CONFIG), \
+                patch('browser_pool.extract_filters_rendered', rendered):
+            extract_filters_from_categories(scraper, categories)
+
+        rendered.assert_called_once_with('https://www.jumbo.com.ar/dinamica')
+        assert categories[0]['filters'] == BASE_FILTERS + ['Marca']
+        assert categories[1]['filters'] == BASE_FILTERS + ['Tamaño']
+        assert extractor.get_extraction_stats().snapshot() == {
+            'html': 1, 'api': 0, 'browser': 1, 'escalated': 1
+        }
+
+    def test_keeps_static_result_when_browser_adds_nothing(self):
+        """Test que si el navegador no mejora el resultado se conserva el estático"""
+        import extractor
+        from extractor import extract_filters_from_category, BASE_FILTERS
+
+        scraper = Mock()
+        scraper.get_page.return_value = '<html><body><p>Sin filtros</p></body></html>'
+
+        extractor.get_extraction_stats().reset()
+        with patch.object(extractor, 'get_config', return_value=self.HYBRID_CONFIG), \
+                patch('browser_pool.extract_filters_rendered', return_value=[]):
+            filters = extract_filters_from_category(scraper, 'https://www.jumbo.com.ar/vacia')
+
+        assert filters == BASE_FILTERS
+        assert extractor.get_extraction_stats().snapshot()['html'] == 1
+        assert extractor.get_extraction_stats().snapshot()['escalated'] == 1
+
+    PAGES = {
+        'https://www.jumbo.com.ar/completa': '<html><body><div class="filter-item">Marca</div></body></html>',
+        'https://www.jumbo.com.ar/dinamica': '<html><body><p>Cargando...</p></body></html>',
+    }
+
+    def test_async_download_escalates(self):
+        """Test que --async con hybrid escala al navegador y registra el resumen de vías"""
+        import extractor
+        from extractor import extract_filters_from_categories, BASE_FILTERS
+
+        rendered = Mock(return_value=BASE_FILTERS + ['Tamaño'])
+        categories = [{'name': 'Completa', 'url': 'https://www.jumbo.com.ar/completa'},
+                      {'name': 'Dinámica', 'url': 'https://www.jumbo.com.ar/dinamica'}]
+
+        extractor.get_extraction_stats().reset()
+        with patch.object(extractor, 'get_config', return_value=self.HYBRID_CONFIG), \
+                patch('async_scraper.fetch_pages', return_value=list(self.PAGES.values())), \
+                patch('browser_pool.extract_filters_rendered', rendered), \
+                patch.object(extractor.logger, 'info') as info:
+            extract_filters_from_categories(Mock(), categories, use_async=True)
+
+        rendered.assert_called_once_with('https://www.jumbo.com.ar/dinamica')
+        assert categories[1]['filters'] == BASE_FILTERS + ['Tamaño']
+        assert extractor.get_extraction_stats().snapshot() == {
+            'html': 1, 'api': 0, 'browser': 1, 'escalated': 1
+        }
+        assert any('Vías de extracción' in call.args[0] for call in info.call_args_list)
+
+    def test_async_download_not_used_for_browser_source(self):
+        """Test que --async con filter_source browser usa el flujo por categoría"""
+        import extractor
+        from extractor import extract_filters_from_categories, BASE_FILTERS
+
+        fetch_pages = Mock()
+        categories = [{'name': 'Completa', 'url': 'https://www.jumbo.com.ar/completa'}]
+
+        with patch.object(extractor, 'get_config', return_value={'filter_source': 'browser'}), \
+                patch('async_scraper.fetch_pages', fetch_pages), \
+                patch('browser_pool.extract_filters_rendered', return_value=BASE_FILTERS + ['Marca']):
+            extract_filters_from_categories(Mock(), categories, use_async=True)
+
+        fetch_pages.assert_not_called()
+        assert categories[0]['filters'] == BASE_FILTERS + ['Marca']
+
+    def test_pipeline_escalates(self):
+        """Test que --pipeline con hybrid escala al navegador las páginas incompletas"""
+        import extractor
+        import pipeline
+        from scraper import FetchResult
+        from extractor import BASE_FILTERS
+
+        scraper = Mock()
+        scraper.fetch.side_effect = lambda url, as_bytes=False: FetchResult(
+            url, self.PAGES[url].encode('utf-8'), encoding='utf-8')
+        rendered = Mock(return_value=BASE_FILTERS + ['Tamaño'])
+        categories = [{'name': 'Completa', 'url': 'https://www.jumbo.com.ar/completa', 'filters': []},
+                      {'name': 'Dinámica', 'url': 'https://www.jumbo.com.ar/dinamica', 'filters': []}]
+
+        extractor.get_extraction_stats().reset()
+        with patch.object(pipeline, 'get_config', return_value=self.HYBRID_CONFIG), \
+                patch('browser_pool.extract_filters_rendered', rendered):
+            pipeline.extract_filters_pipelined(scraper, categories, io_workers=2, parse_workers=1)
+
+        rendered.assert_called_once_with('https://www.jumbo.com.ar/dinamica')
+        assert categories[0]['filters'] == BASE_FILTERS + ['Marca']
+        assert categories[1]['filters'] == BASE_FILTERS + ['Tamaño']
+        assert extractor.get_extraction_stats().snapshot() == {
+            'html': 1, 'api': 0, 'browser': 1, 'escalated': 1
+        }
+
+
+class TestParseHtml:
+    """Tests para el backend de parseo HTML configurable"""
+
+    def test_unavailable_backend_falls_back(self):
+        """Test que un backend no instalado cae en html.parser"""
+        from html_parser import resolve_parser
+
+        assert resolve_parser('parser-inexistente') == 'html.parser'
+        assert resolve_parser('html.parser') == 'html.parser'
+
+    def test_backends_extract_same_categories(self):
+        """Test que todos los backends disponibles producen las mismas categorías"""
+        from bs4.builder import builder_registry
+        from html_parser import parse_html
+        import extractor
+
+        html_content = '''
+        <html><body>
+            <nav class="menu-principal"><a href="/almacen">Almacén</a><a href="/bebidas">Bebidas</a></nav>
+            <a href="/lacteos">Lácteos</a>
+        </body></html>
+        '''
+        expected = extract_categories(html_content)
+
+        for backend in ['html.parser', 'lxml']:
+            if builder_registry.lookup(backend) is None:
+                continue
+            with patch.object(extractor, 'parse_html', lambda html, b=backend: parse_html(html, b)):
+                assert extract_categories(html_content) == expected
+
+
+class TestPipeline:
+    """Tests para el modo pipeline (descarga en threads + parseo en procesos)"""
+
+    def test_pipeline_fills_filters_in_order(self):
+        """Test que el pipeline completa los filtros de cada categoría en su lugar"""
+        from pipeline import extract_filters_pipelined
+        from scraper import FetchResult
+
+        pages = {
+            f'https://www.jumbo.com.ar/cat-{i}': (
+                f'<html><body><div class="filter-item">Marca{i}</div></body></html>'
+            ).encode('utf-8')
+            for i in range(8)
+        }
+        pages['https://www.jumbo.com.ar/cat-3'] = None  # Falla la descarga
+        scraper = Mock()
+        scraper.fetch.side_effect = lambda url, as_bytes=False: FetchResult(url, pages[url], encoding='utf-8')
+
+        categories = [
+            {'name': f'Cat {i}', 'url': f'https://www.jumbo.com.ar/cat-{i}', 'filters': []}
+            for i in range(8)
+        ]
+
+        result = extract_filters_pipelined(scraper, categories, io_workers=3,
+                                           parse_workers=2, max_pending=2)
+
+        assert [cat['name'] for cat in result] == [f'Cat {i}' for i in range(8)]
+        for i, category in enumerate(result):
+            if i == 3:
+                assert category['filters'] == []
+            else:
+                assert f'Marca{i}' in category['filters']
+
+    def test_unexpected_error_does_not_hang(self):
+        """Test que un error fuera de los try de una etapa termina la categoría en vez de colgar el pipeline"""
+        import threading
+        import pipeline
+        from scraper import FetchResult
+
+        page = b'<html><body><div class="filter-item">Marca</div></body></html>'
+        scraper = Mock()
+        scraper.fetch.side_effect = lambda url, as_bytes=False: FetchResult(url, page, encoding='utf-8')
+        categories = [{'name': f'Cat {i}', 'url': f'https://www.jumbo.com.ar/cat-{i}', 'filters': []}
+                      for i in range(3)]
+
+        def lookup(body, url, encoding):
+            if url.endswith('cat-1'):
+                raise RuntimeError('huella inválida')
+            return None, None
+
+        with patch.object(pipeline, 'find_unchanged_filters', side_effect=lookup):
+            runner = threading.Thread(target=pipeline.extract_filters_pipelined, args=(scraper, categories),
+                                      kwargs={'io_workers': 2, 'parse_workers': 1}, daemon=True)
+            runner.start()
+            runner.join(timeout=30)
+
+        assert not runner.is_alive()
+        assert categories[1]['filters'] == []
+        assert 'Marca' in categories[0]['filters'] and 'Marca' in categories[2]['filters']
+
+    def test_declared_charset_matches_threaded_path(self):
+        """Test que los bytes con el charset declarado dan los mismos filtros que el texto decodificado"""
+        from extractor import parse_filters_from_html
+
+        html = '<html><body><div class="filter-item">Бренд</div><div class="facet">Тип</div></body></html>'
+        body = html.encode('cp1251')
+
+        assert (parse_filters_from_html(body, 'https://www.jumbo.com.ar/a', 'cp1251') ==
+                parse_filters_from_html(body.decode('cp1251'), 'https://www.jumbo.com.ar/a'))
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Fingerprints (re-scraping incremental)
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio src (y la raíz, para analyze_menu) al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+sys.path.insert(1, str(project_root))
+
+import pytest
+from unittest.mock import Mock, patch
+
+import extractor
+from fingerprints import FingerprintStore, content_fingerprint
+from extractor import extract_filters_from_categories
+
+
+PAGE = '<html><body><div class="filter-item">Marca</div></body></html>'
+CHANGED_PAGE = '<html><body><div class="filter-item">Marca</div><div class="facet">Tamaño</div></body></html>'
+
+
+class TestFingerprintStore:
+    """Tests para el almacén de huellas"""
+
+    def test_str_and_bytes_fingerprint_match(self):
+        """Test que la huella no depende de si el contenido llega como str o bytes"""
+        assert content_fingerprint(PAGE) == content_fingerprint(PAGE.encode('utf-8'))
+
+    def test_strip_patterns_ignore_volatile_fragments(self, tmp_path):
+        """Test que los fragmentos volátiles configurados no cambian la huella"""
+        store = FingerprintStore(tmp_path / 'fp.json', strip_patterns=[r'nonce="[^"]*"'])
+
+        assert (store.fingerprint('<script nonce="abc">x</script>') ==
+                store.fingerprint('<script nonce="xyz">x</script>'))
+
+    def test_roundtrip_between_runs(self, tmp_path):
+        """Test que las huellas guardadas se reutilizan en la ejecución siguiente"""
+        path = tmp_path / 'fp.json'
+        store = FingerprintStore(path)
+        fingerprint = store.fingerprint(PAGE)
+        store.update('https://www.jumbo.com.ar/a', fingerprint, ['Marca'])
+        store.save()
+
+        next_run = FingerprintStore(path)
+        assert next_run.lookup('https://www.jumbo.com.ar/a', fingerprint) == ['Marca']
+        assert next_run.lookup('https://www.jumbo.com.ar/a', next_run.fingerprint(CHANGED_PAGE)) is None
+        assert next_run.reused == 1
+
+
+class TestIncrementalExtraction:
+    """Tests para la extracción incremental de filtros"""
+
+    def run(self, store, pages):
+        scraper = Mock()
+        scraper.get_page.side_effect = lambda url: pages[url]
+        categories = [{'name': url[-1], 'url': url} for url in pages]
+
+        with patch('fingerprints.get_fingerprint_store', return_value=store), \
+                patch.object(extractor, 'parse_filters_from_html',
+                             wraps=extractor.parse_filters_from_html) as parse:
+            extract_filters_from_categories(scraper, categories)
+        return categories, parse
+
+    def test_unchanged_pages_are_not_parsed(self, tmp_path):
+        """Test que solo se parsean las páginas que cambiaron"""
+        path = tmp_path / 'fp.json'
+        urls = ['https://www.jumbo.com.ar/a', 'https://www.jumbo.com.ar/b']
+
+        first = FingerprintStore(path)
+        self.run(first, {urls[0]: PAGE, urls[1]: PAGE})
+        first.save()
+        assert first.extracted == 2
+
+        second = FingerprintStore(path)
+        categories, parse = self.run(second, {urls[0]: PAGE, urls[1]: CHANGED_PAGE})
+
+        assert parse.call_count == 1
+        assert second.summary() == '1 reutilizadas sin cambios, 1 re-extraídas'
+        assert 'Marca' in categories[0]['filters']
+        assert 'Tamaño' in categories[1]['filters']
+
+    def test_pipeline_reuses_unchanged_pages(self, tmp_path):
+        """Test que --pipeline --incremental no vuelve a parsear las páginas sin cambios"""
+        from pipeline import extract_filters_pipelined
+        from scraper import FetchResult
+
+        path = tmp_path / 'fp.json'
+        urls = ['https://www.jumbo.com.ar/a', 'https://www.jumbo.com.ar/b']
+
+        def run(store, pages):
+            scraper = Mock()
+            scraper.fetch.side_effect = lambda url, as_bytes=False: FetchResult(
+                url, pages[url].encode('utf-8'), encoding='utf-8')
+            categories = [{'name': url[-1], 'url': url, 'filters': []} for url in urls]
+            with patch('fingerprints.get_fingerprint_store', return_value=store):
+                return extract_filters_pipelined(scraper, categories, io_workers=2, parse_workers=1)
+
+        first = FingerprintStore(path)
+        run(first, {urls[0]: PAGE, urls[1]: PAGE})
+        first.save()
+
+        second = FingerprintStore(path)
+        categories = run(second, {urls[0]: PAGE, urls[1]: CHANGED_PAGE})
+
+        assert second.summary() == '1 reutilizadas sin cambios, 1 re-extraídas'
+        assert 'Tamaño' in categories[1]['filters']
+
+
+class TestFilterRegion:
+    """Tests para la huella de la región de filtros"""
+
+    def test_region_ignores_per_request_tokens(self):
+        """Test que nonces y scripts ajenos a los filtros no cambian la huella de la región"""
+        first = ('<html><head><script nonce="abc">__RUNTIME__={"requestId":"1"}</script></head>'
+                 '<body data-token="t1"><div class="filter-item">Marca</div></body></html>')
+        second = ('<html><head><script nonce="xyz">__RUNTIME__={"requestId":"2"}</script></head>'
+                  '<body data-token="t2"><div class="filter-item">Marca</div></body></html>')
+
+        assert content_fingerprint(first) != content_fingerprint(second)
+        assert content_fingerprint(first, scope='region') == content_fingerprint(second, scope='region')
+
+    def test_region_tracks_filter_changes(self):
+        """Test que un filtro nuevo (en el HTML o en un script de facets) cambia la huella"""
+        script = '<script>window.facets={"name": "%s"}</script>'
+
+        assert content_fingerprint(PAGE, scope='region') != content_fingerprint(CHANGED_PAGE, scope='region')
+        assert (content_fingerprint(script % 'Marca', scope='region') !=
+                content_fingerprint(script % 'Color', scope='region'))
+
+    def test_invalid_scope_is_rejected(self, tmp_path):
+        """Test que un alcance desconocido se rechaza al crear el almacén"""
+        with pytest.raises(ValueError):
+            FingerprintStore(tmp_path / 'fp.json', scope='body')
+
+
+class TestFingerprintProducers:
+    """Tests para las entradas separadas por productor"""
+
+    def test_producers_do_not_share_filters(self, tmp_path):
+        """Test que los filtros de analyze_menu no se reutilizan en el extractor (ni entre orígenes)"""
+        import analyze_menu
+
+        store = FingerprintStore(tmp_path / 'fp.json')
+        url = 'https://www.jumbo.com.ar/a'
+        with patch('analyze_menu.get_fingerprint_store', return_value=store):
+            analyze_menu.parse_filters_incremental(PAGE, url, 'A')
+
+        with patch('fingerprints.get_fingerprint_store', return_value=store), \
+                patch.object(extractor, 'get_config', return_value={'filter_source': 'html'}):
+            assert extractor.find_unchanged_filters(PAGE, url)[0] is None
+            extractor.remember_filters(url, store.fingerprint(PAGE), ['Marca'])
+        with patch('fingerprints.get_fingerprint_store', return_value=store), \
+                patch.object(extractor, 'get_config', return_value={'filter_source': 'browser'}):
+            assert extractor.find_unchanged_filters(PAGE, url)[0] is None
+
+    def test_escalated_category_counts_once(self, tmp_path):
+        """Test que una categoría escalada en hybrid cuenta como una sola re-extracción"""
+        from extractor import extract_filters_from_category, BASE_FILTERS
+
+        store = FingerprintStore(tmp_path / 'fp.json')
+        scraper = Mock()
+        scraper.get_page.return_value = '<html><body><p>Cargando...</p></body></html>'
+        config = {'filter_source': 'hybrid', 'hybrid_static_source': 'html'}
+
+        with patch('fingerprints.get_fingerprint_store', return_value=store), \
+                patch.object(extractor, 'get_config', return_value=config), \
+                patch('browser_pool.extract_filters_rendered', return_value=BASE_FILTERS + ['Tamaño']):
+            extract_filters_from_category(scraper, 'https://www.jumbo.com.ar/dinamica')
+
+        assert store.summary() == '0 reutilizadas sin cambios, 1 re-extraídas'
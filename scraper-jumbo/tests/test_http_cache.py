@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo HTTP Cache
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from unittest.mock import Mock, patch
+from http_cache import HttpCache
+from scraper import JumboScraper
+
+
+URL = 'https://www.jumbo.com.ar/electro'
+BODY = ('<html><body>' + 'Electro ' * 50 + '</body></html>').encode('utf-8')
+
+
+class TestHttpCache:
+    """Tests para la clase HttpCache"""
+
+    def test_store_and_get(self, tmp_path):
+        """Test que una respuesta guardada se recupera igual"""
+        cache = HttpCache(tmp_path / 'cache.sqlite')
+        cache.store(URL, BODY, encoding='utf-8', etag='"abc"', last_modified='Mon, 01 Sep 2025 00:00:00 GMT')
+
+        entry = cache.get(URL)
+
+        assert entry.text == BODY.decode('utf-8')
+        assert cache.is_fresh(entry)
+        assert cache.conditional_headers(entry) == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Sep 2025 00:00:00 GMT',
+        }
+        assert cache.get('https://www.jumbo.com.ar/otra') is None
+
+    def test_persists_between_instances(self, tmp_path):
+        """Test que el cache sobrevive entre ejecuciones"""
+        HttpCache(tmp_path / 'cache.sqlite').store(URL, BODY)
+
+        assert HttpCache(tmp_path / 'cache.sqlite').get(URL).body == BODY
+
+    def test_ttl_expiration(self, tmp_path):
+        """Test que una entrada vencida ya no es fresca"""
+        cache = HttpCache(tmp_path / 'cache.sqlite', ttl_seconds=10)
+        cache.store(URL, BODY)
+
+        with patch('http_cache.time.time', return_value=time.time() + 60):
+            assert not cache.is_fresh(cache.get(URL))
+
+    def test_lru_eviction(self, tmp_path):
+        """Test que al superar el tamaño máximo se elimina la entrada menos usada"""
+        cache = HttpCache(tmp_path / 'cache.sqlite', max_size_mb=2.5 * len(BODY) / (1024 * 1024))
+
+        cache.store('https://www.jumbo.com.ar/a', BODY)
+        cache.store('https://www.jumbo.com.ar/b', BODY)
+        cache.get('https://www.jumbo.com.ar/a')  # 'a' pasa a ser la más reciente
+        cache.store('https://www.jumbo.com.ar/c', BODY)
+
+        assert cache.get('https://www.jumbo.com.ar/a') is not None
+        assert cache.get('https://www.jumbo.com.ar/b') is None
+        assert cache.get('https://www.jumbo.com.ar/c') is not None
+
+
+class TestScraperWithCache:
+    """Tests de integración del cache con JumboScraper"""
+
+    @patch('requests.Session.get')
+    def test_revalidation_304_served_from_disk(self, mock_get, tmp_path):
+        """Test que una entrada vencida se revalida y un 304 se sirve del cache"""
+        scraper = JumboScraper()
+        scraper.http_cache = HttpCache(tmp_path / 'cache.sqlite', ttl_seconds=0)
+        scraper.http_cache.store(URL, BODY, encoding='utf-8', etag='"abc"')
+
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.url = URL
+        mock_response.history = []
+        mock_get.return_value = mock_response
+
+        result = scraper.get_page(URL)
+
+        assert result == BODY.decode('utf-8')
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+
+    @patch('requests.Session.get')
+    def test_fresh_entry_skips_network(self, mock_get, tmp_path):
+        """Test que una entrada dentro del TTL no genera requests"""
+        scraper = JumboScraper()
+        scraper.http_cache = HttpCache(tmp_path / 'cache.sqlite')
+        scraper.http_cache.store(URL, BODY, encoding='utf-8')
+
+        assert scraper.get_page(URL) == BODY.decode('utf-8')
+        mock_get.assert_not_called()
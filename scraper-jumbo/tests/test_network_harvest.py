@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Network Harvest (log de performance simulado)
+"""
+
+import sys
+import json
+import base64
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from unittest.mock import Mock
+
+from network_harvest import harvest_json_responses, parse_graphql_facets, parse_harvested
+from extractor import BASE_FILTERS
+
+
+GRAPHQL_FACETS = {
+    'data': {
+        'facets': {
+            'facets': [
+                {'name': 'Categoría', 'type': 'CATEGORYTREE', 'values': [{'name': 'Almacén'}]},
+                {'name': 'Marca', 'type': 'TEXT', 'values': [{'name': 'Arcor'}]},
+                {'name': 'Tipo de Envase', 'type': 'TEXT', 'values': [{'name': 'Lata'}]},
+                {'name': 'Precio', 'type': 'PRICERANGE', 'values': [{'name': '0-100'}]},
+                {'name': 'Interno', 'type': 'TEXT', 'hidden': True, 'values': [{'name': 'x'}]},
+                {'name': 'Vacío', 'type': 'TEXT', 'values': []},
+            ]
+        }
+    }
+}
+
+CATEGORY_TREE = [
+    {'name': 'Almacén', 'url': 'https://www.jumbo.com.ar/almacen', 'children': [
+        {'name': 'Aceites', 'url': 'https://www.jumbo.com.ar/almacen/aceites', 'children': []},
+    ]},
+]
+
+
+def log_entry(method, request_id, url, mime_type='application/json'):
+    """Entrada del log de performance de ChromeDriver"""
+    message = {'message': {'method': method, 'params': {
+        'requestId': request_id,
+        'response': {'url': url, 'mimeType': mime_type},
+    }}}
+    return {'message': json.dumps(message)}
+
+
+class TestHarvestJsonResponses:
+    """Tests para la captura de respuestas JSON del tráfico de red"""
+
+    def test_only_json_bodies_are_fetched(self):
+        """Test que se leen solo los cuerpos de respuestas JSON"""
+        bodies = {
+            '1': {'body': json.dumps(GRAPHQL_FACETS), 'base64Encoded': False},
+            '3': {'body': base64.b64encode(json.dumps(CATEGORY_TREE).encode()).decode(), 'base64Encoded': True},
+        }
+        driver = Mock()
+        driver.get_log.return_value = [
+            log_entry('Network.responseReceived', '1', 'https://www.jumbo.com.ar/_v/segment/graphql/v1'),
+            log_entry('Network.responseReceived', '2', 'https://www.jumbo.com.ar/logo.png', 'image/png'),
+            log_entry('Network.requestWillBeSent', '3', 'https://www.jumbo.com.ar/api/x'),
+            log_entry('Network.responseReceived', '3', 'https://www.jumbo.com.ar/api/catalog_system/pub/category/tree/3'),
+        ]
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: bodies[params['requestId']]
+
+        responses = harvest_json_responses(driver)
+
+        assert [r['payload'] for r in responses] == [GRAPHQL_FACETS, CATEGORY_TREE]
+        assert driver.execute_cdp_cmd.call_count == 2
+
+    def test_missing_body_is_skipped(self):
+        """Test que una respuesta sin cuerpo disponible no interrumpe la captura"""
+        driver = Mock()
+        driver.get_log.return_value = [log_entry('Network.responseReceived', '1', 'https://x/api')]
+        driver.execute_cdp_cmd.side_effect = Exception('No resource with given identifier')
+
+        assert harvest_json_responses(driver) == []
+
+
+class TestParseHarvested:
+    """Tests para el parseo estructurado de las respuestas capturadas"""
+
+    def test_graphql_facets(self):
+        """Test que se excluyen precio, árbol de categorías, ocultos y vacíos"""
+        assert parse_graphql_facets(GRAPHQL_FACETS) == BASE_FILTERS + ['Marca', 'Tipo de Envase']
+
+    def test_not_facets(self):
+        """Test que otras respuestas GraphQL no se interpretan como facets"""
+        assert parse_graphql_facets({'data': {'product': {'name': 'x'}}}) is None
+
+    def test_categories_and_filters(self):
+        """Test que se obtienen categorías y la respuesta de facets más completa"""
+        responses = [
+            {'url': 'tree', 'payload': CATEGORY_TREE},
+            {'url': 'graphql', 'payload': GRAPHQL_FACETS},
+            {'url': 'facets', 'payload': {'Brands': [], 'SpecificationFilters': {}}},
+            {'url': 'other', 'payload': {'ok': True}},
+        ]
+
+        result = parse_harvested(responses, site_url='https://www.jumbo.com.ar')
+
+        assert [c['url'] for c in result['categories']] == [
+            'https://www.jumbo.com.ar/almacen', 'https://www.jumbo.com.ar/almacen/aceites'
+        ]
+        assert result['filters'] == BASE_FILTERS + ['Marca', 'Tipo de Envase']
+
+    def test_no_facets(self):
+        """Test que sin respuestas de facets los filtros quedan en None"""
+        assert parse_harvested([{'url': 'x', 'payload': {'ok': True}}])['filters'] is None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Rate Limiter
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from rate_limiter import TokenBucket, RateLimiter, get_rate_limiter
+
+
+class TestTokenBucket:
+    """Tests para la clase TokenBucket"""
+
+    def test_burst_is_served_without_wait(self):
+        """Test que las primeras `burst` reservas no esperan"""
+        bucket = TokenBucket(rate=1, burst=3)
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+
+    def test_reservations_are_spaced_by_rate(self):
+        """Test que al agotar el burst las reservas se espacian a 1/rate"""
+        bucket = TokenBucket(rate=10, burst=1)
+
+        bucket.reserve()
+        second = bucket.reserve()
+        third = bucket.reserve()
+
+        assert second == pytest.approx(0.1, abs=0.02)
+        assert third == pytest.approx(0.2, abs=0.02)
+
+    def test_min_interval(self):
+        """Test que min_interval separa reservas aunque haya tokens"""
+        bucket = TokenBucket(rate=100, burst=10)
+
+        bucket.reserve()
+        wait = bucket.reserve(min_interval=0.5)
+
+        assert wait == pytest.approx(0.5, abs=0.02)
+
+
+class TestRateLimiter:
+    """Tests para la clase RateLimiter"""
+
+    def test_disabled_limiter_never_waits(self):
+        """Test que con requests_per_second=0 no hay espera"""
+        limiter = RateLimiter()
+        assert not limiter.enabled
+        assert all(limiter.reserve('https://www.jumbo.com.ar/') == 0 for _ in range(100))
+
+    def test_disabled_limiter_keeps_min_interval(self):
+        """Test que sin límite de tasa se respeta igual el delay pedido (get_page_with_retry)"""
+        limiter = RateLimiter()
+
+        assert limiter.reserve('https://www.jumbo.com.ar/almacen') == 0
+        assert limiter.reserve('https://www.jumbo.com.ar/bebidas', min_interval=0.5) == pytest.approx(0.5, abs=0.02)
+        assert limiter.reserve('https://httpbin.org/html', min_interval=0.5) == 0
+
+    def test_buckets_are_per_host(self):
+        """Test que cada host tiene su propio bucket"""
+        limiter = RateLimiter(requests_per_second=1, burst=1)
+
+        assert limiter.reserve('https://www.jumbo.com.ar/electro') == 0
+        assert limiter.reserve('https://httpbin.org/html') == 0
+        assert limiter.reserve('https://www.jumbo.com.ar/almacen') > 0
+
+    def test_global_limiter_from_config(self):
+        """Test que el limitador global se crea desde config.yaml y se comparte"""
+        limiter = get_rate_limiter()
+
+        assert limiter is get_rate_limiter()
+        assert limiter.enabled
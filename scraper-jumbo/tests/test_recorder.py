@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Recorder (grabación / reproducción)
+"""
+
+import sys
+import threading
+from pathlib import Path
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from unittest.mock import Mock, patch
+from recorder import ResponseArchive, RecordingAdapter, ReplayAdapter
+from scraper import JumboScraper
+
+
+PAGE = '<html><body>Almacén ' + 'x' * 200 + '</body></html>'
+LARGE_PAGE = '<html><body>' + 'x' * 5000 + '</body></html>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Servidor local: /almacen responde HTML, /viejo redirige a /almacen"""
+
+    def do_GET(self):
+        if self.path == '/viejo':
+            self.send_response(301)
+            self.send_header('Location', '/almacen')
+            self.end_headers()
+            return
+        body = (LARGE_PAGE if self.path == '/grande' else PAGE).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Levanta un servidor HTTP local y devuelve su URL base"""
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def _scraper_with_adapter(adapter):
+    """Crea un JumboScraper con el adapter de grabación indicado"""
+    scraper = JumboScraper()
+    scraper.session.mount('http://', adapter)
+    return scraper
+
+
+class TestRecordReplay:
+    """Tests de grabación y reproducción de respuestas"""
+
+    def test_archive_roundtrip(self, tmp_path):
+        """Test que el archivo guarda y recupera status, headers y cuerpo"""
+        archive = ResponseArchive(tmp_path)
+        archive.append('get', 'https://www.jumbo.com.ar/', 200,
+                       {'Content-Type': 'text/html', 'Content-Encoding': 'gzip'}, b'<html></html>')
+
+        record = ResponseArchive(tmp_path).lookup('GET', 'https://www.jumbo.com.ar/')
+
+        assert record['status'] == 200
+        assert record['headers'] == {'Content-Type': 'text/html'}
+        assert ResponseArchive(tmp_path).lookup('GET', 'https://www.jumbo.com.ar/otra') is None
+
+    def test_replay_without_network(self, tmp_path, local_server):
+        """Test que lo grabado se reproduce igual sin acceso a la red"""
+        recorder = _scraper_with_adapter(RecordingAdapter(ResponseArchive(tmp_path)))
+        recorded = recorder.get_page(f'{local_server}/viejo')
+        recorder.close()
+
+        assert recorded == PAGE
+
+        replayer = _scraper_with_adapter(ReplayAdapter(ResponseArchive(tmp_path)))
+        replayed = replayer.get_page(f'{local_server}/viejo')
+
+        assert replayed == PAGE
+        assert replayer.get_page(f'{local_server}/no-grabada', max_retries=0) is None
+        replayer.close()
+
+    def test_large_response_is_not_recorded(self, tmp_path, local_server):
+        """Test que al grabar se respeta max_body_bytes (ni se graba ni se acepta la respuesta)"""
+        archive = ResponseArchive(tmp_path)
+        recorder = _scraper_with_adapter(RecordingAdapter(archive, max_body_bytes=1000))
+        recorder.config = dict(recorder.config, max_body_bytes=1000)
+
+        assert recorder.get_page(f'{local_server}/grande', max_retries=0) is None
+        assert recorder.get_page(f'{local_server}/almacen') == PAGE
+        recorder.close()
+
+        assert ResponseArchive(tmp_path).lookup('GET', f'{local_server}/grande') is None
+        assert ResponseArchive(tmp_path).lookup('GET', f'{local_server}/almacen') is not None
+
+    def test_recording_disables_http_cache(self):
+        """Test que al grabar no se sirven respuestas desde la cache HTTP"""
+        with patch('scraper.is_recording', return_value=True), \
+                patch('scraper.get_http_cache', return_value=Mock()):
+            scraper = JumboScraper()
+
+        assert scraper.http_cache is None
+        assert scraper.redirect_map is None
+        scraper.close()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests para el mapa de redirecciones
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from unittest.mock import Mock, patch
+from redirects import RedirectMap, canonicalize_categories
+from scraper import JumboScraper
+
+
+CLUSTER_URL = 'https://www.jumbo.com.ar/39293?map=productClusterIds'
+FINAL_URL = 'https://www.jumbo.com.ar/ofertas-almacen'
+
+
+class TestRedirectMap:
+    """Tests para RedirectMap"""
+
+    def test_persists_between_runs(self, tmp_path):
+        """Test que las redirecciones se guardan y se leen en la ejecución siguiente"""
+        path = tmp_path / 'redirects.json'
+        redirect_map = RedirectMap(path)
+        redirect_map.record(CLUSTER_URL, FINAL_URL)
+        redirect_map.record(FINAL_URL, FINAL_URL)  # sin redirección: no se guarda
+        redirect_map.save()
+
+        reloaded = RedirectMap(path)
+        assert len(reloaded) == 1
+        assert reloaded.resolve(CLUSTER_URL) == FINAL_URL
+        assert reloaded.canonical(FINAL_URL) == FINAL_URL
+
+    def test_expired_entries_are_resolved_again(self, tmp_path):
+        """Test que pasado el TTL la redirección se descarta"""
+        redirect_map = RedirectMap(tmp_path / 'redirects.json', ttl_seconds=60)
+        redirect_map.record(CLUSTER_URL, FINAL_URL)
+
+        with patch('redirects.time.time', return_value=time.time() + 61):
+            assert redirect_map.resolve(CLUSTER_URL) is None
+        assert len(redirect_map) == 0
+
+    def test_canonicalize_categories(self, tmp_path):
+        """Test que los registros de categorías se reescriben con la URL canónica"""
+        redirect_map = RedirectMap(tmp_path / 'redirects.json')
+        redirect_map.record(CLUSTER_URL, FINAL_URL)
+        categories = [{'name': 'Ofertas', 'url': CLUSTER_URL},
+                      {'name': 'Almacén', 'url': 'https://www.jumbo.com.ar/almacen'}]
+
+        assert canonicalize_categories(categories, redirect_map) == 1
+        assert [c['url'] for c in categories] == [FINAL_URL, 'https://www.jumbo.com.ar/almacen']
+
+
+class TestScraperRedirects:
+    """Tests de JumboScraper con el mapa de redirecciones"""
+
+    def _response(self, url, history):
+        body = ('<html><body>' + 'Ofertas ' * 20 + '</body></html>').encode('utf-8')
+        response = Mock(status_code=200, url=url, history=history)
+        response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        response.iter_content.side_effect = lambda chunk_size: iter([body])
+        return response
+
+    @patch('requests.Session.get')
+    def test_known_redirect_skips_hops(self, mock_get, tmp_path):
+        """Test que la segunda descarga pide directo la URL final"""
+        scraper = JumboScraper()
+        scraper.rate_limiter = Mock()
+        scraper.http_cache = None
+        scraper.redirect_map = RedirectMap(tmp_path / 'redirects.json')
+
+        mock_get.return_value = self._response(FINAL_URL, [Mock(url=CLUSTER_URL)])
+        scraper.fetch(CLUSTER_URL, max_retries=0)
+        assert mock_get.call_args[0][0] == CLUSTER_URL
+
+        mock_get.return_value = self._response(FINAL_URL, [])
+        result = scraper.fetch(CLUSTER_URL, max_retries=0)
+
+        assert mock_get.call_args[0][0] == FINAL_URL
+        assert result.url == CLUSTER_URL
+        assert result.final_url == FINAL_URL
+
+    @patch('requests.Session.get')
+    def test_stale_redirect_is_forgotten(self, mock_get, tmp_path):
+        """Test que una URL final que dejó de responder se elimina del mapa"""
+        import requests
+
+        scraper = JumboScraper()
+        scraper.rate_limiter = Mock()
+        scraper.http_cache = None
+        scraper.redirect_map = RedirectMap(tmp_path / 'redirects.json')
+        scraper.redirect_map.record(CLUSTER_URL, FINAL_URL)
+
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+        mock_get.return_value = response
+
+        assert not scraper.fetch(CLUSTER_URL, max_retries=0).ok
+        assert scraper.redirect_map.resolve(CLUSTER_URL) is None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Rules
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+import pytest
+from rules import KeywordMatcher, CategoryRules, DEFAULT_RULES, get_rules
+
+
+class TestKeywordMatcher:
+    """Tests para la clase KeywordMatcher"""
+
+    def test_equivalent_to_any_substring(self):
+        """Test que equivale a any(term in text.lower() ...)"""
+        terms = ['login', 'carrito', 'ver', 'ver todo', 'atención']
+        matcher = KeywordMatcher(terms)
+
+        for text in ['/login', '/Carrito/x', 'VER TODO', 'Atención al cliente',
+                     'Almacén', 'Bebidas', '', 'vermut']:
+            assert matcher.matches(text) == any(term in text.lower() for term in terms)
+
+    def test_search_returns_term(self):
+        """Test que search devuelve el término encontrado (el más largo en la misma posición)"""
+        matcher = KeywordMatcher(['ver', 'ver todo'])
+
+        assert matcher.search('Ver todo lo nuevo') == 'ver todo'
+        assert matcher.search('Almacén') is None
+
+    def test_special_characters_are_literal(self):
+        """Test que los términos se tratan como texto literal, no como regex"""
+        matcher = KeywordMatcher(['a.b', '(x)'])
+
+        assert matcher.matches('A.B')
+        assert not matcher.matches('axb')
+        assert matcher.matches('valor (x)')
+
+    def test_empty_matcher(self):
+        """Test que un matcher sin términos no coincide con nada"""
+        assert not KeywordMatcher([]).matches('cualquier cosa')
+
+
+class TestCategoryRules:
+    """Tests para la clase CategoryRules"""
+
+    def test_config_overrides_defaults(self):
+        """Test que category_rules en la configuración reemplaza la regla indicada"""
+        rules = CategoryRules.from_config({'category_rules': {'category_exclude': ['bazar']}})
+
+        assert rules.category_exclude.matches('Bazar')
+        assert not rules.category_exclude.matches('Ofertas')
+        assert rules.href_exclude.matches('/login')
+
+    def test_unknown_rule(self):
+        """Test que una regla inexistente lanza AttributeError"""
+        with pytest.raises(AttributeError):
+            CategoryRules(DEFAULT_RULES).regla_inexistente
+
+    def test_global_rules_from_config(self):
+        """Test que las reglas globales se cargan desde config.yaml"""
+        rules = get_rules()
+
+        assert rules is get_rules()
+        assert rules.category_exclude.matches('Viví Saludable')
+
+    def test_shipped_config_does_not_copy_defaults(self):
+        """Test que config.yaml solo trae reglas que difieren de DEFAULT_RULES (una sola fuente)"""
+        from config import get_config
+
+        overrides = get_config().get('category_rules') or {}
+
+        assert set(overrides) <= set(DEFAULT_RULES)
+        assert all(terms != DEFAULT_RULES[name] for name, terms in overrides.items())
@@ -17,6 +17,21 @@ from unittest.mock import Mock, patch
 from scraper import JumboScraper
 
 
+def _mock_response(text, status_code=200, content_type='text/html; charset=utf-8'):
+    """Crea una respuesta simulada que entrega el cuerpo en streaming"""
+    body = text.encode('utf-8')
+    mock_response = Mock()
+    mock_response.text = text
+    mock_response.status_code = status_code
+    mock_response.headers = {'Content-Type': content_type}
+    mock_response.url = None
+    mock_response.history = []
+    mock_response.iter_content.side_effect = lambda chunk_size: iter(
+        [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    )
+    return mock_response
+
+
 class TestJumboScraper:
     """Tests para la clase JumboScraper"""
 
@@ -41,9 +56,7 @@ class TestJumboScraper:
     def test_successful_page_request(self, mock_get):
         """Test de request exitoso"""
         # Configurar el mock con contenido de longitud adecuada
-        mock_response = Mock()
-        mock_response.text = '<html><body>' + 'Test content ' * 20 + '</body></html>'  # > 100 chars
-        mock_response.status_code = 200
+        mock_response = _mock_response('<html><body>' + 'Test content ' * 20 + '</body></html>')  # > 100 chars
         mock_get.return_value = mock_response
 
         scraper = JumboScraper()
@@ -93,9 +106,7 @@ class TestJumboScraper:
         mock_response_fail = Mock()
         mock_response_fail.raise_for_status.side_effect = requests.exceptions.ConnectionError()
 
-        mock_response_success = Mock()
-        mock_response_success.text = 'Success content ' * 20  # > 100 chars
-        mock_response_success.status_code = 200
+        mock_response_success = _mock_response('Success content ' * 20)  # > 100 chars
 
         mock_get.side_effect = [mock_response_fail, mock_response_success]
 
@@ -109,9 +120,7 @@ class TestJumboScraper:
     def test_content_validation(self, mock_get):
         """Test de validación de contenido"""
         # Contenido demasiado pequeño
-        mock_response = Mock()
-        mock_response.text = 'Short'
-        mock_response.status_code = 200
+        mock_response = _mock_response('Short')
         mock_get.return_value = mock_response
 
         scraper = JumboScraper()
@@ -132,3 +141,184 @@ class TestJumboScraper:
         except Exception:
             # Si falla, es aceptable en entornos sin conexión
             pytest.skip("No hay conexión a internet disponible")
+
+    def test_host_slot_shared_per_host(self):
+        """Test que las requests al mismo host comparten el límite de concurrencia"""
+        scraper = JumboScraper()
+
+        slot_a = scraper._get_host_slot('https://www.jumbo.com.ar/electro')
+        slot_b = scraper._get_host_slot('https://www.jumbo.com.ar/almacen')
+        slot_other = scraper._get_host_slot('https://httpbin.org/html')
+
+        assert slot_a is slot_b
+        assert slot_a is not slot_other
+        scraper.close()
+
+    @patch('requests.Session.get')
+    def test_streamed_request_decodes_declared_charset(self, mock_get):
+        """Test que el cuerpo se pide en streaming y se decodifica con el charset declarado"""
+        text = '<html><body>' + 'Almacén ' * 20 + '</body></html>'
+        mock_response = _mock_response('')
+        mock_response.headers = {'Content-Type': 'text/html; charset=ISO-8859-1'}
+        mock_response.iter_content.side_effect = lambda chunk_size: iter([text.encode('latin-1')])
+        mock_get.return_value = mock_response
+
+        scraper = JumboScraper()
+        result = scraper.get_page('https://www.jumbo.com.ar')
+
+        assert result == text
+        assert mock_get.call_args.kwargs['stream'] is True
+        assert scraper.get_page('https://www.jumbo.com.ar', as_bytes=True) == text.encode('latin-1')
+
+    @patch('requests.Session.get')
+    def test_body_size_limit(self, mock_get):
+        """Test que una respuesta mayor a max_body_bytes se descarta sin reintentos"""
+        mock_get.return_value = _mock_response('x' * 5000)
+
+        scraper = JumboScraper()
+        scraper.config = dict(scraper.config, max_body_bytes=1000)
+        result = scraper.get_page('https://www.jumbo.com.ar', max_retries=2)
+
+        assert result is None
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.head')
+    def test_head_uses_shared_session(self, mock_head):
+        """Test que HEAD usa la sesión, el timeout configurado y el rate limiter"""
+        mock_head.return_value = Mock(status_code=200)
+
+        scraper = JumboScraper()
+        scraper.rate_limiter = Mock()
+        response = scraper.head('https://www.jumbo.com.ar/almacen')
+
+        assert response.status_code == 200
+        mock_head.assert_called_once_with('https://www.jumbo.com.ar/almacen',
+                                          timeout=scraper.config['timeout'], allow_redirects=True)
+        scraper.rate_limiter.acquire.assert_called_once_with('https://www.jumbo.com.ar/almacen')
+
+    @patch('requests.Session.head')
+    def test_head_returns_error_status_without_retry(self, mock_head):
+        """Test que un status de error se devuelve sin reintentar"""
+        mock_head.return_value = Mock(status_code=404)
+
+        scraper = JumboScraper()
+        assert scraper.head('https://www.jumbo.com.ar/no-existe', max_retries=2).status_code == 404
+        mock_head.assert_called_once()
+
+    @patch('requests.Session.head')
+    def test_head_connection_error(self, mock_head):
+        """Test que sin respuesta devuelve None"""
+        mock_head.side_effect = requests.exceptions.ConnectionError()
+
+        scraper = JumboScraper()
+        assert scraper.head('https://www.jumbo.com.ar/almacen', max_retries=0) is None
+
+    @patch('requests.Session.get')
+    def test_fetch_records_redirect_chain(self, mock_get):
+        """Test que la descarga registra URL final, status y redirecciones"""
+        mock_response = _mock_response('<html><body>' + 'Almacén ' * 20 + '</body></html>')
+        mock_response.url = 'https://www.jumbo.com.ar/almacen'
+        mock_response.history = [Mock(url='https://www.jumbo.com.ar/Almacen'),
+                                 Mock(url='https://www.jumbo.com.ar/almacen/')]
+        mock_get.return_value = mock_response
+
+        scraper = JumboScraper()
+        result = scraper.fetch('https://www.jumbo.com.ar/Almacen', max_retries=0)
+
+        assert result.ok
+        assert result.validation() == {
+            'final_url': 'https://www.jumbo.com.ar/almacen',
+            'status': 200,
+            'redirect_chain': ['https://www.jumbo.com.ar/Almacen', 'https://www.jumbo.com.ar/almacen/'],
+        }
+
+    @patch('requests.Session.get')
+    def test_fetch_failure_keeps_status(self, mock_get):
+        """Test que una descarga fallida conserva el status HTTP"""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+        mock_get.return_value = mock_response
+
+        scraper = JumboScraper()
+        result = scraper.fetch('https://www.jumbo.com.ar/no-existe', max_retries=0)
+
+        assert not result.ok
+        assert result.validation()['final_url'] is None
+        assert result.status_code == 404
+
+    @patch('requests.Session.get')
+    def test_get_json_accepts_short_replies(self, mock_get):
+        """Test que un JSON corto es válido y se pide como application/json"""
+        mock_get.return_value = _mock_response('[]', content_type='application/json; charset=utf-8')
+
+        scraper = JumboScraper()
+        scraper.http_cache = None
+        assert scraper.get_json('https://www.jumbo.com.ar/api/facets', max_retries=2) == []
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs['headers'] == {'Accept': 'application/json'}
+
+
+class TestSharedSession:
+    """Tests para la sesión HTTP compartida"""
+
+    def test_shared_scraper_is_singleton(self):
+        """Test que todas las etapas reciben el mismo scraper"""
+        import scraper as scraper_module
+
+        try:
+            first = scraper_module.get_shared_scraper()
+            assert scraper_module.get_shared_scraper() is first
+        finally:
+            scraper_module.close_shared_scraper()
+        assert scraper_module.SHARED_SCRAPER is None
+
+    def test_connection_reuse_is_counted(self):
+        """Test que las requests sucesivas reutilizan la conexión keep-alive"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = ('<html><body>' + 'Almacén ' * 20 + '</body></html>').encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            scraper = JumboScraper()
+            scraper.rate_limiter = Mock()
+            scraper.http_cache = None
+            scraper.redirect_map = None
+            base_url = f'http://127.0.0.1:{server.server_port}'
+            for path in ('/almacen', '/bebidas', '/limpieza'):
+                assert scraper.get_page(base_url + path, max_retries=0)
+
+            assert scraper.connection_stats() == {'requests': 3, 'connections': 1, 'reused': 2}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_segment_cookies_persist_between_runs(self, tmp_path):
+        """Test que solo las cookies de segmento de VTEX se conservan entre ejecuciones"""
+        scraper = JumboScraper()
+        scraper.cookie_file = tmp_path / 'cookies.json'
+        scraper.session.cookies.set('vtex_segment', 'abc123', domain='www.jumbo.com.ar')
+        scraper.session.cookies.set('_ga', 'tracking', domain='www.jumbo.com.ar')
+        assert scraper.save_cookies() == 1
+
+        next_run = JumboScraper()
+        next_run.cookie_file = tmp_path / 'cookies.json'
+        next_run.session.cookies.clear()
+        assert next_run.load_cookies() == 1
+        assert next_run.session.cookies.get('vtex_segment') == 'abc123'
+        assert next_run.session.cookies.get('_ga') is None
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo Streaming (etapas encadenadas como generadores)
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from streaming import imap_bounded, tee_to_json
+
+
+class TestImapBounded:
+    """Tests para el map concurrente con entrada acotada"""
+
+    def test_preserves_order(self):
+        """Test que los resultados salen en el orden de la entrada"""
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n % 5))
+            return n * n
+
+        assert list(imap_bounded(slow_square, range(20), workers=4)) == [n * n for n in range(20)]
+
+    def test_consumes_input_lazily(self):
+        """Test que no lee toda la entrada antes de producir el primer resultado"""
+        produced = []
+
+        def source():
+            for n in range(1000):
+                produced.append(n)
+                yield n
+
+        results = imap_bounded(lambda n: n, source(), workers=2, max_pending=4)
+        assert next(results) == 0
+        assert len(produced) <= 5
+
+    def test_runs_in_parallel(self):
+        """Test que se usan varios workers a la vez"""
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def work(n):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return n
+
+        list(imap_bounded(work, range(12), workers=3))
+        assert peak[0] == 3
+
+    def test_single_worker_is_sequential(self):
+        """Test que con un worker no se usan threads"""
+        threads = set()
+        list(imap_bounded(lambda n: threads.add(threading.get_ident()), range(5), workers=1))
+        assert threads == {threading.get_ident()}
+
+
+class TestTeeToJson:
+    """Tests para las salidas intermedias opcionales"""
+
+    def test_passes_items_and_writes_file(self, tmp_path):
+        """Test que los elementos fluyen sin cambios y el archivo se escribe al final"""
+        path = tmp_path / 'stage.json'
+        items = [{'name': 'Almacén'}, {'name': 'Bebidas'}]
+
+        stream = tee_to_json(iter(items), path)
+        assert next(stream) == items[0]
+        assert not path.exists()
+
+        assert list(stream) == items[1:]
+        assert json.loads(path.read_text(encoding='utf-8')) == items
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests para el módulo VTEX API
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar el directorio src al path
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+sys.path.insert(0, str(src_path))
+
+from unittest.mock import Mock, patch
+import extractor
+from vtex_api import (build_facets_url, parse_facets_payload, category_tree_to_records,
+                      discover_categories)
+
+
+FACETS_PAYLOAD = {
+    'Departments': [{'Name': 'Electro'}],
+    'Brands': [{'Name': 'Samsung'}, {'Name': 'LG'}],
+    'SpecificationFilters': {
+        'Capacidad de Lavado': [{'Name': '8 kg'}],
+        'Color': [{'Name': 'Blanco'}],
+        'Rango de Precio': [{'Name': '$0 - $100'}],
+        'Vacío': [],
+    },
+    'PriceRanges': [],
+}
+
+
+class TestFacetsUrl:
+    """Tests para build_facets_url"""
+
+    def test_category_path(self):
+        """Test que cada segmento del path se mapea como categoría"""
+        assert build_facets_url('https://www.jumbo.com.ar/electro/lavarropas/', 'https://www.jumbo.com.ar') == (
+            'https://www.jumbo.com.ar/api/catalog_system/pub/facets/search/electro/lavarropas?map=c,c'
+        )
+
+    def test_explicit_map(self):
+        """Test que se respeta el map de URLs de colecciones"""
+        assert build_facets_url('https://www.jumbo.com.ar/39293?map=productClusterIds', 'https://www.jumbo.com.ar') == (
+            'https://www.jumbo.com.ar/api/catalog_system/pub/facets/search/39293?map=productClusterIds'
+        )
+
+
+class TestParseFacets:
+    """Tests para parse_facets_payload"""
+
+    def test_payload_to_filters(self):
+        """Test que marcas y especificaciones se convierten en filtros"""
+        assert parse_facets_payload(FACETS_PAYLOAD) == [
+            'Categoría', 'Sub-Categoría', 'Tipo de Producto',
+            'Capacidad de Lavado', 'Color', 'Marca'
+        ]
+
+    def test_payload_without_facets(self):
+        """Test que un JSON sin facets devuelve None"""
+        assert parse_facets_payload({'error': 'not found'}) is None
+        assert parse_facets_payload(None) is None
+
+
+class TestFilterSource:
+    """Tests para la selección de estrategia en extract_filters_from_category"""
+
+    def test_api_strategy(self):
+        """Test que con filter_source=vtex_api no se descarga la página HTML"""
+        scraper = Mock()
+        scraper.get_json.return_value = FACETS_PAYLOAD
+
+        with patch.object(extractor, 'get_config', return_value={'filter_source': 'vtex_api', 'site_url': 'https://www.jumbo.com.ar'}), \
+                patch('vtex_api.get_config', return_value={'site_url': 'https://www.jumbo.com.ar'}):
+            filters = extractor.extract_filters_from_category(scraper, 'https://www.jumbo.com.ar/electro')
+
+        assert 'Marca' in filters
+        scraper.get_page.assert_not_called()
+
+    def test_api_failure_falls_back_to_html(self):
+        """Test que si la API falla se usa la estrategia HTML"""
+        scraper = Mock()
+        scraper.get_json.return_value = None
+        scraper.get_page.return_value = '<html><body><div class="filter-item">Color</div></body></html>'
+
+        with patch.object(extractor, 'get_config', return_value={'filter_source': 'vtex_api'}), \
+                patch('vtex_api.get_config', return_value={'site_url': 'https://www.jumbo.com.ar'}):
+            filters = extractor.extract_filters_from_category(scraper, 'https://www.jumbo.com.ar/electro')
+
+        assert 'Color' in filters
+        scraper.get_page.assert_called_once_with('https://www.jumbo.com.ar/electro')
+
+
+CATEGORY_TREE = [
+    {
+        'id': 1, 'name': 'Electro', 'url': 'https://jumboargentina.vtexcommercestable.com.br/electro',
+        'children': [
+            {'id': 10, 'name': 'Lavarropas', 'url': 'https://jumboargentina.vtexcommercestable.com.br/electro/lavarropas',
+             'children': [
+                 {'id': 100, 'name': 'Carga Frontal', 'url': '/electro/lavarropas/carga-frontal', 'children': []},
+             ]},
+            {'id': 11, 'name': 'TV & Video', 'url': 'https://www.jumbo.com.ar/electro/tv-y-video/', 'children': []},
+        ]
+    },
+    {'id': 2, 'name': 'Bebés y Niños', 'url': 'https://www.jumbo.com.ar/bebes-y-ninos', 'children': []},
+]
+
+
+class TestCategoryTree:
+    """Tests para el descubrimiento de categorías vía árbol de VTEX"""
+
+    def test_tree_to_records(self):
+        """Test que el árbol se aplana en orden departamento → categoría → subcategoría"""
+        records = category_tree_to_records(CATEGORY_TREE, 'https://www.jumbo.com.ar')
+
+        assert records == [
+            {'name': 'Electro', 'url': 'https://www.jumbo.com.ar/electro', 'text_original': 'Electro'},
+            {'name': 'Lavarropas', 'url': 'https://www.jumbo.com.ar/electro/lavarropas', 'text_original': 'Lavarropas'},
+            {'name': 'Carga Frontal', 'url': 'https://www.jumbo.com.ar/electro/lavarropas/carga-frontal',
+             'text_original': 'Carga Frontal'},
+            {'name': 'TV  Video', 'url': 'https://www.jumbo.com.ar/electro/tv-y-video', 'text_original': 'TV & Video'},
+            {'name': 'Bebés y Niños', 'url': 'https://www.jumbo.com.ar/bebes-y-ninos', 'text_original': 'Bebés y Niños'},
+        ]
+
+    def test_discover_categories_single_request(self):
+        """Test que el descubrimiento hace una única request al árbol"""
+        scraper = Mock()
+        scraper.get_json.return_value = CATEGORY_TREE
+
+        records = discover_categories(scraper)
+
+        assert len(records) == 5
+        scraper.get_json.assert_called_once()
+        assert scraper.get_json.call_args.args[0].endswith('/api/catalog_system/pub/category/tree/3')
+
+    def test_discover_categories_failure(self):
+        """Test que si la API falla se devuelve una lista vacía"""
+        scraper = Mock()
+        scraper.get_json.return_value = None
+
+        assert discover_categories(scraper) == []